@@ -116,6 +116,10 @@ struct TelemetryFrame {
 #pragma pack(pop)
 const size_t TELEMETRY_FRAME_SIZE = sizeof(TelemetryFrame);
 
+// 1 = reenviar el frame binario tal cual por USB (el Python lo decodifica con struct)
+// 0 = imprimir "Position: (...)" y "Panel:" en texto (formato antiguo)
+#define FORWARD_RAW_FRAMES 0
+
 // Convertir bytes a int32 (little-endian)
 int32_t bytesToInt32(uint8_t b0, uint8_t b1, uint8_t b2, uint8_t b3) {
   int32_t val = 0;
@@ -201,6 +205,9 @@ bool readBinaryTelemetry() {
 
   Serial.println(" -> OK!");
 
+#if FORWARD_RAW_FRAMES
+  Serial.write(raw, TELEMETRY_FRAME_SIZE);
+#else
   // Extraer coordenadas
   int32_t x = bytesToInt32(frame.x_b0, frame.x_b1, frame.x_b2, frame.x_b3);
   int32_t y = bytesToInt32(frame.y_b0, frame.y_b1, frame.y_b2, frame.y_b3);
@@ -218,6 +225,7 @@ bool readBinaryTelemetry() {
   // Mostrar panel y otros campos como ASCII (para compatibilidad con el parser Python)
   Serial.print("Panel:");
   Serial.println(frame.panelState);
+#endif
 
   // --- MODIFICADO --- actualizar timestamp de última recepción válida
   lastReceived = millis();
@@ -13,11 +13,13 @@ Arreglos incluidos:
 """
 
 import os
+import sys
 import time
 import datetime
 import serial
 import threading
 import re
+import argparse
 from collections import deque
 from tkinter import *
 from tkinter import font, messagebox
@@ -28,6 +30,35 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from PIL import Image, ImageTk
 
+# Módulos compartidos de la estación de tierra (src/ground_station)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.ground_station.multi_port import MultiPortIngest
+from src.ground_station.dispatch import MessageDispatcher
+from src.ground_station.async_core import AsyncGroundStation, TkBridge
+from src.ground_station.sample_queue import SampleQueue, KEEP_ALL, KEEP_LATEST, DECIMATE
+from src.ground_station.snapshot import SnapshotSeries
+from src.ground_station.ring_buffer import RingBuffer
+from src.ground_station.telemetry_store import TelemetryStore
+from src.ground_station.rolling_stats import RollingStatsEngine
+from src.ground_station.lod_pyramid import MinMaxPyramid
+from src.ground_station.recorder import Recorder
+from src.ground_station.replay import ReplaySource
+from src.ground_station.capture import CaptureWriter, CaptureReader
+from src.ground_station.blit import BlitManager
+from src.ground_station.scheduler import RenderScheduler
+from src.ground_station.bounds import SlidingBounds, AxisLimits, combined
+
+# Reproducir una sesión grabada en lugar de abrir los puertos:
+#   python 12:23_GSPY.py --replay grabaciones/<sesion> [--speed 4] [--seek 120]
+#   python 12:23_GSPY.py --replay grabaciones/captura_<fecha>.gscap   (bytes exactos, un enlace por puerto capturado)
+# --speed 0 = lo más rápido posible (benchmark de todo el camino de ingesta y GUI)
+arg_parser = argparse.ArgumentParser(description="Ground Station GUI")
+arg_parser.add_argument("--replay", help="directorio de una sesión grabada o captura .gscap")
+arg_parser.add_argument("--speed", type=float, default=1.0, help="1 = tiempo real, N = N veces, 0 = máximo")
+arg_parser.add_argument("--seek", type=float, default=0.0, help="segundos desde el inicio de la grabación")
+arg_parser.add_argument("--no-record", action="store_true", help="no grabar la sesión en grabaciones/")
+cli_args, _ = arg_parser.parse_known_args()
+
 # ----------------------------
 # Configuración general / UI
 # ----------------------------
@@ -78,35 +109,146 @@ if device is None:
     device = f'COM{comm_port}' if os.name == 'nt' else f'/dev/ttyUSB{comm_port}'
     print(f"⚙️ Usando puerto manual por defecto: {device}")
 
-try:
-    usbSerial = serial.Serial(device, 9600, timeout=1)
-    print(f"✓ Se ha abierto el puerto {device}")
-except Exception as e:
-    usbSerial = None
-    print(f"✗ No se ha podido abrir el puerto serie {device}: {e}")
-    print("   Modo simulación/solo GUI activo (no hay puerto).")
+# Velocidad del enlace USB con la GS (subir a 115200 si el sketch GS también lo hace)
+baudrate = 9600
+# True: lectura, envío de comandos y registro de eventos en un único event loop asyncio
+# (sin hilo lector ni hilo del modo manual); False: hilos como siempre
+use_async_core = False
+# Otras GS (otras bandas/antenas) atendidas por este mismo proceso, p.ej. ['COM14'] o ['/dev/ttyUSB1']
+extra_devices = []
+
+replay_sources = []   # (nombre, ReplaySource): cada puerto capturado va por su propio enlace y demux
+if cli_args.replay:
+    if cli_args.replay.endswith(".gscap"):
+        replay_sources = [(f"replay:{name}", ReplaySource.from_capture(cli_args.replay, link=name, speed=cli_args.speed))
+                          for name in CaptureReader(cli_args.replay).link_names()]
+    else:
+        replay_sources = [("replay", ReplaySource.from_recording(cli_args.replay, speed=cli_args.speed))]
+    # Todas las fuentes arrancan desde el mismo instante para que los enlaces sigan sincronizados
+    if replay_sources:
+        t_replay = min(src.start_time for _, src in replay_sources) + cli_args.seek
+        for _, src in replay_sources:
+            src.seek(t_replay)
+    extra_devices = []
+    print(f"▶ Reproduciendo {cli_args.replay} a {cli_args.speed or 'máxima'} velocidad (sin puerto real)")
+else:
+    try:
+        usbSerial = serial.Serial(device, baudrate, timeout=1)
+        print(f"✓ Se ha abierto el puerto {device}")
+    except Exception as e:
+        usbSerial = None
+        print(f"✗ No se ha podido abrir el puerto serie {device}: {e}")
+        print("   Modo simulación/solo GUI activo (no hay puerto).")
+
+# Todos los enlaces abiertos: (nombre, puerto). Los comandos salen por usbSerial (GS principal)
+serial_links = []
+if usbSerial is not None:
+    serial_links.append((device, usbSerial))
+serial_links.extend(replay_sources)
+for extra in extra_devices:
+    try:
+        serial_links.append((extra, serial.Serial(extra, baudrate, timeout=1)))
+        print(f"✓ Se ha abierto el puerto adicional {extra}")
+    except Exception as e:
+        print(f"✗ No se ha podido abrir el puerto adicional {extra}: {e}")
+# Puente con el núcleo asyncio (solo si use_async_core)
+async_bridge = None
+# Mensajes de depuración de la GS ("GS listo", "RX: H=...", " -> OK!"): se guardan aparte
+gs_debug_lines = deque(maxlen=200)
 
 # ----------------------------
 # Buffers y variables globales
 # ----------------------------
-max_points = 100
-temps = deque([0]*max_points, maxlen=max_points)
-hums  = deque([0]*max_points, maxlen=max_points)
-temps_med = deque([0]*max_points, maxlen=max_points)
-latest_data = {"temp": 0.0, "hum": 0.0}
-angulo = 90                # ángulo radar (grados)
-latest_temp_med = 0.0
-latest_distance = 0
-thetas = []
-radios = []
-
-orbit_x = []
-orbit_y = []
-orbit_z = []
-orbit_lock = threading.Lock()
-ground_track_lat = []
-ground_track_lon = []
-ground_track_lock = threading.Lock()
+# Longitud de cada historial (memoria fija por mucho que dure la sesión)
+temp_window = 60.0         # segundos visibles en la gráfica de temperatura/humedad (selector en la GUI)
+temp_max_vertices = 1000   # vértices como mucho por línea, sea cual sea la ventana
+radar_trail = 20           # puntos del rastro del radar
+orbit_history = 5000       # puntos de órbita que se dibujan
+ground_track_history = 600
+telemetry_history = 20000  # muestras por canal en el almacén de telemetría
+render_budget = 0.5        # fracción de CPU como mucho para pintar gráficas (el resto, para la entrada)
+render_max_interval = 2.0  # s; por lenta que sea la máquina, ningún panel se refresca menos que esto
+
+# Toda la telemetría recibida: valores + instante de captura por canal.
+# Se escribe solo desde el hilo de Tk (drain_samples)
+telemetry = TelemetryStore(capacity=telemetry_history)
+for _canal in ("temp", "hum", "temp_med", "distance", "angle", "panel", "x", "y", "z"):
+    telemetry.add_channel(_canal)
+thetas = RingBuffer(radar_trail)
+radios = RingBuffer(radar_trail)
+
+# Estadísticas móviles calculadas en la GS (canales derivados "canal.stat_ventana").
+# La media de temperatura del satélite (ID 7) sigue llegando aparte como temp_med
+rolling_stats = RollingStatsEngine(telemetry)
+rolling_stats.add("temp", duration=60, stats=("mean", "min", "max", "std"))
+rolling_stats.add("hum", duration=60, stats=("mean",))
+rolling_stats.add("distance", window=10, stats=("mean", "min", "ewma"))
+gs_temp_alarm = 100.0      # alarma si temp.mean_60s la supera
+gs_temp_alarm_on = False
+
+def check_stats_alarm(canal, valor, t):
+    global gs_temp_alarm_on
+    if canal != "temp.mean_60s":
+        return
+    if valor > gs_temp_alarm and not gs_temp_alarm_on:
+        gs_temp_alarm_on = True
+        registrar_evento("alarma", f"Temp media GS (60 s) {valor:.1f}°C > {gs_temp_alarm:.0f}°C")
+    elif valor < gs_temp_alarm - 2:
+        gs_temp_alarm_on = False
+
+telemetry.subscribe(check_stats_alarm)
+
+# Pirámides min/max de las líneas de temperatura/humedad: permiten ver desde el
+# último minuto hasta 24 h sin pintar más de temp_max_vertices puntos
+temp_pyramids = {canal: MinMaxPyramid(levels=7, factor=4, capacity=4096)
+                 for canal in ("temp", "hum", "temp_med", "temp.mean_60s")}
+
+# Mín/máx de lo que se ve en cada línea, al día con cada muestra (eje Y en O(1)).
+# Sin capacidad: solo salen por tiempo (retire_before del borde izquierdo); por
+# número de muestras se perderían extremos aún visibles en las ventanas de 1 h/24 h
+temp_bounds = {canal: SlidingBounds() for canal in temp_pyramids}
+
+def feed_pyramids(canal, valor, t):
+    pyr = temp_pyramids.get(canal)
+    if pyr is not None:
+        pyr.append(valor, t)
+        temp_bounds[canal].append(valor, t)
+
+telemetry.subscribe(feed_pyramids)
+
+# Cola lector -> GUI: KEEP_ALL pinta todas las muestras; con enlaces muy rápidos
+# usar DECIMATE (1 de cada N por encima de media cola) o KEEP_LATEST
+sample_policy = KEEP_ALL
+sample_queue = SampleQueue(capacity=4096, policy=sample_policy)
+
+# Grabación binaria de todas las muestras decodificadas (antes de la cola, así
+# no le afectan los descartes). Se lee con RecordingReader (np.memmap)
+# Solo se graba con algún puerto real abierto: sin enlace (modo solo GUI) o en
+# una reproducción no se crea ninguna sesión. --no-record lo desactiva siempre
+record_session = not cli_args.no_record
+recordings_dir = "grabaciones"
+real_links = not replay_sources and bool(serial_links)
+recorder = Recorder(recordings_dir).start() if record_session and real_links else None
+
+# Captura en bruto de los bytes RX/TX de cada enlace (por debajo del decodificador).
+# Para reproducir un fallo con los bytes exactos o medir el decodificador
+capture_raw = False
+capture = None
+if capture_raw and real_links:
+    os.makedirs(recordings_dir, exist_ok=True)
+    capture = CaptureWriter(os.path.join(recordings_dir, time.strftime("captura_%Y%m%d_%H%M%S.gscap"))).start()
+
+def publish_sample(channel, value, t=None):
+    """Salida de los handlers (hilo lector): grabador + cola hacia la GUI"""
+    if t is None:
+        t = time.monotonic()
+    if recorder is not None:
+        recorder.record(channel, value, t)
+    sample_queue.put(channel, value, t)
+
+# Órbita y ground track: el lector publica instantáneas inmutables, la GUI las lee sin locks
+orbit_series = SnapshotSeries(("x", "y", "z"), max_len=orbit_history)
+ground_track_series = SnapshotSeries(("lat", "lon"), max_len=ground_track_history)
 
 # Regex
 regex_orbit = re.compile(r"Position: \(X: ([\d\.-]+) m, Y: ([\d\.-]+) m, Z: ([\d\.-]+) m\)")
@@ -118,7 +260,6 @@ panel_state = 0
 panel_lock = threading.Lock()
 plot_active = True
 total_corrupted = 0
-latest_temp_med = 0.0
 
 # Eventos
 EVENTOS_FILE = "eventos.txt"
@@ -127,6 +268,9 @@ EVENTOS_FILE = "eventos.txt"
 # Funciones utilitarias
 # ----------------------------
 def registrar_evento(tipo, detalles=""):
+    if async_bridge is not None:
+        async_bridge.log_event(tipo, detalles)  # se vuelca a disco desde el loop
+        return
     ahora = datetime.datetime.now()
     fecha_hora = ahora.strftime("%Y-%m-%d %H:%M:%S")
     linea = f"{fecha_hora}|{tipo}|{detalles}\n"
@@ -148,62 +292,81 @@ def xyz_to_latlon(x, y, z):
 # Protocolo: funciones para cada id
 # ----------------------------
 def prot_orbit(match_orbit):
-    global orbit_x, orbit_y, orbit_z
     try:
         x = float(match_orbit.group(1))
         y = float(match_orbit.group(2))
         z = float(match_orbit.group(3))
-        with orbit_lock:
-            orbit_x.append(x)
-            orbit_y.append(y)
-            orbit_z.append(z)
-        lat, lon = xyz_to_latlon(x, y, z)
-        with ground_track_lock:
-            ground_track_lat.append(lat)
-            ground_track_lon.append(lon)
-            if len(ground_track_lat) > 600:
-                ground_track_lat.pop(0)
-                ground_track_lon.pop(0)
-        print(f"Orbital: X={x:.0f}, Y={y:.0f}, Z={z:.0f} | Lat={lat:.2f}°, Lon={lon:.2f}°")
     except ValueError:
-        pass
-    time.sleep(0.001)
+        return
+    add_orbit_point(x, y, z)
+
+def add_orbit_point(x, y, z):
+    orbit_series.append(x, y, z)
+    t = time.monotonic()
+    publish_sample("x", x, t)
+    publish_sample("y", y, t)
+    publish_sample("z", z, t)
+    lat, lon = xyz_to_latlon(x, y, z)
+    ground_track_series.append(lat, lon)
+    print(f"Orbital: X={x:.0f}, Y={y:.0f}, Z={z:.0f} | Lat={lat:.2f}°, Lon={lon:.2f}°")
+
+def prot_orbit_line(linea):
+    match_orbit = regex_orbit.match(linea)
+    if match_orbit:
+        prot_orbit(match_orbit)
 
 def prot_solar(match_panel):
-    global panel_state
     try:
         new_state = int(match_panel.group(1))
-        with panel_lock:
-            old_state = panel_state
-            panel_state = new_state
-        if new_state != old_state:
-            estado_texto = {0: "RETRAÍDO (0%)", 40: "DESPLEGADO 40%", 60: "DESPLEGADO 60%", 100: "TOTALMENTE DESPLEGADO (100%)"}
-            msg = f"Panel solar: {estado_texto.get(new_state, f'{new_state}%')}"
-            print(f"🛰️ {msg}")
-            # Ejecución en hilo principal de Tkinter para el messagebox
-            window.after(0, lambda: messagebox.showinfo("Estado Panel Solar", msg))
-            registrar_evento("alarma", msg)
     except ValueError:
-        pass
-    time.sleep(0.001)
+        return
+    set_panel_state(new_state)
+
+def set_panel_state(new_state):
+    global panel_state
+    with panel_lock:
+        old_state = panel_state
+        panel_state = new_state
+    publish_sample("panel", new_state)
+    if new_state != old_state:
+        estado_texto = {0: "RETRAÍDO (0%)", 40: "DESPLEGADO 40%", 60: "DESPLEGADO 60%", 100: "TOTALMENTE DESPLEGADO (100%)"}
+        msg = f"Panel solar: {estado_texto.get(new_state, f'{new_state}%')}"
+        print(f"🛰️ {msg}")
+        # Ejecución en hilo principal de Tkinter para el messagebox
+        window.after(0, lambda: messagebox.showinfo("Estado Panel Solar", msg))
+        registrar_evento("alarma", msg)
+
+def prot_frame(frame):
+    """Frame binario 0xAA ya validado: mismo efecto que prot1 + prot7 + prot_orbit + prot_solar"""
+    t = time.monotonic()
+    publish_sample("temp", frame.temp, t)
+    publish_sample("hum", frame.hum, t)
+    publish_sample("temp_med", frame.temp_avg, t)
+    add_orbit_point(float(frame.x), float(frame.y), float(frame.z))
+    set_panel_state(frame.panel_state)
+
+def prot_solar_line(linea):
+    match_panel = regex_panel.match(linea)
+    if match_panel:
+        prot_solar(match_panel)
 
 def prot1(parts):
-    global latest_data
     try:
         if len(parts) >= 3:
             hum = int(parts[1]) / 100.0
             temp = int(parts[2]) / 100.0
-            latest_data["temp"] = temp
-            latest_data["hum"] = hum
+            t = time.monotonic()
+            publish_sample("temp", temp, t)
+            publish_sample("hum", hum, t)
             print(f"Temp: {temp:.2f}ºC, Hum: {hum:.2f}%")
     except ValueError:
         pass
 
 def prot2(parts):
-    global latest_distance
     try:
-        latest_distance = int(parts[1])
-        print(f"Distancia: {latest_distance} mm")
+        distance = int(parts[1])
+        publish_sample("distance", distance)
+        print(f"Distancia: {distance} mm")
     except ValueError:
         pass
 
@@ -214,29 +377,27 @@ def prot3(parts):
     window.after(0, lambda: messagebox.showerror("Error transmisión", msg))
     registrar_evento("alarma", "Error transmisión: " + ":".join(parts[1:]))
 
-def prot4():
+def prot4(parts):
     window.after(0, lambda: messagebox.showerror("Error sensor", "Error en sensor temp/hum"))
     registrar_evento("alarma", "Error sensor temp/hum")
 
-def prot5():
+def prot5(parts):
     window.after(0, lambda: messagebox.showerror("Error sensor", "Error en sensor distancia"))
     registrar_evento("alarma", "Error sensor distancia")
 
 def prot6(parts):
-    global angulo
     try:
-        angulo = int(parts[1])
+        publish_sample("angle", int(parts[1]))
     except ValueError:
         window.after(0, lambda: messagebox.showerror("Error ángulo", "Valor incorrecto"))
 
 def prot7(parts):
-    global latest_temp_med
     try:
-        latest_temp_med = int(parts[1]) / 100.0
+        publish_sample("temp_med", int(parts[1]) / 100.0)
     except ValueError:
         pass
 
-def prot8():
+def prot8(parts):
     window.after(0, lambda: messagebox.showinfo("Alta temperatura!", "¡PELIGRO! Temp media >100°C"))
     registrar_evento("alarma", "Temperatura media >100°C")
 
@@ -254,65 +415,45 @@ def corrupt_chcksum(parts):
 # Serial: lectura principal
 # ----------------------------
 def read_serial():
-    """Lee las líneas ASCII del puerto serie y las procesa"""
-    global plot_active
-    if usbSerial is None:
+    """
+    Lee todos los enlaces en bloque desde un solo hilo; cada uno separa
+    protocolo, depuración y frames binarios 0xAA con su propio búfer
+    """
+    if not serial_links:
         return
-    while True:
-        try:
-            linea = usbSerial.readline().decode('utf-8', errors='ignore').strip()
-        except Exception as e:
-            print("Error leyendo serial:", e)
-            time.sleep(0.1)
-            continue
-
-        if not linea:
-            time.sleep(0.01)
-            continue
-
-        # Intentar parsear órbita (formatos impresos por GS después de decodificar frame binario)
-        match_orbit = regex_orbit.search(linea)
-        match_panel = regex_panel.search(linea)
-        parts = linea.split(":")
-
-        if match_orbit:
-            prot_orbit(match_orbit)
-            continue
-        if match_panel:
-            prot_solar(match_panel)
-            continue
-
-        try:
-            if len(parts) >= 2 and parts[0] in ('1','2','3','4','5','6','7','8','9','10','67','99'):
-                idn = parts[0]
-                if idn == '1':
-                    prot1(parts)
-                elif idn == '2':
-                    prot2(parts)
-                elif idn == '3':
-                    prot3(parts)
-                elif idn == '4':
-                    prot4()
-                elif idn == '5':
-                    prot5()
-                elif idn == '6':
-                    prot6(parts)
-                elif idn == '7':
-                    prot7(parts)
-                elif idn == '8':
-                    prot8()
-                elif idn == '67':
-                    # token messages; ignore or process if needed
-                    pass
-                elif idn == '99':
-                    corrupt_chcksum(parts)
-        except Exception as e:
-            print("Parse error:", e)
-
-        time.sleep(0.005)
-
-if usbSerial is not None:
+    multi_ingest.run()
+
+# Despacho por ID (sin regex salvo Position:/Panel:); cada handler cuenta llamadas y tiempo
+message_dispatcher = MessageDispatcher()
+message_dispatcher.register_prefix("Position:", prot_orbit_line, "prot_orbit")
+message_dispatcher.register_prefix("Panel:", prot_solar_line, "prot_solar")
+message_dispatcher.register('1', prot1)
+message_dispatcher.register('2', prot2)
+message_dispatcher.register('3', prot3)
+message_dispatcher.register('4', prot4)
+message_dispatcher.register('5', prot5)
+message_dispatcher.register('6', prot6)
+message_dispatcher.register('7', prot7)
+message_dispatcher.register('8', prot8)
+message_dispatcher.register('99', corrupt_chcksum)
+# '67' (token) y '9'/'10' no tienen handler: se cuentan como "sin handler"
+
+multi_ingest = MultiPortIngest(
+    on_protocol=lambda link, linea: message_dispatcher.dispatch(linea),
+    on_frame=lambda link, frame: prot_frame(frame),
+    on_debug=lambda link, linea: gs_debug_lines.append(f"[{link.name}] {linea}"),
+    on_raw=(lambda link, data: capture.rx(link.name, data)) if capture is not None else None,
+)
+
+def start_threaded_ingest():
+    # Solo sin núcleo asyncio: si no, multi_ingest tendría enlaces que nunca lee
+    for name, ser in serial_links:
+        multi_ingest.add_link(name, ser)
     threading.Thread(target=read_serial, daemon=True).start()
+
+if serial_links:
+    if not use_async_core:
+        start_threaded_ingest()
 else:
     print("Modo simulación/solo GUI: lectura serial deshabilitado.")
 
@@ -332,10 +473,15 @@ def send_command(command):
     if usbSerial is None:
         messagebox.showwarning("Sin conexión", "No hay puerto serial conectado")
         return
+    if async_bridge is not None:
+        async_bridge.send(command, device)  # la tarea escritora añade el checksum y registra el evento
+        return
     checksum = calc_checksum(command)
     full_msg = f"{command}*{checksum}\n"
     try:
         usbSerial.write(full_msg.encode())
+        if capture is not None:
+            capture.tx(device, full_msg.encode())
     except Exception as e:
         print("Error enviando serial:", e)
     print(f"Enviado: {full_msg.strip()}")
@@ -490,17 +636,22 @@ def abrir_ground_track():
     def update_gt_window():
         if not gt_win.winfo_exists():
             return
-        with ground_track_lock:
-            if len(ground_track_lat) > 0:
-                gt_line_win.set_data(ground_track_lon, ground_track_lat)
-                gt_point_win.set_offsets([[ground_track_lon[-1], ground_track_lat[-1]]])
-                lat = ground_track_lat[-1]
-                lon = ground_track_lon[-1]
-                info_label.config(text=f"Posición actual: Lat {lat:.2f}° | Lon {lon:.2f}° | Puntos: {len(ground_track_lat)}")
+        gt = ground_track_series.snapshot()
+        gt_version[0] = gt.version
+        if len(gt.lat) > 0:
+            gt_line_win.set_data(gt.lon, gt.lat)
+            gt_point_win.set_offsets([[gt.lon[-1], gt.lat[-1]]])
+            lat = gt.lat[-1]
+            lon = gt.lon[-1]
+            info_label.config(text=f"Posición actual: Lat {lat:.2f}° | Lon {lon:.2f}° | Puntos: {len(gt.lat)}")
         canvas_gt_win.draw()
-        gt_win.after(500, update_gt_window)
 
-    update_gt_window()
+    # Un panel más del planificador: solo se repinta si el ground track ha cambiado
+    gt_version = [-1]
+    panel_name = f"ground_track_{id(gt_win)}"
+    render_scheduler.register(panel_name, update_gt_window, interval=0.5,
+                              is_dirty=lambda: ground_track_series.version != gt_version[0])
+    gt_win.bind("<Destroy>", lambda e: render_scheduler.unregister(panel_name) if e.widget is gt_win else None)
 
 # ----------------------------
 # GUI principal
@@ -681,79 +832,176 @@ canvas_radar.get_tk_widget().pack()
 fig_temp, ax_temp = plt.subplots(figsize=(5, 4.5), facecolor='#0a0a2e')
 ax_temp.set_facecolor('#0a0a2e')
 ax_temp.set_ylim(0, 100)
-ax_temp.set_xlabel('Tiempo (muestras)', color='white', fontsize=9)
+ax_temp.set_xlabel('Tiempo (s)', color='white', fontsize=9)
 ax_temp.set_ylabel('Valor', color='white', fontsize=9)
 ax_temp.tick_params(colors='white', labelsize=8)
 ax_temp.grid(True, alpha=0.3)
-line_temp, = ax_temp.plot(range(max_points), temps, 'red', linewidth=2, label='Temp (°C)')
-line_hum, = ax_temp.plot(range(max_points), hums, 'cyan', linewidth=2, label='Hum (%)')
-line_med, = ax_temp.plot(range(max_points), temps_med, 'yellow', linewidth=2, label='Temp Media (°C)')
+line_temp, = ax_temp.plot([], [], 'red', linewidth=2, label='Temp (°C)')
+line_hum, = ax_temp.plot([], [], 'cyan', linewidth=2, label='Hum (%)')
+line_med, = ax_temp.plot([], [], 'yellow', linewidth=2, label='Temp Media (°C)')
+line_gs_mean, = ax_temp.plot([], [], 'orange', linewidth=1, linestyle='--', label='Temp Media GS 60 s')
 ax_temp.legend(loc='upper right', fontsize=7)
 canvas_temp = FigureCanvasTkAgg(fig_temp, master=temp_frame)
 canvas_temp.get_tk_widget().pack()
+temp_window_options = {"1 min": 60.0, "10 min": 600.0, "1 h": 3600.0, "24 h": 86400.0}
+temp_window_var = StringVar(value="1 min")
+
+def on_temp_window(choice):
+    global temp_window
+    temp_window = temp_window_options[choice]
+    render_scheduler.mark_dirty("temp")
+    render_scheduler.wake()
+
+OptionMenu(temp_frame, temp_window_var, *temp_window_options, command=on_temp_window).pack(pady=2)
 
 # Panel indicator
 Label(panel_frame, text="☀️ Estado Panel Solar", font=("Arial", 10, "bold"), bg="navy", fg="white").pack(pady=3)
 panel_label = Label(panel_frame, text="RETRAÍDO", font=("Arial", 12, "bold"), bg="#ff6b6b", fg="white", padx=15, pady=5)
 panel_label.pack(pady=5, padx=10)
+link_label = Label(panel_frame, text="Enlace: -- mensajes/s", font=("Arial", 9), bg="navy", fg="white")
+link_label.pack(pady=3)
 
 # ----------------------------
 # Actualizaciones periódicas de gráficos e indicadores
 # ----------------------------
+orbit_version = -1
+# max(|x|, |y|, |z|) de los puntos que se dibujan: solo se le pasan las filas nuevas
+orbit_bounds = SlidingBounds(orbit_history)
+orbit_limits = AxisLimits(-7e6, 7e6, margin=0.05, floor=(-7e6, 7e6))
+
 def update_orbit_plot():
-    with orbit_lock:
-        if len(orbit_x) > 0:
-            orbit_line.set_data(orbit_x, orbit_y)
-            orbit_line.set_3d_properties(orbit_z)
-            orbit_point._offsets3d = ([orbit_x[-1]], [orbit_y[-1]], [orbit_z[-1]])
-            max_coord = max(
-                max(abs(x) for x in orbit_x),
-                max(abs(y) for y in orbit_y),
-                max(abs(z) for z in orbit_z)
-            )
-            if max_coord > 6.5e6:
-                lim = max_coord * 1.1
-                ax_orbit.set_xlim(-lim, lim)
-                ax_orbit.set_ylim(-lim, lim)
-                ax_orbit.set_zlim(-lim, lim)
-    canvas_orbit.draw()
-    window.after(500, update_orbit_plot)
+    global orbit_version
+    orb = orbit_series.snapshot()  # X/Y/Z siempre completos, sin esperar al lector
+    nuevas = min(orb.version - orbit_version, len(orb.x))
+    orbit_version = orb.version
+    if nuevas > 0:
+        orbit_bounds.extend(np.maximum(np.maximum(np.abs(orb.x[-nuevas:]), np.abs(orb.y[-nuevas:])),
+                                       np.abs(orb.z[-nuevas:])))
+    if len(orb.x) > 0:
+        orbit_line.set_data(orb.x, orb.y)
+        orbit_line.set_3d_properties(orb.z)
+        orbit_point._offsets3d = ([orb.x[-1]], [orb.y[-1]], [orb.z[-1]])
+        max_coord = orbit_bounds.max
+        if max_coord is not None and orbit_limits.update(-max_coord, max_coord):
+            lo, hi = orbit_limits.limits
+            ax_orbit.set_xlim(lo, hi)
+            ax_orbit.set_ylim(lo, hi)
+            ax_orbit.set_zlim(lo, hi)
+    # La Tierra va en el fondo cacheado: solo se pintan trayectoria y satélite
+    orbit_blit.update()
+
+def drain_samples():
+    """Vuelca en el almacén de telemetría las muestras llegadas desde el último refresco"""
+    for channel, value, t in sample_queue.drain():
+        telemetry.append(channel, value, t)
+        if channel == "distance":
+            # Se pinta con el último ángulo recibido antes de esta distancia
+            thetas.append(np.deg2rad(telemetry.latest("angle", 90)))
+            radios.append(min(max(value, 0), max_distance))
+
+# Blitting: fondo de cada figura cacheado, en cada refresco solo se pintan las líneas
+radar_blit = BlitManager(canvas_radar, [linea_radar])
+orbit_blit = BlitManager(canvas_orbit, [orbit_line, orbit_point])
+temp_blit = BlitManager(canvas_temp, [line_temp, line_hum, line_med, line_gs_mean])
+radar_cursor = 0
 
 def update_radar_plot():
-    global thetas, radios, latest_distance, angulo
-    theta_now = np.deg2rad(angulo)
-    r_now = min(max(latest_distance, 0), max_distance)
-    thetas.append(theta_now)
-    radios.append(r_now)
-    if len(thetas) > 20:
-        thetas.pop(0)
-        radios.pop(0)
-    linea_radar.set_data(thetas, radios)
-    canvas_radar.draw()
-    window.after(100, update_radar_plot)
+    global radar_cursor
+    radar_cursor = thetas.total
+    linea_radar.set_data(thetas.view(), radios.view())
+    radar_blit.update()
+
+# Eje X en segundos desde que arrancó la GUI; cada línea pinta las muestras
+# reales con su instante de llegada (sin repetir valores si no llega nada)
+t_session = time.monotonic()
+temp_lines = {"temp": line_temp, "hum": line_hum, "temp_med": line_med, "temp.mean_60s": line_gs_mean}
+temp_xlim = None           # (izquierda, derecha, ventana)
+temp_bounds_window = None  # ventana con la que se sembraron temp_bounds
+temp_ylim = AxisLimits(0, 100, margin=0.05, shrink=0.3)
+
+# Los límites cambian a saltos, no en cada refresco: el eje X avanza un cuarto
+# de ventana cuando los datos llegan al borde y el Y (con histéresis) solo
+# cambia si algo se sale o los datos ocupan menos de un 30% de la vista.
+# Mientras no cambian, el fondo cacheado del blit sigue valiendo
+def update_temp_xlim(x_end):
+    global temp_xlim
+    if temp_xlim is None or temp_xlim[2] != temp_window or x_end > temp_xlim[1]:
+        right = max(temp_window, x_end + 0.25 * temp_window)
+        temp_xlim = (right - temp_window, right, temp_window)
+        ax_temp.set_xlim(temp_xlim[0], temp_xlim[1])
+    return temp_xlim[0], temp_xlim[1]
+
+def update_temp_ylim():
+    if temp_ylim.update(*combined(temp_bounds.values())):
+        ax_temp.set_ylim(*temp_ylim.limits)
 
 def update_temp_plot():
-    temps.append(latest_data["temp"])
-    hums.append(latest_data["hum"])
-    temps_med.append(latest_temp_med)
-    line_temp.set_visible(plot_active)
-    line_hum.set_visible(plot_active)
-    line_med.set_visible(plot_active)
-    line_temp.set_ydata(temps)
-    line_hum.set_ydata(hums)
-    line_med.set_ydata(temps_med)
-    ax_temp.relim()
-    ax_temp.autoscale_view()
-    canvas_temp.draw()
-    window.after(100, update_temp_plot)
+    global temp_bounds_window
+    t_end = max(telemetry.latest_time(c, t_session) for c in temp_lines)
+    x0, x1 = update_temp_xlim(t_end - t_session)
+    resembrar = temp_bounds_window != temp_window
+    temp_bounds_window = temp_window
+    for canal, line in temp_lines.items():
+        line.set_visible(plot_active)
+        t, v, _nivel = temp_pyramids[canal].select(t_session + x0, t_session + x1, temp_max_vertices)
+        line.set_data(t - t_session, v)
+        bounds = temp_bounds[canal]
+        if resembrar:
+            # Ventana nueva: la envolvente min/max de la pirámide trae los extremos exactos
+            bounds.clear()
+            bounds.extend(v, t)
+        else:
+            bounds.retire_before(t_session + x0)
+    update_temp_ylim()
+    temp_blit.update()
+
+shown_panel_state = None
 
 def update_panel_indicator():
+    global shown_panel_state
     with panel_lock:
         state = panel_state
+    shown_panel_state = state
     estado_texto = {0: "RETRAÍDO", 40: "40% DESPLEGADO", 60: "60% DESPLEGADO", 100: "100% DESPLEGADO"}
     colores = {0: "#ff6b6b", 40: "#ffd93d", 60: "#6bcf7f", 100: "#51cf66"}
     panel_label.config(text=estado_texto.get(state, f"{state}%"), bg=colores.get(state, "#888888"))
-    window.after(500, update_panel_indicator)
+
+def active_links():
+    """Enlaces que están leyendo de verdad: los del núcleo asyncio o los del hilo lector"""
+    if async_bridge is not None:
+        return list(async_core.links.values())
+    return multi_ingest.links
+
+def link_rates_text():
+    return " | ".join(f"{link.name}: {link.lines_per_second:.0f} msg/s" for link in active_links())
+
+def update_link_label():
+    link_label.config(text=link_rates_text())
+
+# ----------------------------
+# Núcleo asyncio opcional (un solo loop para el puerto, comandos y eventos)
+# ----------------------------
+def on_async_message(kind, payload, link_name):
+    if kind == "protocol":
+        message_dispatcher.dispatch(payload)
+    elif kind == "frame":
+        prot_frame(payload)
+    else:
+        gs_debug_lines.append(payload)
+
+if use_async_core and serial_links:
+    async_core = AsyncGroundStation(event_file=EVENTOS_FILE, tap=capture.tap if capture is not None else None)
+    for name, ser in serial_links:
+        async_core.add_link(name, ser)
+    async_bridge = TkBridge(async_core, window, on_async_message)
+    try:
+        async_bridge.start()
+    except Exception as e:
+        # Sin núcleo asyncio se vuelve al camino de siempre: hilo lector + hilo manual
+        print("No se pudo arrancar el núcleo asyncio, se usan hilos:", e)
+        async_bridge = None
+        use_async_core = False
+        start_threaded_ingest()
 
 # ----------------------------
 # Transmission controls
@@ -780,6 +1028,7 @@ def iniClick():
     transmission_state = "running"
     update_transmission_buttons()
     registrar_evento("comando", "3:i")
+    render_scheduler.wake()
 
 def stopClick():
     global plot_active, transmission_state
@@ -788,6 +1037,7 @@ def stopClick():
     transmission_state = "stopped"
     update_transmission_buttons()
     registrar_evento("comando", "3:p")
+    render_scheduler.wake()
 
 def reanClick():
     global plot_active, transmission_state
@@ -796,6 +1046,7 @@ def reanClick():
     transmission_state = "paused"
     update_transmission_buttons()
     registrar_evento("comando", "3:r")
+    render_scheduler.wake()
 
 def os_auto():
     send_command("4:a")
@@ -820,7 +1071,13 @@ manual_control_frame.pack(pady=(0, 10))
 
 Label(manual_control_frame, text="Control Manual (ángulo)", font=("Arial", 9), bg=bg_main, fg=tf).pack()
 manual_angle_var = IntVar(value=90)
-manual_slider = Scale(manual_control_frame, from_=0, to=180, orient=HORIZONTAL, variable=manual_angle_var, length=200)
+manual_angle = 90  # copia en int del slider, legible desde el loop asyncio sin tocar Tk
+
+def on_manual_slider(value):
+    global manual_angle
+    manual_angle = int(float(value))
+
+manual_slider = Scale(manual_control_frame, from_=0, to=180, orient=HORIZONTAL, variable=manual_angle_var, length=200, command=on_manual_slider)
 manual_slider.pack()
 
 # Hilo que envía periódicamente el valor del slider cuando manual_mode_flag es True
@@ -835,8 +1092,16 @@ def manual_sender_thread():
             registrar_evento("comando", f"5:{angle}")
         time.sleep(SEND_INTERVAL_MS / 1000.0)
 
-t_manual_sender = threading.Thread(target=manual_sender_thread, daemon=True)
-t_manual_sender.start()
+def manual_sender_tick():
+    """Versión asyncio del hilo manual: se ejecuta dentro del loop cada 200 ms"""
+    if manual_mode_flag:
+        async_core.send_nowait(f"5:{manual_angle}", device)
+
+if async_bridge is not None:
+    async_bridge.every(0.2, manual_sender_tick)
+elif not use_async_core:
+    t_manual_sender = threading.Thread(target=manual_sender_thread, daemon=True)
+    t_manual_sender.start()
 
 # ----------------------------
 # Asignación botones GUI
@@ -851,20 +1116,56 @@ btn_ground_track.config(command=abrir_ground_track)
 # ----------------------------
 # Iniciar actualizaciones periódicas
 # ----------------------------
-window.after(100, update_temp_plot)
-window.after(500, update_radar_plot)
-window.after(500, update_orbit_plot)
-window.after(500, update_panel_indicator)
+# Un solo planificador: cada tick vacía la cola de muestras y pinta, en una
+# pasada, solo los paneles con datos nuevos a los que ya les toca. Si pintar
+# cuesta más que render_budget, los paneles caros se espacian solos
+render_scheduler = RenderScheduler(window, tick_ms=50, budget=render_budget, max_interval=render_max_interval)
+render_scheduler.add_hook(drain_samples)
+render_scheduler.register("temp", update_temp_plot, interval=0.1,
+                          is_dirty=lambda: line_temp.get_visible() != plot_active)
+render_scheduler.register("radar", update_radar_plot, interval=0.1,
+                          is_dirty=lambda: thetas.total != radar_cursor)
+render_scheduler.register("orbit", update_orbit_plot, interval=0.1,
+                          is_dirty=lambda: orbit_series.version != orbit_version)
+render_scheduler.register("panel", update_panel_indicator, interval=0.5,
+                          is_dirty=lambda: panel_state != shown_panel_state)
+render_scheduler.register("links", update_link_label, interval=0.5,
+                          is_dirty=lambda: bool(active_links()) and link_rates_text() != link_label.cget("text"))
+
+def mark_temp_dirty(canal, valor, t):
+    if canal in temp_lines:
+        render_scheduler.mark_dirty("temp")
+
+telemetry.subscribe(mark_temp_dirty)
+render_scheduler.start()
 
 # ----------------------------
 # on_close
 # ----------------------------
 def on_close():
-    try:
-        if usbSerial:
-            usbSerial.close()
-    except:
-        pass
+    if async_bridge is not None:
+        async_bridge.stop()
+    multi_ingest.stop()
+    render_scheduler.stop()
+    for name, ser in serial_links:
+        try:
+            ser.close()
+        except:
+            pass
+    # Qué tipo de mensaje se ha llevado la CPU durante la sesión
+    for ln in message_dispatcher.report():
+        print(ln)
+    print("Cola de muestras:", sample_queue.stats())
+    for ln in render_scheduler.report():
+        print(ln)
+    if capture is not None:
+        capture.close()
+        print("Captura:", capture.stats())
+    if recorder is not None:
+        recorder.close()
+        print("Grabación:", recorder.stats())
+    for name, src in replay_sources:
+        print(f"Reproducción ({name}):", src.stats())
     window.destroy()
     exit(0)
 
@@ -14,8 +14,15 @@ import matplotlib
 matplotlib.use("TkAgg")
 import datetime
 import os
+import sys
 from PIL import Image, ImageTk
 
+# Módulos compartidos de la estación de tierra (src/ground_station)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.ground_station.blit import BlitManager
+from src.ground_station.ring_buffer import RingBuffer
+from src.ground_station.bounds import SlidingBounds, AxisLimits, combined
+
 plot_active = True
 
 
@@ -105,6 +112,11 @@ max_points = 100
 temps = deque([0]*max_points, maxlen=max_points)
 hums = deque([0]*max_points, maxlen=max_points)
 temps_med = deque([0]*max_points, maxlen=max_points)
+# Mín/máx de cada búfer al día con cada append (empiezan con los ceros del relleno)
+temp_bounds = [SlidingBounds(max_points) for _ in range(3)]
+for b in temp_bounds:
+    b.extend([0.0] * max_points)
+temp_limits = AxisLimits(0, 100, margin=0.05, shrink=0.3)
 latest_data = {"temp": 0, "hum": 0}
 angulo = 90
 latest_temp_med = 0
@@ -115,9 +127,12 @@ thetas = []
 radios = []
 
 #Para datos orbitales y ground track
-orbit_x = []
-orbit_y = []
-orbit_z = []
+orbit_history = 5000  # puntos de órbita que se dibujan (la memoria no crece con la sesión)
+orbit_x = RingBuffer(orbit_history)
+orbit_y = RingBuffer(orbit_history)
+orbit_z = RingBuffer(orbit_history)
+orbit_bounds = SlidingBounds(orbit_history)  # max(|x|, |y|, |z|) de los puntos del búfer
+orbit_limits = AxisLimits(-7e6, 7e6, margin=0.05, floor=(-7e6, 7e6))
 orbit_lock = threading.Lock()
 ground_track_lat = []
 ground_track_lon = []
@@ -182,6 +197,7 @@ def prot_orbit(match_orbit):
             orbit_x.append(x)
             orbit_y.append(y)
             orbit_z.append(z)
+            orbit_bounds.append(max(abs(x), abs(y), abs(z)))
         
         lat, lon = xyz_to_latlon(x, y, z)
 
@@ -625,30 +641,36 @@ def abrir_ground_track():
 
 
 #Funciones de actualización de los graficos principales:
+orbit_drawn = 0  # puntos de órbita ya pintados
+
 def update_orbit_plot():
+    global orbit_drawn
+    # Sin puntos nuevos no hay nada que pintar ni que copiar (girar la vista ya redibuja sola)
     with orbit_lock:
-        if len(orbit_x) > 0:
-            # Actualizar trayectoria 3D
-            orbit_line.set_data(orbit_x, orbit_y)
-            orbit_line.set_3d_properties(orbit_z)
-            
-            # Actualizar posición del satélite
-            orbit_point._offsets3d = ([orbit_x[-1]], [orbit_y[-1]], [orbit_z[-1]])
-            
-            # Ajustar límites si es necesario
-            max_coord = max(
-                max(abs(x) for x in orbit_x),
-                max(abs(y) for y in orbit_y),
-                max(abs(z) for z in orbit_z)
-            )
-            if max_coord > 6.5e6:
-                lim = max_coord * 1.1
-                ax_orbit.set_xlim(-lim, lim)
-                ax_orbit.set_ylim(-lim, lim)
-                ax_orbit.set_zlim(-lim, lim)
-    
-    canvas_orbit.draw()
-    window.after(500, update_orbit_plot)
+        n = orbit_x.total
+        changed = n > 0 and n != orbit_drawn
+        if changed:
+            # Copia acotada a orbit_history: el hilo lector sigue escribiendo en el búfer
+            xs, ys, zs = orbit_x.view().copy(), orbit_y.view().copy(), orbit_z.view().copy()
+            max_coord = orbit_bounds.max
+    if changed:
+        orbit_drawn = n
+        # Actualizar trayectoria 3D
+        orbit_line.set_data(xs, ys)
+        orbit_line.set_3d_properties(zs)
+        
+        # Actualizar posición del satélite
+        orbit_point._offsets3d = ([xs[-1]], [ys[-1]], [zs[-1]])
+        
+        # Ajustar límites solo si la órbita se sale de la vista (máximo ya calculado al leer)
+        if max_coord is not None and orbit_limits.update(-max_coord, max_coord):
+            ax_orbit.set_xlim(*orbit_limits.limits)
+            ax_orbit.set_ylim(*orbit_limits.limits)
+            ax_orbit.set_zlim(*orbit_limits.limits)
+        
+        # La Tierra va en el fondo cacheado: solo se pintan trayectoria y satélite
+        orbit_blit.update()
+    window.after(100, update_orbit_plot)
 
 def update_radar_plot():
     global latest_distance, angulo, thetas, radios
@@ -667,6 +689,8 @@ def update_temp_plot():
     temps.append(latest_data["temp"])
     hums.append(latest_data["hum"])
     temps_med.append(latest_temp_med)
+    for b, v in zip(temp_bounds, (latest_data["temp"], latest_data["hum"], latest_temp_med)):
+        b.append(float(v))
 
     line_temp.set_visible(plot_active)
     line_hum.set_visible(plot_active)
@@ -676,8 +700,8 @@ def update_temp_plot():
     line_hum.set_ydata(hums)
     line_med.set_ydata(temps_med)
 
-    ax_temp.relim()
-    ax_temp.autoscale_view()
+    if temp_limits.update(*combined(temp_bounds)):
+        ax_temp.set_ylim(*temp_limits.limits)
     canvas_temp.draw()
     window.after(100, update_temp_plot)
 
@@ -839,9 +863,13 @@ ax_orbit = fig_orbit.add_subplot(111, projection='3d')
 ax_orbit.set_facecolor('#0a0a2e')
 fig_orbit.patch.set_facecolor('#0a0a2e')
 # Crear esfera de la Tierra
+# Nivel de detalle de la malla: se sombrea una sola vez y queda en el fondo
+# cacheado del blit (solo se vuelve a pintar al girar la vista o cambiar límites)
 R_EARTH = 6371000
-u = np.linspace(0, 2 * np.pi, 30)
-v = np.linspace(0, np.pi, 20)
+earth_u_points = 30
+earth_v_points = 20
+u = np.linspace(0, 2 * np.pi, earth_u_points)
+v = np.linspace(0, np.pi, earth_v_points)
 x_earth = R_EARTH * np.outer(np.cos(u), np.sin(v))
 y_earth = R_EARTH * np.outer(np.sin(u), np.sin(v))
 z_earth = R_EARTH * np.outer(np.ones(np.size(u)), np.cos(v))
@@ -869,6 +897,7 @@ ax_orbit.zaxis.pane.set_alpha(0.3)
 
 canvas_orbit = FigureCanvasTkAgg(fig_orbit, master=orbit_frame)
 canvas_orbit.get_tk_widget().pack()
+orbit_blit = BlitManager(canvas_orbit, [orbit_line, orbit_point])
 #2. Radar:
 fig_radar, ax_radar = plt.subplots(subplot_kw={'polar': True}, figsize=(5, 4.5), facecolor='#0a0a2e')
 ax_radar.set_facecolor('#0a0a2e')
@@ -918,7 +947,7 @@ btn_ground_track.config(command=abrir_ground_track)
 # Iniciar actualizaciones
 window.after(100, update_temp_plot)
 window.after(500, update_radar_plot)
-window.after(500, update_orbit_plot)
+window.after(100, update_orbit_plot)
 window.after(500, update_panel_indicator)
 
 
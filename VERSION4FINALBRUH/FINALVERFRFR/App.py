@@ -14,8 +14,16 @@ matplotlib.use("TkAgg")
 
 import datetime
 import os
+import sys
 from PIL import Image, ImageTk
 
+# Módulos compartidos de la estación de tierra (src/ground_station)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.ground_station.serial_ingest import SerialIngest
+from src.ground_station.ring_buffer import RingBuffer
+from src.ground_station.bounds import SlidingBounds, AxisLimits, combined
+from src.ground_station.scheduler import RenderScheduler
+
 plot_active = True
 
 # Setup del serial
@@ -30,32 +38,50 @@ except Exception as e:
     usbSerial = None
     print(f"No se pudo abrir {device}: {e}")
 
+# Lector en bloque (vacía in_waiting de una vez y separa líneas)
+serial_ingest = SerialIngest(usbSerial) if usbSerial is not None else None
+
 # Búfer de datos sensores
+# Longitud de cada historial (memoria fija por mucho que dure la sesión)
 max_points = 100
-temps = deque([0]*max_points, maxlen=max_points)
-hums = deque([0]*max_points, maxlen=max_points)
-temps_med = deque([0]*max_points, maxlen=max_points)
+radar_trail = 20
+orbit_history = 5000
+ground_track_history = 200
+temps = RingBuffer(max_points, fill=0)
+hums = RingBuffer(max_points, fill=0)
+temps_med = RingBuffer(max_points, fill=0)
+# Mín/máx de cada búfer al día con cada append (empiezan con los ceros del relleno)
+temp_bounds = [SlidingBounds(max_points) for _ in range(3)]
+for b in temp_bounds:
+    b.extend([0.0] * max_points)
+temp_limits = AxisLimits(0, 100, margin=0.05, shrink=0.3)
 latest_data = {"temp": 0, "hum": 0}
 latest_distance = 0
 angulo = 90
 latest_temp_med = 0
+# Cuántos mensajes han cambiado cada gráfica (los sube el hilo lector): el
+# planificador solo repinta si hay algo nuevo desde el último refresco
+data_version = {"temp": 0, "radar": 0}
+render_budget = 0.5  # fracción de CPU como mucho para pintar gráficas
 
 # Trail del radar
-thetas = []
-radios = []
+thetas = RingBuffer(radar_trail)
+radios = RingBuffer(radar_trail)
 
 # Estadísticas checksum
 total_corrupted = 0
 
 # === DATOS ORBITALES ===
-orbit_x = []
-orbit_y = []
-orbit_z = []
+orbit_x = RingBuffer(orbit_history)
+orbit_y = RingBuffer(orbit_history)
+orbit_z = RingBuffer(orbit_history)
+orbit_bounds = SlidingBounds(orbit_history)  # max(|x|, |y|) de los puntos del búfer
+orbit_limits = AxisLimits(-7e6, 7e6, margin=0.05, floor=(-7e6, 7e6))
 orbit_lock = threading.Lock()
 
 # Ground track data (lat/lon convertidas)
-ground_track_lat = []
-ground_track_lon = []
+ground_track_lat = RingBuffer(ground_track_history)
+ground_track_lon = RingBuffer(ground_track_history)
 ground_track_lock = threading.Lock()
 
 # === ESTADO DEL PANEL SOLAR ===
@@ -172,16 +198,18 @@ def read_serial():
     if usbSerial is None:
         return
 
+    pendientes = deque()
     while True:
-        try:
-            linea = usbSerial.readline().decode('utf-8', errors='ignore').strip()
-        except Exception as e:
-            print("Error leyendo serial:", e)
-            time.sleep(0.1)
+        if not pendientes:
+            try:
+                pendientes.extend(serial_ingest.read_lines())
+            except Exception as e:
+                print("Error leyendo serial:", e)
+                time.sleep(0.1)
             continue
 
+        linea = pendientes.popleft().decode('utf-8', errors='ignore').strip()
         if not linea:
-            time.sleep(0.01)
             continue
 
         # === PARSEO DE POSICIÓN ORBITAL ===
@@ -196,6 +224,7 @@ def read_serial():
                     orbit_x.append(x)
                     orbit_y.append(y)
                     orbit_z.append(z)
+                    orbit_bounds.append(max(abs(x), abs(y)))
                 
                 # Convertir a lat/lon para ground track
                 lat, lon = xyz_to_latlon(x, y, z)
@@ -203,15 +232,10 @@ def read_serial():
                 with ground_track_lock:
                     ground_track_lat.append(lat)
                     ground_track_lon.append(lon)
-                    # Mantener solo últimos 200 puntos para no saturar
-                    if len(ground_track_lat) > 200:
-                        ground_track_lat.pop(0)
-                        ground_track_lon.pop(0)
                 
                 print(f"Orbital: X={x:.0f}, Y={y:.0f}, Z={z:.0f} | Lat={lat:.2f}°, Lon={lon:.2f}°")
             except ValueError:
                 pass
-            time.sleep(0.01)
             continue
 
         # === PARSEO DE ESTADO DEL PANEL SOLAR ===
@@ -236,7 +260,6 @@ def read_serial():
                     registrar_evento("alarma", msg)
             except ValueError:
                 pass
-            time.sleep(0.01)
             continue
 
         # === PARSEO DE PROTOCOLOS ESTÁNDAR ===
@@ -252,6 +275,7 @@ def read_serial():
                             temp = int(parts[2]) / 100.0
                             latest_data["temp"] = temp
                             latest_data["hum"] = hum
+                            data_version["temp"] += 1
                             print(f"Temp: {temp:.2f}°C, Hum: {hum:.2f}%")
                         except ValueError:
                             pass
@@ -259,6 +283,7 @@ def read_serial():
                 elif idn == '2':
                     try:
                         latest_distance = int(parts[1])
+                        data_version["radar"] += 1
                         print(f"Distancia: {latest_distance} mm")
                     except ValueError:
                         pass
@@ -279,12 +304,14 @@ def read_serial():
                 elif idn == '6':
                     try:
                         angulo = int(parts[1])
+                        data_version["radar"] += 1
                     except ValueError:
                         messagebox.showerror("Error ángulo", "Valor incorrecto")
 
                 elif idn == '7':
                     try:
                         latest_temp_med = int(parts[1]) / 100.0
+                        data_version["temp"] += 1
                     except ValueError:
                         pass
 
@@ -307,8 +334,6 @@ def read_serial():
         except Exception as e:
             print("Parse error:", e)
 
-        time.sleep(0.01)
-
 if usbSerial is not None:
     threading.Thread(target=read_serial, daemon=True).start()
 else:
@@ -405,9 +430,9 @@ ax_temp.set_ylabel('Valor', color='white', fontsize=9)
 ax_temp.tick_params(colors='white', labelsize=8)
 ax_temp.grid(True, alpha=0.3)
 
-line_temp, = ax_temp.plot(range(max_points), temps, 'red', linewidth=2, label='Temp (°C)')
-line_hum, = ax_temp.plot(range(max_points), hums, 'cyan', linewidth=2, label='Hum (%)')
-line_med, = ax_temp.plot(range(max_points), temps_med, 'yellow', linewidth=2, label='Temp Media (°C)')
+line_temp, = ax_temp.plot(range(max_points), temps.view(), 'red', linewidth=2, label='Temp (°C)')
+line_hum, = ax_temp.plot(range(max_points), hums.view(), 'cyan', linewidth=2, label='Hum (%)')
+line_med, = ax_temp.plot(range(max_points), temps_med.view(), 'yellow', linewidth=2, label='Temp Media (°C)')
 ax_temp.legend(loc='upper right', fontsize=7)
 
 canvas_temp = FigureCanvasTkAgg(fig_temp, master=temp_frame)
@@ -552,6 +577,7 @@ def iniClick():
     plot_active = True
     transmission_state = "running"
     update_transmission_buttons()
+    render_scheduler.wake()
 
 def stopClick():
     global plot_active, transmission_state
@@ -559,6 +585,7 @@ def stopClick():
     plot_active = False
     transmission_state = "stopped"
     update_transmission_buttons()
+    render_scheduler.wake()
 
 def reanClick():
     global plot_active, transmission_state
@@ -566,6 +593,7 @@ def reanClick():
     plot_active = True
     transmission_state = "paused"
     update_transmission_buttons()
+    render_scheduler.wake()
 
 def os_auto():
     send_command("4:a")
@@ -696,13 +724,16 @@ def abrir_ground_track():
     info_label.pack(pady=5)
     
     # Función de actualización para esta ventana
+    gt_drawn = [-1]
+    
     def update_gt_window():
         if not gt_win.winfo_exists():
             return
         
         with ground_track_lock:
+            gt_drawn[0] = ground_track_lat.total
             if len(ground_track_lat) > 0:
-                gt_line_win.set_data(ground_track_lon, ground_track_lat)
+                gt_line_win.set_data(ground_track_lon.view(), ground_track_lat.view())
                 gt_point_win.set_offsets([[ground_track_lon[-1], ground_track_lat[-1]]])
                 
                 # Actualizar info
@@ -711,10 +742,13 @@ def abrir_ground_track():
                 info_label.config(text=f"Posición actual: Lat {lat:.2f}° | Lon {lon:.2f}° | Puntos: {len(ground_track_lat)}")
         
         canvas_gt_win.draw()
-        gt_win.after(500, update_gt_window)
     
-    # Iniciar actualización
-    update_gt_window()
+    # Un panel más del planificador: solo se repinta si han llegado puntos nuevos
+    panel_name = f"ground_track_{id(gt_win)}"
+    render_scheduler.register(panel_name, update_gt_window, interval=0.5,
+                              is_dirty=lambda: ground_track_lat.total != gt_drawn[0])
+    gt_win.bind("<Destroy>", lambda e: render_scheduler.unregister(panel_name) if e.widget is gt_win else None)
+    render_scheduler.wake()
 
 # Asignar comandos a botones
 btn_iniciar.config(command=iniClick)
@@ -728,55 +762,63 @@ btn_ground_track.config(command=abrir_ground_track)
 
 # === FUNCIONES DE ACTUALIZACIÓN DE GRÁFICOS ===
 
+orbit_drawn = -1
+radar_drawn = -1
+temp_drawn = -1
+shown_panel_state = None
+
 def update_orbit_plot():
+    global orbit_drawn
     with orbit_lock:
+        orbit_drawn = orbit_x.total
         if len(orbit_x) > 0:
-            orbit_line.set_data(orbit_x, orbit_y)
-            orbit_point.set_offsets([[orbit_x[-1], orbit_y[-1]]])
+            xs, ys = orbit_x.view(), orbit_y.view()
+            orbit_line.set_data(xs, ys)
+            orbit_point.set_offsets([[xs[-1], ys[-1]]])
             
-            max_coord = max(max(abs(x) for x in orbit_x), max(abs(y) for y in orbit_y))
-            if max_coord > 6.5e6:
-                lim = max_coord * 1.1
-                ax_orbit.set_xlim(-lim, lim)
-                ax_orbit.set_ylim(-lim, lim)
+            max_coord = orbit_bounds.max
+            if max_coord is not None and orbit_limits.update(-max_coord, max_coord):
+                ax_orbit.set_xlim(*orbit_limits.limits)
+                ax_orbit.set_ylim(*orbit_limits.limits)
     
     canvas_orbit.draw()
-    window.after(500, update_orbit_plot)
 
 def update_radar_plot():
-    global latest_distance, angulo, thetas, radios
+    global latest_distance, angulo, thetas, radios, radar_drawn
+    radar_drawn = data_version["radar"]
     theta_now = np.deg2rad(angulo)
     r_now = min(max(latest_distance, 0), max_distance)
     thetas.append(theta_now)
     radios.append(r_now)
-    if len(thetas) > 20:
-        thetas.pop(0)
-        radios.pop(0)
-    linea_radar.set_data(thetas, radios)
+    linea_radar.set_data(thetas.view(), radios.view())
     canvas_radar.draw()
-    window.after(100, update_radar_plot)
 
 def update_temp_plot():
+    global temp_drawn
+    temp_drawn = data_version["temp"]
     temps.append(latest_data["temp"])
     hums.append(latest_data["hum"])
     temps_med.append(latest_temp_med)
+    for b, v in zip(temp_bounds, (latest_data["temp"], latest_data["hum"], latest_temp_med)):
+        b.append(float(v))
 
     line_temp.set_visible(plot_active)
     line_hum.set_visible(plot_active)
     line_med.set_visible(plot_active)
 
-    line_temp.set_ydata(temps)
-    line_hum.set_ydata(hums)
-    line_med.set_ydata(temps_med)
+    line_temp.set_ydata(temps.view())
+    line_hum.set_ydata(hums.view())
+    line_med.set_ydata(temps_med.view())
 
-    ax_temp.relim()
-    ax_temp.autoscale_view()
+    if temp_limits.update(*combined(temp_bounds)):
+        ax_temp.set_ylim(*temp_limits.limits)
     canvas_temp.draw()
-    window.after(100, update_temp_plot)
 
 def update_panel_indicator():
+    global shown_panel_state
     with panel_lock:
         state = panel_state
+    shown_panel_state = state
     
     estado_texto = {
         0: "RETRAÍDO",
@@ -796,16 +838,23 @@ def update_panel_indicator():
         text=estado_texto.get(state, f"{state}%"),
         bg=colores.get(state, "#888888")
     )
-    
-    window.after(500, update_panel_indicator)
 
-# Iniciar actualizaciones
-window.after(100, update_temp_plot)
-window.after(500, update_radar_plot)
-window.after(500, update_orbit_plot)
-window.after(500, update_panel_indicator)
+# Iniciar actualizaciones: un solo planificador en vez de una cadena after por
+# gráfica; cada panel se repinta solo si hay datos nuevos y ya le toca, y los
+# caros se espacian si pintar se come más de render_budget de CPU
+render_scheduler = RenderScheduler(window, tick_ms=50, budget=render_budget)
+render_scheduler.register("temp", update_temp_plot, interval=0.1,
+                          is_dirty=lambda: data_version["temp"] != temp_drawn or line_temp.get_visible() != plot_active)
+render_scheduler.register("radar", update_radar_plot, interval=0.1,
+                          is_dirty=lambda: data_version["radar"] != radar_drawn)
+render_scheduler.register("orbit", update_orbit_plot, interval=0.5,
+                          is_dirty=lambda: orbit_x.total != orbit_drawn)
+render_scheduler.register("panel", update_panel_indicator, interval=0.5,
+                          is_dirty=lambda: panel_state != shown_panel_state)
+render_scheduler.start()
 
 def on_close():
+    render_scheduler.stop()
     try:
         if usbSerial:
             usbSerial.close()
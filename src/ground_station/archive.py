@@ -0,0 +1,208 @@
+# archive.py
+"""
+Archivo comprimido de telemetría a largo plazo, con acceso aleatorio.
+
+Cada canal se parte en chunks de chunk_size muestras que se comprimen por
+separado (zlib o lzma de la stdlib). Antes de comprimir:
+  - los instantes pasan a microsegundos enteros y se codifican en deltas
+  - los canales con resolución conocida (temp x100, X/Y/Z en cm, ...) pasan
+    a enteros y también van en deltas; el resto se guarda como float64
+
+Formato del fichero:
+    MAGIC | chunk | chunk | ... | índice JSON | offset del índice (<u8) | MAGIC
+
+El índice guarda por chunk canal, rango de tiempos, min/max, offset y
+longitud, así que leer un intervalo solo descomprime los chunks que toca.
+"""
+
+import json
+import lzma
+import os
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+from .recorder import RecordingReader
+
+MAGIC = b"GSARC1\n"
+TIME_SCALE = 1_000_000          # instantes en microsegundos
+# Resolución de origen de cada canal (valor * escala se guarda como entero)
+CHANNEL_SCALES = {
+    "temp": 100, "hum": 100, "temp_med": 100,   # el satélite manda x100
+    "x": 100, "y": 100, "z": 100,               # posición en cm
+    "distance": 1, "angle": 1, "panel": 1,
+}
+CODECS = {
+    "zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress),
+    "lzma": (lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+}
+
+
+def delta_encode(a):
+    a = np.asarray(a, dtype=np.int64)
+    out = np.empty_like(a)
+    if len(a):
+        out[0] = a[0]
+        np.subtract(a[1:], a[:-1], out=out[1:])
+    return out
+
+
+def delta_decode(d):
+    return np.cumsum(np.asarray(d, dtype=np.int64), dtype=np.int64)
+
+
+class ArchiveWriter:
+    def __init__(self, path, codec="zlib", level=6, chunk_size=4096, scales=None):
+        if codec not in CODECS:
+            raise ValueError(f"Códec desconocido: {codec}")
+        self.path = path
+        self.codec = codec
+        self.level = level
+        self.chunk_size = chunk_size
+        self.scales = dict(CHANNEL_SCALES if scales is None else scales)
+        self._compress = CODECS[codec][0]
+        self._f = open(path, "wb")
+        self._f.write(MAGIC)
+        self.index = []
+        self.raw_bytes = 0
+
+    def _encode(self, channel, t, v):
+        scale = self.scales.get(channel)
+        t_int = np.round(np.asarray(t, dtype=np.float64) * TIME_SCALE).astype(np.int64)
+        parts = [delta_encode(t_int).astype("<i8").tobytes()]
+        if scale is not None:
+            v_int = np.round(np.asarray(v, dtype=np.float64) * scale).astype(np.int64)
+            parts.append(delta_encode(v_int).astype("<i8").tobytes())
+        else:
+            parts.append(np.asarray(v, dtype="<f8").tobytes())
+        return b"".join(parts), scale
+
+    def write(self, channel, t, v):
+        t = np.asarray(t, dtype=np.float64)
+        v = np.asarray(v, dtype=np.float64)
+        for i in range(0, len(t), self.chunk_size):
+            tc, vc = t[i:i + self.chunk_size], v[i:i + self.chunk_size]
+            raw, scale = self._encode(channel, tc, vc)
+            data = self._compress(raw, self.level)
+            offset = self._f.tell()
+            self._f.write(data)
+            self.raw_bytes += tc.nbytes + vc.nbytes
+            self.index.append({
+                "channel": channel, "count": len(tc),
+                "t_min": float(tc[0]), "t_max": float(tc[-1]),
+                "v_min": float(vc.min()), "v_max": float(vc.max()),
+                "offset": offset, "length": len(data), "scale": scale,
+            })
+
+    def close(self):
+        index_offset = self._f.tell()
+        self._f.write(json.dumps({"codec": self.codec, "time_scale": TIME_SCALE,
+                                  "chunks": self.index}).encode())
+        self._f.write(struct.pack("<Q", index_offset))
+        self._f.write(MAGIC)
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ArchiveReader:
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, "rb")
+        if self._f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} no es un archivo de telemetría")
+        self._f.seek(-(8 + len(MAGIC)), os.SEEK_END)
+        index_offset, = struct.unpack("<Q", self._f.read(8))
+        if self._f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} está incompleto (falta el índice)")
+        end = self._f.tell() - 8 - len(MAGIC)
+        self._f.seek(index_offset)
+        header = json.loads(self._f.read(end - index_offset))
+        self.codec = header["codec"]
+        self.time_scale = header["time_scale"]
+        self.index = header["chunks"]
+        self._decompress = CODECS[self.codec][1]
+        self.chunks_read = 0
+
+    def channels(self):
+        return sorted({c["channel"] for c in self.index})
+
+    def _decode(self, entry):
+        self._f.seek(entry["offset"])
+        raw = self._decompress(self._f.read(entry["length"]))
+        n = entry["count"]
+        t = delta_decode(np.frombuffer(raw, dtype="<i8", count=n)) / self.time_scale
+        if entry["scale"] is not None:
+            v = delta_decode(np.frombuffer(raw, dtype="<i8", count=n, offset=8 * n)) / entry["scale"]
+        else:
+            v = np.frombuffer(raw, dtype="<f8", count=n, offset=8 * n).copy()
+        self.chunks_read += 1
+        return t, v
+
+    def read(self, channel, t0=None, t1=None):
+        """(instantes, valores) del canal en [t0, t1]; solo se descomprimen los chunks que lo tocan"""
+        ts, vs = [], []
+        for entry in self.index:
+            if entry["channel"] != channel:
+                continue
+            if (t0 is not None and entry["t_max"] < t0) or (t1 is not None and entry["t_min"] > t1):
+                continue
+            t, v = self._decode(entry)
+            i0 = 0 if t0 is None else np.searchsorted(t, t0, side="left")
+            i1 = len(t) if t1 is None else np.searchsorted(t, t1, side="right")
+            ts.append(t[i0:i1])
+            vs.append(v[i0:i1])
+        if not ts:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(ts), np.concatenate(vs)
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def archive_recording(session_path, out_path, codec="zlib", level=6, chunk_size=4096):
+    """
+    Comprime una sesión de Recorder entera; devuelve (bytes en bruto, bytes comprimidos).
+    Se recorre segmento a segmento y chunk a chunk sobre los memmap, así que en
+    memoria solo hay un chunk aunque la sesión dure días (el último chunk de cada
+    segmento puede quedar más corto).
+    """
+    reader = RecordingReader(session_path)
+    with ArchiveWriter(out_path, codec=codec, level=level, chunk_size=chunk_size) as writer:
+        for channel in reader.channels():
+            for seg in reader.segments():
+                t, v = reader.segment_arrays(seg, channel)
+                for i in range(0, len(t), chunk_size):
+                    writer.write(channel, t[i:i + chunk_size], v[i:i + chunk_size])
+    return writer.raw_bytes, os.path.getsize(out_path)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("Uso: python -m src.ground_station.archive grabaciones/<sesion> salida.gsa [zlib|lzma]")
+        return 1
+    codec = argv[2] if len(argv) > 2 else "zlib"
+    t0 = time.perf_counter()
+    raw, packed = archive_recording(argv[0], argv[1], codec=codec)
+    dt = time.perf_counter() - t0
+    ratio = raw / packed if packed else 0.0
+    print(f"{argv[1]}: {raw} -> {packed} bytes (x{ratio:.1f}, {codec}, {dt:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
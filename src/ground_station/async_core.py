@@ -0,0 +1,293 @@
+# async_core.py
+"""
+Núcleo asyncio opcional de la estación de tierra.
+
+Todo corre en un único event loop:
+  - el fd de cada puerto serie registrado con loop.add_reader (sin hilo lector)
+  - los comandos salen por una tarea escritora (cola asyncio)
+  - el registro de eventos se vuelca a disco por una tarea periódica
+  - los consumidores reciben los mensajes ya separados por colas asyncio
+
+La GUI Tk se engancha con TkBridge: el loop vive en un hilo y la GUI recoge
+los mensajes con window.after, sin tocar variables globales desde otro hilo.
+"""
+
+import asyncio
+import datetime
+import queue
+import threading
+import time
+
+from .capture import RX, TX
+from .serial_ingest import RateCounter
+from .stream_demux import StreamDemux
+
+
+def calc_checksum(msg):
+    xor_sum = 0
+    for ch in msg:
+        xor_sum ^= ord(ch)
+    return format(xor_sum, '02X')
+
+
+class AsyncSerialLink:
+    """Un puerto serie dentro del núcleo: su demux y sus estadísticas"""
+    def __init__(self, name, ser, publish, tap=None):
+        self.name = name
+        self.ser = ser
+        self.tap = tap
+        self.demux = StreamDemux(
+            on_protocol=lambda linea: publish("protocol", linea, self.name),
+            on_debug=lambda linea: publish("debug", linea, self.name),
+            on_frame=lambda frame: publish("frame", frame, self.name),
+        )
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.fd = None
+        self.alive = True
+        self.errors = 0
+        self.rate = RateCounter()
+
+    def on_readable(self):
+        n = self.ser.in_waiting
+        data = self.ser.read(n or 1)
+        if data:
+            self.bytes_in += len(data)
+            if self.tap is not None:
+                self.tap(self.name, RX, data)
+            self.rate.add(self.demux.feed(data), len(data))
+
+    @property
+    def lines_per_second(self):
+        return self.rate.lines_per_second
+
+
+class AsyncGroundStation:
+    def __init__(self, event_file="eventos.txt", flush_interval=1.0, poll_interval=0.01, tap=None):
+        self.event_file = event_file
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+        self.tap = tap  # tap(enlace, RX/TX, bytes): captura en bruto (CaptureWriter.tap)
+        self.loop = None
+        self.links = {}
+        self.subscribers = []
+        self._commands = None
+        self._pending_events = []
+        self._tasks = []
+
+    # --- mensajes entrantes ---
+    def subscribe(self, maxsize=0):
+        """Cola asyncio que recibe (tipo, dato, enlace, t) de todos los enlaces"""
+        q = asyncio.Queue(maxsize)
+        self.subscribers.append(q)
+        return q
+
+    def publish(self, kind, payload, link_name):
+        msg = (kind, payload, link_name, time.monotonic())
+        for q in self.subscribers:
+            try:
+                q.put_nowait(msg)
+            except asyncio.QueueFull:
+                pass
+
+    # --- enlaces ---
+    def add_link(self, name, ser):
+        link = AsyncSerialLink(name, ser, self.publish, self.tap)
+        self.links[name] = link
+        if self.loop is not None:
+            self._attach(link)
+        return link
+
+    def _attach(self, link):
+        try:
+            link.ser.timeout = 0  # lecturas no bloqueantes
+            link.fd = link.ser.fileno()
+            self.loop.add_reader(link.fd, self._on_readable, link)
+        except (AttributeError, OSError, NotImplementedError, ValueError):
+            # Sin fileno (Windows) o loop sin add_reader: sondeo ligero dentro del mismo loop
+            link.fd = None
+            self._tasks.append(self.loop.create_task(self._poll_link(link)))
+
+    def _on_readable(self, link):
+        try:
+            link.on_readable()
+        except OSError as e:
+            self._drop(link, e)
+
+    async def _poll_link(self, link):
+        while link.alive:
+            try:
+                if link.ser.in_waiting:
+                    link.on_readable()
+            except OSError as e:
+                self._drop(link, e)
+            except Exception as e:
+                print(f"Error leyendo serial ({link.name}):", e)
+            await asyncio.sleep(self.poll_interval)
+
+    def _drop(self, link, error):
+        """
+        Puerto caído (USB desenchufado...): fuera del loop y cerrado. Si el fd
+        siguiera registrado, add_reader lo daría por legible sin parar y el
+        loop se quedaría al 100 % llamando a un read que falla.
+        """
+        print(f"Error leyendo serial ({link.name}):", error)
+        link.errors += 1
+        link.alive = False
+        if link.fd is not None:
+            self.loop.remove_reader(link.fd)
+            link.fd = None
+        try:
+            link.ser.close()
+        except Exception:
+            pass
+
+    # --- comandos salientes ---
+    async def send(self, command, link_name=None):
+        await self._commands.put((command, link_name))
+
+    def send_nowait(self, command, link_name=None):
+        self._commands.put_nowait((command, link_name))
+
+    async def _writer(self):
+        while True:
+            command, link_name = await self._commands.get()
+            full_msg = f"{command}*{calc_checksum(command)}\n".encode()
+            targets = [self.links[link_name]] if link_name else list(self.links.values())
+            for link in targets:
+                if not link.alive:
+                    continue
+                try:
+                    link.ser.write(full_msg)
+                    link.bytes_out += len(full_msg)
+                    if self.tap is not None:
+                        self.tap(link.name, TX, full_msg)
+                except Exception as e:
+                    print(f"Error enviando serial ({link.name}):", e)
+            self.log_event("comando", command)
+
+    # --- registro de eventos ---
+    def log_event(self, tipo, detalles=""):
+        fecha_hora = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._pending_events.append(f"{fecha_hora}|{tipo}|{detalles}\n")
+
+    def flush_events(self):
+        if not self._pending_events:
+            return
+        lineas, self._pending_events = self._pending_events, []
+        try:
+            with open(self.event_file, "a", encoding="utf-8") as f:
+                f.writelines(lineas)
+        except Exception as e:
+            print("Error registrando evento:", e)
+
+    async def _event_flusher(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush_events()
+
+    # --- tareas periódicas ---
+    def every(self, interval, func):
+        """Llama a func() cada `interval` segundos dentro del loop"""
+        async def _periodic():
+            while True:
+                try:
+                    func()
+                except Exception as e:
+                    print("Error en tarea periódica:", e)
+                await asyncio.sleep(interval)
+        task = self.loop.create_task(_periodic())
+        self._tasks.append(task)
+        return task
+
+    # --- ciclo de vida ---
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self._commands = asyncio.Queue()
+        self._tasks.append(self.loop.create_task(self._writer()))
+        self._tasks.append(self.loop.create_task(self._event_flusher()))
+        for link in self.links.values():
+            self._attach(link)
+
+    def stop(self):
+        for link in self.links.values():
+            if link.fd is not None:
+                self.loop.remove_reader(link.fd)
+                link.fd = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self.flush_events()
+
+
+class TkBridge:
+    """
+    Puente mínimo entre el núcleo asyncio (en su hilo) y Tk (hilo principal).
+    handler(tipo, dato, enlace) se ejecuta siempre en el hilo de Tk.
+    """
+    def __init__(self, core, window, handler, poll_ms=20, max_batch=500, start_timeout=5.0):
+        self.core = core
+        self.window = window
+        self.handler = handler
+        self.poll_ms = poll_ms
+        self.max_batch = max_batch
+        self._inbox = queue.SimpleQueue()
+        self._ready = threading.Event()
+        self._error = None
+        self.start_timeout = start_timeout
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+
+    def start(self):
+        """Arranca el loop; si core.start() falla o no responde, la excepción salta aquí (hilo de Tk)"""
+        self.thread.start()
+        if not self._ready.wait(self.start_timeout):
+            raise TimeoutError(f"El núcleo asyncio no arrancó en {self.start_timeout} s")
+        if self._error is not None:
+            raise self._error
+        self.window.after(self.poll_ms, self._drain)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.core.start())
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+            self.loop.close()
+            return
+        inbox_q = self.core.subscribe()
+        self.loop.create_task(self._forward(inbox_q))
+        self._ready.set()
+        self.loop.run_forever()
+
+    async def _forward(self, q):
+        while True:
+            self._inbox.put(await q.get())
+
+    def _drain(self):
+        for _ in range(self.max_batch):
+            try:
+                kind, payload, link_name, _t = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self.handler(kind, payload, link_name)
+            except Exception as e:
+                print("Error procesando mensaje:", e)
+        self.window.after(self.poll_ms, self._drain)
+
+    def send(self, command, link_name=None):
+        self.loop.call_soon_threadsafe(self.core.send_nowait, command, link_name)
+
+    def log_event(self, tipo, detalles=""):
+        self.loop.call_soon_threadsafe(self.core.log_event, tipo, detalles)
+
+    def every(self, interval, func):
+        self.loop.call_soon_threadsafe(self.core.every, interval, func)
+
+    def stop(self):
+        def _stop():
+            self.core.stop()
+            self.loop.stop()
+        self.loop.call_soon_threadsafe(_stop)
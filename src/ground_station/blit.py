@@ -0,0 +1,88 @@
+# blit.py
+"""
+Redibujado con blitting para las gráficas en vivo.
+
+El fondo de la figura (ejes, rejilla, ticks, leyenda, color de fondo) se
+renderiza una vez y se guarda con copy_from_bbox. En cada refresco solo se
+restaura ese fondo y se pintan los artistas que cambian (las líneas), y se
+copia el resultado a la pantalla con blit.
+
+La caché se invalida sola: con cada draw_event (redimensionar, cambiar de
+pestaña, un draw() completo) y cuando cambian los límites de algún eje o el
+tamaño del canvas; en esos casos update() hace un draw() completo una vez.
+
+También vale para ejes 3D: el fondo (paneles, rejilla, superficies como la
+Tierra) se queda en caché mientras no cambien el ángulo de vista ni los
+límites, y los artistas 3D se reproyectan con la vista actual antes de pintarlos.
+"""
+
+import time
+
+
+class BlitManager:
+    def __init__(self, canvas, artists=()):
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self._background = None
+        self._artists = []
+        self._state = None
+        self.full_draws = 0
+        self.blits = 0
+        self.last_draw_time = 0.0
+        for artist in artists:
+            self.add_artist(artist)
+        self._cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+    def add_artist(self, artist):
+        if artist.figure is not self.figure:
+            raise ValueError("El artista no pertenece a esta figura")
+        artist.set_animated(True)  # fuera del draw() normal: solo lo pinta el blit
+        self._artists.append(artist)
+
+    @staticmethod
+    def _axes_state(ax):
+        state = (ax.get_xlim(), ax.get_ylim())
+        if hasattr(ax, "get_zlim"):  # Axes3D: también Z y el ángulo de vista
+            state += (ax.get_zlim(), ax.elev, ax.azim, getattr(ax, "roll", 0))
+        return state
+
+    def _view_state(self):
+        axes = {a.axes for a in self._artists if a.axes is not None}
+        lims = tuple(self._axes_state(ax) for ax in sorted(axes, key=id))
+        return lims, self.canvas.get_width_height()
+
+    def _on_draw(self, event):
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._state = self._view_state()
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self._artists:
+            project = getattr(artist, "do_3d_projection", None)
+            if project is not None:
+                project()  # los scatter 3D solo se proyectan dentro de Axes3D.draw
+            self.figure.draw_artist(artist)
+
+    def invalidate(self):
+        self._background = None
+
+    def update(self):
+        """Pinta el estado actual: blit si el fondo sigue valiendo, draw() completo si no"""
+        t0 = time.perf_counter()
+        if self._background is None or self._view_state() != self._state:
+            self.canvas.draw()  # dispara draw_event -> se vuelve a guardar el fondo
+            self.full_draws += 1
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_artists()
+            self.canvas.blit(self.figure.bbox)  # ya programa el repintado en Tk
+            self.blits += 1
+        # Sin flush_events(): en TkAgg es un update() que mete el bucle de Tk en
+        # mitad del refresco (botones y otros after sobre artistas a medio pintar)
+        self.last_draw_time = time.perf_counter() - t0
+        return self.last_draw_time
+
+    def close(self):
+        self.canvas.mpl_disconnect(self._cid)
@@ -0,0 +1,113 @@
+# bounds.py
+"""
+Límites de ejes incrementales.
+
+SlidingBounds lleva el mínimo y el máximo de las últimas muestras con dos deques
+monótonas: cada append cuesta O(1) amortizado y min/max son O(1), también
+cuando las muestras salen por el otro lado (capacidad del RingBuffer o
+ventana de tiempo). Así no hay que recorrer el historial en cada refresco.
+
+AxisLimits añade histéresis: los límites solo cambian cuando los datos se
+salen de la vista o cuando ocupan muy poco de ella (shrink), y al cambiar se
+deja un margen para no tener que moverlos otra vez con la muestra siguiente.
+Menos cambios de límites = más refrescos por blit y menos draw() completos.
+"""
+
+import math
+from collections import deque
+
+
+class SlidingBounds:
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self._seq = 0
+        self._min = deque()  # (seq, t, valor) con valores crecientes
+        self._max = deque()  # (seq, t, valor) con valores decrecientes
+
+    def __len__(self):
+        return len(self._max)  # muestras que aún pueden ser extremo, no todas las vivas
+
+    def append(self, value, t=None):
+        if math.isnan(value):
+            return
+        item = (self._seq, t, value)
+        self._seq += 1
+        while self._min and self._min[-1][2] >= value:
+            self._min.pop()
+        self._min.append(item)
+        while self._max and self._max[-1][2] <= value:
+            self._max.pop()
+        self._max.append(item)
+        if self.capacity is not None:
+            first = self._seq - self.capacity
+            while self._min[0][0] < first:
+                self._min.popleft()
+            while self._max[0][0] < first:
+                self._max.popleft()
+
+    def extend(self, values, times=None):
+        if times is None:
+            for v in values:
+                self.append(float(v))
+        else:
+            for v, t in zip(values, times):
+                self.append(float(v), float(t))
+
+    def retire_before(self, t):
+        """Olvida las muestras con instante < t (ventana de tiempo que avanza)"""
+        while self._min and self._min[0][1] < t:
+            self._min.popleft()
+        while self._max and self._max[0][1] < t:
+            self._max.popleft()
+
+    @property
+    def min(self):
+        return self._min[0][2] if self._min else None
+
+    @property
+    def max(self):
+        return self._max[0][2] if self._max else None
+
+    def clear(self):
+        self._min.clear()
+        self._max.clear()
+
+
+def combined(bounds):
+    """(min, max) de varios SlidingBounds, ignorando los vacíos; (None, None) si no hay datos"""
+    los = [b.min for b in bounds if b.min is not None]
+    his = [b.max for b in bounds if b.max is not None]
+    return (min(los), max(his)) if los else (None, None)
+
+
+class AxisLimits:
+    def __init__(self, lo, hi, margin=0.05, shrink=0.3, min_span=1.0, floor=None):
+        self.lo = lo
+        self.hi = hi
+        self.margin = margin      # fracción del rango de datos que se deja a cada lado
+        self.shrink = shrink      # se encoge si los datos ocupan menos que esto de la vista
+        self.min_span = min_span
+        self.floor = floor        # (lo, hi) que la vista siempre incluye
+        self.changes = 0
+
+    @property
+    def limits(self):
+        return self.lo, self.hi
+
+    def update(self, lo, hi):
+        """Devuelve True si los límites han cambiado"""
+        if lo is None or hi is None:
+            return False
+        span = max(hi - lo, self.min_span)
+        inside = lo >= self.lo and hi <= self.hi
+        if inside and span >= self.shrink * (self.hi - self.lo):
+            return False
+        pad = self.margin * span
+        new_lo, new_hi = lo - pad, hi + pad
+        if self.floor is not None:
+            new_lo, new_hi = min(new_lo, self.floor[0]), max(new_hi, self.floor[1])
+        if (new_lo, new_hi) == (self.lo, self.hi):
+            return False
+        self.lo, self.hi = new_lo, new_hi
+        self.changes += 1
+        return True
@@ -0,0 +1,286 @@
+# capture.py
+"""
+Captura en bruto de los enlaces serie (byte a byte, con instante y sentido).
+
+Va por debajo del decodificador: se guarda cada trozo leído del puerto (RX) y
+cada comando enviado (TX) tal cual, así que un fallo de parseo siempre se puede
+reproducir con los bytes exactos.
+
+Formato (.gscap):
+    MAGIC | u32 longitud + cabecera JSON | registro | registro | ...
+    registro = <d t (monotonic)> <B sentido> <B enlace> <I longitud> + datos
+Sentido: RX=0, TX=1, LINK=2 (declara el nombre del enlace con ese número).
+
+tap() solo hace deque.append; un hilo de fondo junta los registros y los
+escribe de una vez, como el Recorder.
+"""
+
+import bisect
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from collections import deque
+
+from .stream_demux import StreamDemux
+
+MAGIC = b"GSCAP1\n"
+RECORD = struct.Struct("<dBBI")
+RX = 0
+TX = 1
+LINK = 2
+
+
+class CaptureWriter:
+    def __init__(self, path, flush_interval=0.2, time_offset=None):
+        if time_offset is None:
+            time_offset = time.time() - time.monotonic()
+        self.path = path
+        self.flush_interval = flush_interval
+        self._pending = deque()
+        self._links = {}
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+        self._f = open(path, "wb")
+        header = json.dumps({"created": time.time(), "time_offset": time_offset}).encode()
+        self._f.write(MAGIC + struct.pack("<I", len(header)) + header)
+
+        self.records = 0
+        self.bytes_rx = 0
+        self.bytes_tx = 0
+
+    # --- productores (hilo lector, GUI) ---
+    def tap(self, link_name, direction, data, t=None):
+        if t is None:
+            t = time.monotonic()
+        self._pending.append((t, direction, link_name, bytes(data)))
+
+    def rx(self, link_name, data):
+        self.tap(link_name, RX, data)
+
+    def tx(self, link_name, data):
+        self.tap(link_name, TX, data)
+
+    # --- escritor ---
+    def _link_id(self, name, out):
+        link_id = self._links.get(name)
+        if link_id is None:
+            link_id = self._links[name] = len(self._links)
+            raw = str(name).encode()
+            out.append(RECORD.pack(0.0, LINK, link_id, len(raw)) + raw)
+        return link_id
+
+    def flush(self):
+        q = self._pending
+        n = len(q)
+        if not n:
+            return 0
+        out = []
+        for _ in range(n):
+            t, direction, link_name, data = q.popleft()
+            link_id = self._link_id(link_name, out)
+            out.append(RECORD.pack(t, direction, link_id, len(data)))
+            out.append(data)
+            if direction == RX:
+                self.bytes_rx += len(data)
+            else:
+                self.bytes_tx += len(data)
+        self._f.write(b"".join(out))
+        self._f.flush()
+        self.records += n
+        return n
+
+    def _run(self):
+        while self._running:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print("Error escribiendo captura:", e)
+        self.flush()
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        else:
+            self.flush()
+        self._f.close()
+
+    def stats(self):
+        return {"path": self.path, "records": self.records, "pending": len(self._pending),
+                "bytes_rx": self.bytes_rx, "bytes_tx": self.bytes_tx}
+
+
+class CaptureReader:
+    """Lee la captura registro a registro desde el fichero (no la carga entera)"""
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} no es una captura")
+            raw = f.read(4)
+            if len(raw) < 4:
+                raise ValueError(f"{path}: cabecera incompleta")
+            size, = struct.unpack("<I", raw)
+            self.header = json.loads(f.read(size))
+            self._start = f.tell()
+        self.links = {}
+
+    def _records(self, wanted=None, start=None):
+        """
+        (byte, t, sentido, enlace, longitud, datos) desde `start` (o el principio).
+        wanted(sentido, enlace) decide qué datos se leen; los demás se saltan con
+        seek (datos None). Los registros LINK siempre se leen.
+        """
+        with open(self.path, "rb") as f:
+            end = os.fstat(f.fileno()).st_size
+            f.seek(self._start if start is None else start)
+            while True:
+                offset = f.tell()
+                head = f.read(RECORD.size)
+                if len(head) < RECORD.size:
+                    return
+                t, direction, link_id, length = RECORD.unpack(head)
+                if direction == LINK or wanted is None or wanted(direction, link_id):
+                    chunk = f.read(length)
+                    if len(chunk) < length:
+                        return  # registro cortado al final
+                else:
+                    if f.tell() + length > end:
+                        return
+                    f.seek(length, os.SEEK_CUR)
+                    chunk = None
+                yield offset, t, direction, link_id, length, chunk
+
+    def __iter__(self):
+        """(t, sentido, enlace, datos); un registro cortado al final se ignora"""
+        for _, t, direction, link_id, _, chunk in self._records():
+            if direction == LINK:
+                self.links[link_id] = chunk.decode()
+                continue
+            yield t, direction, self.links.get(link_id, str(link_id)), chunk
+
+    def _link_ids(self):
+        """{nombre: número} de los enlaces, en el orden en que aparecieron (sin leer los datos)"""
+        return {chunk.decode(): link_id
+                for _, _, direction, link_id, _, chunk in self._records(wanted=lambda d, i: False)
+                if direction == LINK}
+
+    def link_names(self):
+        """Enlaces de la captura en el orden en que aparecieron (sin leer los datos)"""
+        return list(self._link_ids())
+
+    def _wanted(self, direction, link):
+        """Filtro de _records para un sentido y un enlace; None si el enlace no existe"""
+        if link is None:
+            return lambda d, i: d == direction
+        link_id = self._link_ids().get(link)
+        if link_id is None:
+            return None
+        return lambda d, i: d == direction and i == link_id
+
+    def index(self, direction=RX, link=None, every=256):
+        """
+        Una pasada solo por las cabeceras (los datos se saltan con seek):
+        primer y último instante, eventos, bytes y un índice disperso
+        [(instante, byte del registro)] cada `every` eventos para stream(t0=...).
+        """
+        info = {"t_start": None, "t_end": None, "events": 0, "bytes": 0, "index": []}
+        wanted = self._wanted(direction, link)
+        if wanted is None:
+            return info
+        for offset, t, d, link_id, length, _ in self._records(wanted=lambda d, i: False):
+            if d == LINK or not wanted(d, link_id):
+                continue
+            if info["events"] % every == 0:
+                info["index"].append((t, offset))
+            if info["t_start"] is None:
+                info["t_start"] = t
+            info["t_end"] = t
+            info["events"] += 1
+            info["bytes"] += length
+        return info
+
+    def stream(self, direction=RX, link=None, t0=None, index=None):
+        """
+        Generador de (instante, trozo) de un sentido y, opcionalmente, de un solo
+        enlace, leído del fichero según se pide. Con t0 empieza en el primer
+        evento con instante >= t0; con el índice de index() salta directamente
+        cerca de ahí en vez de recorrer la captura desde el principio.
+        Sin link se mezclan todos: no sirve para alimentar un único demux.
+        """
+        wanted = self._wanted(direction, link)
+        if wanted is None:
+            return
+        start = None
+        if t0 is not None and index:
+            k = bisect.bisect_left([t for t, _ in index], t0) - 1
+            if k >= 0:
+                start = index[k][1]
+        for _, t, d, link_id, _, chunk in self._records(wanted=wanted, start=start):
+            if d == LINK or not wanted(d, link_id):
+                continue
+            if t0 is not None and t < t0:
+                continue
+            yield t, chunk
+
+
+def capture_stats(path):
+    """
+    Por enlace: bytes RX/TX y lo que saca el demux de los bytes RX (con su
+    velocidad). Una pasada por el fichero; cada trozo se decodifica y se suelta.
+    """
+    per_link = {}
+    for t, direction, name, chunk in CaptureReader(path):
+        st = per_link.get(name)
+        if st is None:
+            st = per_link[name] = {"demux": StreamDemux(), "bytes_rx": 0, "bytes_tx": 0,
+                                   "commands": 0, "decode_time": 0.0}
+        if direction == RX:
+            t0 = time.perf_counter()
+            st["demux"].feed(chunk)
+            st["decode_time"] += time.perf_counter() - t0
+            st["bytes_rx"] += len(chunk)
+        else:
+            st["bytes_tx"] += len(chunk)
+            st["commands"] += 1
+    out = {}
+    for name, st in per_link.items():
+        res = st["demux"].stats()
+        res["bytes_rx"] = st["bytes_rx"]
+        res["bytes_tx"] = st["bytes_tx"]
+        res["commands"] = st["commands"]
+        dt = st["decode_time"]
+        res["decode_bytes_per_second"] = res["bytes_rx"] / dt if dt > 0 else float("inf")
+        out[name] = res
+    return out
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Uso: python -m src.ground_station.capture captura.gscap [...]")
+        return 1
+    for path in argv:
+        for name, st in capture_stats(path).items():
+            print(f"{path} [{name}]: RX {st['bytes_rx']} B, TX {st['bytes_tx']} B ({st['commands']} comandos) | "
+                  f"protocolo {st['protocol_lines']}, depuración {st['debug_lines']}, frames {st['frames']}, "
+                  f"descartados {st['discarded_bytes']} B | {st['decode_bytes_per_second'] / 1e6:.1f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
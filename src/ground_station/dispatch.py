@@ -0,0 +1,85 @@
+# dispatch.py
+"""
+Despacho de mensajes del protocolo por ID.
+
+La línea se clasifica por sus primeros bytes: si empieza por dígitos y ':'
+se busca el handler en un diccionario por ID (sin regex); solo los prefijos
+registrados ("Position:", "Panel:") pasan a su parser especializado.
+Cada handler lleva su propio contador de llamadas y tiempo acumulado.
+"""
+
+import time
+
+
+class Handler:
+    def __init__(self, func, name=None):
+        self.func = func
+        self.name = name or getattr(func, "__name__", repr(func))
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+
+    def __call__(self, arg):
+        t0 = time.perf_counter()
+        try:
+            return self.func(arg)
+        except Exception as e:
+            self.errors += 1
+            print("Parse error:", e)
+        finally:
+            self.calls += 1
+            self.total_time += time.perf_counter() - t0
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class MessageDispatcher:
+    def __init__(self):
+        self.by_id = {}       # "1" -> Handler(parts)
+        self.by_prefix = []   # [(b"Position:", Handler(linea))]
+        self.unhandled = 0
+
+    def register(self, msg_id, func, name=None):
+        """Handler para mensajes 'ID:...'; recibe linea.split(':')"""
+        handler = Handler(func, name)
+        self.by_id[str(msg_id)] = handler
+        return handler
+
+    def register_prefix(self, prefix, func, name=None):
+        """Handler para líneas que empiezan por `prefix`; recibe la línea completa"""
+        handler = Handler(func, name)
+        self.by_prefix.append((prefix, handler))
+        return handler
+
+    def dispatch(self, linea):
+        """Entrega la línea a su handler; devuelve False si nadie la atiende"""
+        if linea[:1].isdigit():
+            colon = linea.find(":")
+            if colon > 0:
+                handler = self.by_id.get(linea[:colon])
+                if handler is not None:
+                    handler(linea.split(":"))
+                    return True
+        else:
+            for prefix, handler in self.by_prefix:
+                if linea.startswith(prefix):
+                    handler(linea)
+                    return True
+        self.unhandled += 1
+        return False
+
+    def handlers(self):
+        return list(self.by_id.values()) + [h for _, h in self.by_prefix]
+
+    def report(self):
+        """Líneas de texto con los handlers ordenados por tiempo acumulado"""
+        out = []
+        for h in sorted(self.handlers(), key=lambda h: h.total_time, reverse=True):
+            if not h.calls:
+                continue
+            out.append(f"{h.name:<16} {h.calls:>8} llamadas {h.total_time*1000:>9.1f} ms "
+                       f"({h.mean_time*1e6:.0f} µs/llamada, {h.errors} errores)")
+        out.append(f"{'sin handler':<16} {self.unhandled:>8}")
+        return out
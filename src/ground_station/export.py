@@ -0,0 +1,198 @@
+# export.py
+"""
+Exportación de sesiones grabadas a CSV, pandas y Parquet por trozos.
+
+La sesión se recorre por ventanas de tiempo (chunk_seconds): los rangos de
+cada segmento se leen una vez al principio y cada ventana solo mapea (memmap +
+índice) los segmentos que la tocan; se escribe y se suelta, así que la memoria
+no depende de lo larga que sea la sesión.
+Formato "largo": una fila por muestra con columnas t (s de época), channel y
+value, ordenadas por t.
+
+pandas y pyarrow son opcionales: solo hacen falta para iter_dataframes y
+export_parquet. export_sessions exporta varias sesiones en paralelo con un
+ProcessPoolExecutor.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .recorder import RecordingReader
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+FORMATS = ("csv", "parquet")
+
+
+def segment_ranges(reader, channels=None):
+    """
+    [(segmento, {canal: (t_min, t_max)})] de toda la sesión, leído una sola vez:
+    de meta.json o, en grabaciones sin él, de la primera y última muestra.
+    """
+    out = []
+    for seg in reader.segments():
+        meta = reader.segment_meta(seg)
+        ranges = {}
+        for channel in channels or reader.channels():
+            info = meta["channels"].get(channel) if meta else None
+            if info is not None:
+                ranges[channel] = (info["t_min"], info["t_max"])
+            elif meta is None:
+                t, _ = reader.segment_arrays(seg, channel)
+                if len(t):
+                    ranges[channel] = (float(t[0]), float(t[-1]))
+        out.append((seg, ranges))
+    return out
+
+
+def session_time_range(reader, channels=None, ranges=None):
+    """(t_min, t_max) de la sesión, sacado de meta.json o de los extremos de cada canal"""
+    t_min, t_max = None, None
+    for _, seg_ranges in ranges if ranges is not None else segment_ranges(reader, channels):
+        for lo, hi in seg_ranges.values():
+            t_min = lo if t_min is None else min(t_min, lo)
+            t_max = hi if t_max is None else max(t_max, hi)
+    return t_min, t_max
+
+
+def _read_window(reader, ranges, channel, w, w_end):
+    """Como reader.read, pero solo abre los segmentos cuyo rango toca [w, w_end]"""
+    ts, vs = [], []
+    for seg, seg_ranges in ranges:
+        r = seg_ranges.get(channel)
+        if r is None or r[1] < w or r[0] > w_end:
+            continue
+        t, v = reader.segment_arrays(seg, channel, w, w_end)
+        i0 = np.searchsorted(t, w, side="left")
+        i1 = np.searchsorted(t, w_end, side="right")
+        if i1 > i0:
+            ts.append(t[i0:i1])
+            vs.append(v[i0:i1])
+    if len(ts) == 1:
+        return ts[0], vs[0]
+    if not ts:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(ts), np.concatenate(vs)
+
+
+def iter_chunks(session, t0=None, t1=None, chunk_seconds=600.0, channels=None):
+    """
+    Recorre la sesión por ventanas [w, w + chunk_seconds) y devuelve en cada una
+    (t, channel_idx, value, nombres) ya ordenado por t. Ventanas vacías se saltan.
+    Los rangos de cada segmento se leen una vez: cada ventana solo abre los
+    segmentos que la tocan, y una ventana vacía no abre ninguno.
+    """
+    reader = session if isinstance(session, RecordingReader) else RecordingReader(session)
+    names = list(channels or reader.channels())
+    ranges = segment_ranges(reader, names)
+    lo, hi = session_time_range(reader, names, ranges)
+    if lo is None:
+        return
+    lo = lo if t0 is None else max(lo, t0)
+    hi = hi if t1 is None else min(hi, t1)
+    w = lo
+    while w <= hi:
+        w_end = min(w + chunk_seconds, hi)
+        last = w_end >= hi
+        ts, cs, vs = [], [], []
+        for i, channel in enumerate(names):
+            t, v = _read_window(reader, ranges, channel, w, w_end)
+            if len(t) and not last:
+                # [w, w_end): la muestra justo en w_end va en la siguiente ventana
+                n = np.searchsorted(t, w_end, side="left")
+                t, v = t[:n], v[:n]
+            if len(t):
+                ts.append(np.asarray(t))
+                vs.append(np.asarray(v))
+                cs.append(np.full(len(t), i, dtype=np.int16))
+        if ts:
+            t = np.concatenate(ts)
+            order = np.argsort(t, kind="stable")
+            yield t[order], np.concatenate(cs)[order], np.concatenate(vs)[order], names
+        if last:
+            break
+        w = w_end
+
+
+def iter_dataframes(session, t0=None, t1=None, chunk_seconds=600.0, channels=None):
+    """Un DataFrame (t, channel, value) por ventana"""
+    if pd is None:
+        raise ImportError("pandas no está instalado (pip install pandas)")
+    for t, c, v, names in iter_chunks(session, t0, t1, chunk_seconds, channels):
+        yield pd.DataFrame({
+            "t": t,
+            "channel": pd.Categorical.from_codes(c, categories=names),
+            "value": v,
+        })
+
+
+def export_csv(session, out_path, t0=None, t1=None, chunk_seconds=600.0, channels=None):
+    """Escribe t,channel,value; devuelve el número de filas"""
+    rows = 0
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        f.write("t,channel,value\n")
+        for t, c, v, names in iter_chunks(session, t0, t1, chunk_seconds, channels):
+            f.writelines(f"{ti:.6f},{names[ci]},{vi!r}\n" for ti, ci, vi in zip(t.tolist(), c.tolist(), v.tolist()))
+            rows += len(t)
+    return rows
+
+
+def export_parquet(session, out_path, t0=None, t1=None, chunk_seconds=600.0, channels=None):
+    """Un row group por ventana; devuelve el número de filas"""
+    if pa is None:
+        raise ImportError("pyarrow no está instalado (pip install pyarrow)")
+    schema = pa.schema([("t", pa.float64()), ("channel", pa.dictionary(pa.int16(), pa.string())),
+                        ("value", pa.float64())])
+    rows = 0
+    with pq.ParquetWriter(out_path, schema) as writer:
+        for t, c, v, names in iter_chunks(session, t0, t1, chunk_seconds, channels):
+            channel = pa.DictionaryArray.from_arrays(pa.array(c, type=pa.int16()), pa.array(names))
+            writer.write_table(pa.table({"t": t, "channel": channel, "value": v}, schema=schema))
+            rows += len(t)
+    return rows
+
+
+def _export_one(args):
+    session, out_dir, fmt, t0, t1, chunk_seconds = args
+    name = os.path.basename(os.path.normpath(session))
+    out_path = os.path.join(out_dir, f"{name}.{fmt}")
+    export = export_csv if fmt == "csv" else export_parquet
+    return out_path, export(session, out_path, t0, t1, chunk_seconds)
+
+
+def export_sessions(sessions, out_dir, fmt="csv", t0=None, t1=None, chunk_seconds=600.0, workers=None):
+    """Exporta varias sesiones en paralelo (una por proceso); devuelve [(fichero, filas)]"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato desconocido: {fmt}")
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(s, out_dir, fmt, t0, t1, chunk_seconds) for s in sessions]
+    if workers == 1 or len(jobs) == 1:
+        return [_export_one(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_export_one, jobs))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 3 or argv[0] not in FORMATS:
+        print("Uso: python -m src.ground_station.export csv|parquet carpeta_salida grabaciones/<sesion> [...]")
+        return 1
+    for out_path, rows in export_sessions(argv[2:], argv[1], fmt=argv[0]):
+        print(f"{out_path}: {rows} filas")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# frame_batch.py
+"""
+Decodificación vectorizada (NumPy) de muchos frames 0xAA a la vez.
+
+Para backlogs grandes (GUI atascada, reproducción de capturas) decodificar
+frame a frame en Python es el cuello de botella. Aquí se interpreta el búfer
+con un dtype estructurado que replica el struct empaquetado del SAT y el
+checksum XOR de todos los frames se calcula en una sola reducción.
+
+Uso desde consola:
+    python -m src.ground_station.frame_batch captura.bin
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from .telemetry_frame import FRAME_HEADER, FRAME_SIZE
+
+# Espejo exacto de TelemetryFrame (#pragma pack(1), little-endian)
+FRAME_DTYPE = np.dtype([
+    ("header", "u1"),
+    ("humidity", "<u2"),
+    ("temperature", "<i2"),
+    ("temp_avg", "<u2"),
+    ("distance", "<u2"),
+    ("servo_angle", "u1"),
+    ("time_s", "<u2"),
+    ("x_b0", "u1"), ("x_b1", "u1"), ("x_b2", "u1"), ("x_b3", "u1"),
+    ("y_b0", "u1"), ("y_b1", "u1"), ("y_b2", "u1"), ("y_b3", "u1"),
+    ("z_b0", "u1"), ("z_b1", "u1"), ("z_b2", "u1"), ("z_b3", "u1"),
+    ("panel_state", "u1"),
+    ("checksum", "u1"),
+])
+assert FRAME_DTYPE.itemsize == FRAME_SIZE
+
+
+def _join_int32(rec, axis):
+    b0 = rec[axis + "_b0"].astype(np.uint32)
+    b1 = rec[axis + "_b1"].astype(np.uint32)
+    b2 = rec[axis + "_b2"].astype(np.uint32)
+    b3 = rec[axis + "_b3"].astype(np.uint32)
+    return (b0 | (b1 << 8) | (b2 << 16) | (b3 << 24)).view(np.int32)
+
+
+def frame_columns(rec):
+    """Columnas escaladas (mismos nombres que TelemetryFrame) a partir de registros FRAME_DTYPE"""
+    return {
+        "hum": rec["humidity"] / 100.0,
+        "temp": rec["temperature"] / 100.0,
+        "temp_avg": rec["temp_avg"] / 100.0,
+        "distance": rec["distance"].astype(np.int32),
+        "servo_angle": rec["servo_angle"].astype(np.int32),
+        "time_s": rec["time_s"].astype(np.int32),
+        "x": _join_int32(rec, "x"),
+        "y": _join_int32(rec, "y"),
+        "z": _join_int32(rec, "z"),
+        "panel_state": rec["panel_state"].astype(np.int32),
+    }
+
+
+def checksum_ok(raw):
+    """raw: matriz (n, FRAME_SIZE) de uint8 -> máscara de header y checksum correctos"""
+    cs = np.bitwise_xor.reduce(raw[:, :FRAME_SIZE - 1], axis=1)
+    return (raw[:, 0] == FRAME_HEADER) & (cs == raw[:, FRAME_SIZE - 1])
+
+
+def decode_frames(buf):
+    """
+    Decodifica un búfer de frames consecutivos (alineados).
+    Devuelve (columnas, máscara de validez); los bytes sobrantes al final se ignoran.
+    """
+    n = len(buf) // FRAME_SIZE
+    raw = np.frombuffer(buf, dtype=np.uint8, count=n * FRAME_SIZE).reshape(n, FRAME_SIZE)
+    rec = raw.reshape(-1).view(FRAME_DTYPE)
+    return frame_columns(rec), checksum_ok(raw)
+
+
+def find_frames(buf):
+    """
+    Posiciones de los frames válidos en un flujo arbitrario (basura, texto,
+    frames partidos). Un candidato que solape con un frame ya aceptado se descarta.
+    """
+    data = np.frombuffer(buf, dtype=np.uint8)
+    if len(data) < FRAME_SIZE:
+        return np.empty(0, dtype=np.intp)
+    windows = np.lib.stride_tricks.sliding_window_view(data, FRAME_SIZE)
+    cand = np.flatnonzero(data[:len(data) - FRAME_SIZE + 1] == FRAME_HEADER)
+    cand = cand[checksum_ok(windows[cand])]
+    if len(cand) < 2 or np.all(np.diff(cand) >= FRAME_SIZE):
+        return cand
+    # Caso raro: candidatos solapados (un 0xAA dentro de otro frame que además cuadra)
+    keep = []
+    next_free = 0
+    for pos in cand.tolist():
+        if pos >= next_free:
+            keep.append(pos)
+            next_free = pos + FRAME_SIZE
+    return np.asarray(keep, dtype=np.intp)
+
+
+def decode_stream(buf):
+    """
+    Decodifica todos los frames válidos de un flujo sin alinear.
+    Devuelve (columnas, offsets, consumido): `consumido` es hasta dónde se puede
+    descartar el búfer sin perder un frame que aún esté llegando.
+    """
+    data = np.frombuffer(buf, dtype=np.uint8)
+    offsets = find_frames(buf)
+    raw = data[offsets[:, None] + np.arange(FRAME_SIZE)]
+    cols = frame_columns(raw.reshape(-1).view(FRAME_DTYPE))
+    tail = max(0, len(data) - FRAME_SIZE + 1)
+    if len(offsets):
+        tail = max(tail, int(offsets[-1]) + FRAME_SIZE)
+    return cols, offsets, tail
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Uso: python -m src.ground_station.frame_batch captura.bin [...]")
+        return 1
+    for path in argv:
+        with open(path, "rb") as f:
+            buf = f.read()
+        t0 = time.perf_counter()
+        cols, offsets, _ = decode_stream(buf)
+        dt = time.perf_counter() - t0
+        n = len(offsets)
+        rate = n / dt if dt > 0 else float("inf")
+        print(f"{path}: {n} frames válidos en {len(buf)} bytes ({dt*1000:.1f} ms, {rate:.0f} frames/s)")
+        if n:
+            print(f"   time_s {cols['time_s'][0]}..{cols['time_s'][-1]} | "
+                  f"temp {cols['temp'].min():.2f}..{cols['temp'].max():.2f} °C")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
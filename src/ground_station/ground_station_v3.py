@@ -1,6 +1,8 @@
 # estacion_tierra.py  (guardar con este nombre para evitar shadowing)
 
 # imports básicos
+import os
+import sys
 import serial
 import threading
 import time
@@ -16,6 +18,9 @@ matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from src.ground_station.serial_ingest import SerialIngest
+
 plot_active = True
 
 #Setup del serial
@@ -44,11 +49,15 @@ alarm_popup_open = False  # evita abrir múltiples popups simultáneos
 #Definimos la función read_serial que se encargara de leer los datos:
 def read_serial():
     global plot_active, alarm_flag, alarm_message
+    ingest = SerialIngest(usbSerial)  # lectura en bloque, sin sleeps por línea
+    pendientes = deque()
     while True:
-        linea = usbSerial.readline().decode('utf-8', errors='ignore').strip()
+        if not pendientes:
+            pendientes.extend(ingest.read_lines())
+            continue
+        linea = pendientes.popleft().decode('utf-8', errors='ignore').strip()
         
-        if not linea:#Si no hay nada espera.
-            time.sleep(0.01)
+        if not linea:
             continue
 
         # Intentamos parsear protocolo con código al inicio: "1:hum:temp", "2:dist", "3:"
@@ -109,7 +118,6 @@ def read_serial():
             alarm_message = "Error de sensor (mensaje antiguo 'e' recibido)."
             alarm_flag = True
             plot_active = False
-        time.sleep(0.01)
 
 
 # --- GUI: envolver en una función main() para evitar ejecutar en import ---
@@ -0,0 +1,140 @@
+# lod_pyramid.py
+"""
+Pirámide de niveles de detalle (min/max) para historiales largos.
+
+El nivel 0 son las muestras en bruto; cada nivel superior agrupa `factor`
+cubetas del anterior guardando el mínimo y el máximo (con su instante). Se
+mantiene al vuelo: cada muestra cuesta O(1) amortizado y nunca se vuelve a
+recorrer el historial. select(t0, t1, max_points) elige el nivel más fino que
+cubre el intervalo sin pasar de max_points vértices, así se puede pintar el
+último minuto, la última hora o las 24 h enteras con el mismo coste.
+"""
+
+import numpy as np
+
+from .ring_buffer import RingBuffer
+
+
+class _Level:
+    def __init__(self, capacity):
+        self.t = RingBuffer(capacity)       # inicio de cada cubeta (para buscar por tiempo)
+        self.tmin = RingBuffer(capacity)
+        self.vmin = RingBuffer(capacity)
+        self.tmax = RingBuffer(capacity)
+        self.vmax = RingBuffer(capacity)
+        self.pending = None                 # cubeta en curso: [t, tmin, vmin, tmax, vmax, n]
+
+    def __len__(self):
+        return len(self.t)
+
+    @property
+    def truncated(self):
+        """True si ya se han perdido cubetas antiguas por capacidad"""
+        return self.t.total > len(self.t)
+
+    def commit(self, bucket):
+        t, tmin, vmin, tmax, vmax, _ = bucket
+        self.t.append(t)
+        self.tmin.append(tmin)
+        self.vmin.append(vmin)
+        self.tmax.append(tmax)
+        self.vmax.append(vmax)
+
+
+class MinMaxPyramid:
+    def __init__(self, levels=6, factor=4, capacity=4096, raw_capacity=None):
+        if factor < 2:
+            raise ValueError("factor debe ser >= 2")
+        self.factor = factor
+        self.raw_t = RingBuffer(raw_capacity or capacity)
+        self.raw_v = RingBuffer(raw_capacity or capacity)
+        self.levels = [_Level(capacity) for _ in range(levels)]
+
+    def __len__(self):
+        return self.raw_v.total
+
+    def append(self, value, t):
+        self.raw_t.append(t)
+        self.raw_v.append(value)
+        self._push(0, [t, t, value, t, value, 1])
+
+    def _push(self, i, bucket):
+        while i < len(self.levels):
+            lvl = self.levels[i]
+            p = lvl.pending
+            if p is None:
+                lvl.pending = p = [bucket[0], bucket[1], bucket[2], bucket[3], bucket[4], 0]
+            else:
+                if bucket[2] < p[2]:
+                    p[1], p[2] = bucket[1], bucket[2]
+                if bucket[4] > p[4]:
+                    p[3], p[4] = bucket[3], bucket[4]
+            p[5] += 1
+            if p[5] < self.factor:
+                return
+            lvl.commit(p)
+            lvl.pending = None
+            bucket = p
+            i += 1
+
+    def bucket_size(self, level):
+        """Muestras en bruto por cubeta del nivel (0 = en bruto)"""
+        return self.factor ** level
+
+    def select(self, t0=None, t1=None, max_points=1000):
+        """
+        Vértices (t, v) para pintar [t0, t1] con como mucho ~max_points puntos y el
+        nivel usado. Los niveles min/max dan dos vértices por cubeta, en orden temporal.
+        """
+        t_raw = self.raw_t.view()
+        i0, i1 = self._bounds(t_raw, t0, t1)
+        covers = t0 is None or self.raw_v.total == len(self.raw_v) or (len(t_raw) and t_raw[0] <= t0)
+        if covers and i1 - i0 <= max_points:
+            return t_raw[i0:i1], self.raw_v.view()[i0:i1], 0
+        for k, lvl in enumerate(self.levels, start=1):
+            t = lvl.t.view()
+            i0, i1 = self._bounds(t, t0, t1)
+            tail = [p for p in self._tail(k) if t1 is None or p[0] <= t1]
+            n = i1 - i0 + len(tail)
+            covers = t0 is None or not lvl.truncated or (len(t) and t[0] <= t0)
+            if (covers and 2 * n <= max_points) or k == len(self.levels):
+                return self._envelope(lvl, i0, i1, tail) + (k,)
+        return t_raw[:0], self.raw_v.view()[:0], 0
+
+    def _tail(self, k):
+        """
+        Cubetas en curso que el nivel k aún no tiene: la suya y las de todos los
+        niveles inferiores (la del nivel 0 son las últimas muestras en bruto).
+        En orden temporal, de la más antigua a la más reciente.
+        """
+        return [lvl.pending for lvl in reversed(self.levels[:k]) if lvl.pending is not None]
+
+    @staticmethod
+    def _bounds(t, t0, t1):
+        i0 = 0 if t0 is None else int(np.searchsorted(t, t0, side="left"))
+        i1 = len(t) if t1 is None else int(np.searchsorted(t, t1, side="right"))
+        # La cubeta que empieza antes de t0 también tiene datos dentro del intervalo
+        if i0 > 0 and t0 is not None:
+            i0 -= 1
+        return i0, i1
+
+    @staticmethod
+    def _envelope(lvl, i0, i1, tail=()):
+        tmin = lvl.tmin.view()[i0:i1]
+        vmin = lvl.vmin.view()[i0:i1]
+        tmax = lvl.tmax.view()[i0:i1]
+        vmax = lvl.vmax.view()[i0:i1]
+        if tail:
+            tmin = np.append(tmin, [p[1] for p in tail])
+            vmin = np.append(vmin, [p[2] for p in tail])
+            tmax = np.append(tmax, [p[3] for p in tail])
+            vmax = np.append(vmax, [p[4] for p in tail])
+        n = len(tmin)
+        min_first = tmin <= tmax
+        t = np.empty(2 * n)
+        v = np.empty(2 * n)
+        t[0::2] = np.where(min_first, tmin, tmax)
+        v[0::2] = np.where(min_first, vmin, vmax)
+        t[1::2] = np.where(min_first, tmax, tmin)
+        v[1::2] = np.where(min_first, vmax, vmin)
+        return t, v
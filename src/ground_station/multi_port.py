@@ -0,0 +1,155 @@
+# multi_port.py
+"""
+Ingesta de varios enlaces serie (varias GS) en un solo proceso y un solo hilo.
+
+Cada enlace tiene su propio búfer, su separador de mensajes y sus
+estadísticas; todos entregan los mensajes a los mismos consumidores, que
+actualizan el estado compartido. Un selector espera sobre los fds de todos
+los puertos a la vez; los puertos sin fileno (COMx en Windows) se sondean.
+
+Un enlace solo se da de baja por errores del puerto (OSError, que incluye
+serial.SerialException). Los fallos de los consumidores se cuentan aparte y
+el enlace sigue leyendo.
+"""
+
+import selectors
+import threading
+import time
+
+from .serial_ingest import SerialIngest
+from .stream_demux import StreamDemux
+
+
+class SerialLink:
+    def __init__(self, name, ser, on_protocol=None, on_frame=None, on_debug=None, on_raw=None):
+        self.name = name
+        self.ser = ser
+        self.on_raw = on_raw
+        self.ingest = SerialIngest(ser, idle_timeout=0)
+        self.demux = StreamDemux(
+            on_protocol=(lambda linea: on_protocol(self, linea)) if on_protocol else None,
+            on_frame=(lambda frame: on_frame(self, frame)) if on_frame else None,
+            on_debug=(lambda linea: on_debug(self, linea)) if on_debug else None,
+        )
+        self.alive = True
+        self.errors = 0
+        self.callback_errors = 0
+        self.last_rx = None
+
+    def read(self):
+        data = self.ingest.read_chunk()  # solo esto puede tumbar el enlace
+        if data:
+            self.last_rx = time.monotonic()
+            if self.on_raw is not None:
+                try:
+                    self.on_raw(self, data)  # bytes tal cual, antes de decodificar (captura)
+                except Exception as e:
+                    self.callback_errors += 1
+                    print(f"Error en on_raw ({self.name}):", e)
+            self.ingest.count_lines(self.demux.feed(data))
+        return len(data)
+
+    @property
+    def lines_per_second(self):
+        return self.ingest.lines_per_second
+
+    def stats(self):
+        st = self.ingest.stats()
+        st.update(self.demux.stats())
+        st["errors"] = self.errors
+        st["callback_errors"] = self.callback_errors + self.demux.callback_errors
+        st["alive"] = self.alive
+        st["last_rx"] = self.last_rx
+        return st
+
+
+class MultiPortIngest:
+    """
+    on_protocol(link, linea), on_frame(link, frame), on_debug(link, linea) y
+    on_raw(link, bytes) se llaman siempre desde el hilo de ingesta.
+    """
+    def __init__(self, on_protocol=None, on_frame=None, on_debug=None, on_raw=None, poll_interval=0.01):
+        self.on_protocol = on_protocol
+        self.on_frame = on_frame
+        self.on_debug = on_debug
+        self.on_raw = on_raw
+        self.poll_interval = poll_interval
+        self.links = []
+        self._selector = selectors.DefaultSelector()
+        self._selected = 0
+        self._polled = []
+        self._running = False
+        self._thread = None
+
+    def add_link(self, name, ser):
+        link = SerialLink(name, ser, self.on_protocol, self.on_frame, self.on_debug, self.on_raw)
+        self.links.append(link)
+        fd = link.ingest.fd
+        if fd is not None:
+            try:
+                self._selector.register(fd, selectors.EVENT_READ, link)
+                self._selected += 1
+                return link
+            except (OSError, ValueError):
+                pass
+        self._polled.append(link)
+        return link
+
+    def _drop(self, link, error):
+        print(f"Error leyendo serial ({link.name}):", error)
+        link.errors += 1
+        link.alive = False
+        if link in self._polled:
+            self._polled.remove(link)
+        else:
+            try:
+                self._selector.unregister(link.ingest.fd)
+                self._selected -= 1
+            except (KeyError, ValueError):
+                pass
+
+    def poll_once(self, timeout=0.5):
+        """Atiende todos los enlaces con datos; bloquea hasta `timeout` si no hay nada"""
+        got = 0
+        if not self._selected and len(self._polled) == 1:
+            # Un único puerto sin fileno: su read bloqueante ya espera sin gastar CPU
+            link = self._polled[0]
+            try:
+                return link.read()
+            except OSError as e:
+                self._drop(link, e)
+                return 0
+        if self._selected:
+            wait = min(timeout, self.poll_interval) if self._polled else timeout
+            for key, _ in self._selector.select(wait):
+                link = key.data
+                try:
+                    got += link.read()
+                except OSError as e:
+                    self._drop(link, e)
+        for link in list(self._polled):
+            try:
+                if link.ser.in_waiting:
+                    got += link.read()
+            except OSError as e:
+                self._drop(link, e)
+        if not got and not self._selected:
+            # Solo puertos sin fileno: no hay nada sobre lo que bloquear
+            time.sleep(self.poll_interval)
+        return got
+
+    def run(self):
+        self._running = True
+        while self._running and any(link.alive for link in self.links):
+            self.poll_once()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._running = False
+
+    def stats(self):
+        return {link.name: link.stats() for link in self.links}
@@ -0,0 +1,282 @@
+# recorder.py
+"""
+Grabador de telemetría en binario, por columnas y solo-añadir.
+
+Estructura en disco:
+    <raiz>/<sesion>/session.json
+    <raiz>/<sesion>/seg_000000/<canal>.t   instantes (float64 little-endian, s de época)
+    <raiz>/<sesion>/seg_000000/<canal>.v   valores   (float64 little-endian)
+    <raiz>/<sesion>/seg_000000/<canal>.idx índice disperso: (instante, byte) cada index_every muestras
+    <raiz>/<sesion>/seg_000000/meta.json   rango de tiempos del segmento y min/max por canal
+
+record() solo hace deque.append (atómico con el GIL), así que el hilo lector
+nunca espera al disco. Un hilo de fondo vacía la cola cada flush_interval,
+agrupa por canal y escribe cada columna de una vez con ndarray.tofile. Los
+ficheros solo crecen, así que RecordingReader puede abrirlos con np.memmap
+(solo lectura) mientras se sigue grabando.
+
+Con el índice y meta.json, leer un intervalo cuesta una búsqueda binaria y
+una lectura pequeña: los segmentos fuera del intervalo (o del rango de
+valores pedido) ni se abren.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+COLUMN_DTYPE = np.dtype("<f8")
+INDEX_DTYPE = np.dtype([("t", "<f8"), ("offset", "<i8")])
+
+
+class Recorder:
+    def __init__(self, root="grabaciones", session=None, flush_interval=0.2,
+                 segment_seconds=3600, time_offset=None, index_every=1024):
+        if session is None:
+            session = time.strftime("%Y%m%d_%H%M%S")
+        # Los instantes llegan en time.monotonic(); en disco van como hora de época
+        if time_offset is None:
+            time_offset = time.time() - time.monotonic()
+        self.time_offset = time_offset
+        self.path = os.path.join(root, session)
+        self.flush_interval = flush_interval
+        self.segment_seconds = segment_seconds
+        self.index_every = index_every
+        self._meta = None
+        self._pending = deque()
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+        self._segment = -1
+        self._segment_start = None
+
+        self.recorded = 0
+        self.flushes = 0
+        self.bytes_written = 0
+        self.max_batch = 0
+
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, "session.json"), "w", encoding="utf-8") as f:
+            json.dump({"session": session, "created": time.time(), "time_offset": time_offset,
+                       "dtype": COLUMN_DTYPE.str, "index_every": index_every}, f)
+
+    # --- productor (hilo lector) ---
+    def record(self, channel, value, t):
+        self._pending.append((channel, value, t))
+
+    # --- escritor (hilo de fondo) ---
+    @property
+    def segment_path(self):
+        return os.path.join(self.path, f"seg_{self._segment:06d}")
+
+    def _rotate(self, t):
+        self._segment += 1
+        self._segment_start = t
+        self._meta = {"t_min": None, "t_max": None, "index_every": self.index_every, "channels": {}}
+        os.makedirs(self.segment_path, exist_ok=True)
+
+    def _index(self, seg, channel, t_arr, v_arr):
+        """Índice disperso y min/max del canal en el segmento actual"""
+        info = self._meta["channels"].get(channel)
+        if info is None:
+            info = self._meta["channels"][channel] = {
+                "count": 0, "t_min": float(t_arr[0]), "t_max": None, "v_min": None, "v_max": None}
+        first = info["count"]
+        k = np.arange(first, first + len(t_arr))
+        mask = k % self.index_every == 0
+        if mask.any():
+            entries = np.empty(int(mask.sum()), dtype=INDEX_DTYPE)
+            entries["t"] = t_arr[mask]
+            entries["offset"] = k[mask] * COLUMN_DTYPE.itemsize
+            with open(os.path.join(seg, channel + ".idx"), "ab") as f:
+                entries.tofile(f)
+        info["count"] = first + len(t_arr)
+        info["t_max"] = float(t_arr[-1])
+        vmin, vmax = float(np.nanmin(v_arr)), float(np.nanmax(v_arr))
+        info["v_min"] = vmin if info["v_min"] is None else min(info["v_min"], vmin)
+        info["v_max"] = vmax if info["v_max"] is None else max(info["v_max"], vmax)
+        meta = self._meta
+        meta["t_min"] = info["t_min"] if meta["t_min"] is None else min(meta["t_min"], info["t_min"])
+        meta["t_max"] = info["t_max"] if meta["t_max"] is None else max(meta["t_max"], info["t_max"])
+
+    def _write_meta(self, seg):
+        # Se reemplaza de golpe: un lector nunca ve un meta.json a medias
+        tmp = os.path.join(seg, "meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._meta, f)
+        os.replace(tmp, os.path.join(seg, "meta.json"))
+
+    def flush(self):
+        """Escribe todo lo pendiente; devuelve las muestras escritas"""
+        q = self._pending
+        n = len(q)
+        if not n:
+            return 0
+        batch = [q.popleft() for _ in range(n)]
+        columns = {}
+        for channel, value, t in batch:
+            col = columns.get(channel)
+            if col is None:
+                columns[channel] = col = ([], [])
+            col[0].append(t)
+            col[1].append(value)
+        t_first = batch[0][2] + self.time_offset
+        if self._segment < 0 or t_first - self._segment_start >= self.segment_seconds:
+            self._rotate(t_first)
+        seg = self.segment_path
+        for channel, (ts, vs) in columns.items():
+            t_arr = np.asarray(ts, dtype=COLUMN_DTYPE) + self.time_offset
+            v_arr = np.asarray(vs, dtype=COLUMN_DTYPE)
+            # Primero los instantes: un lector nunca ve un valor sin su instante
+            with open(os.path.join(seg, channel + ".t"), "ab") as f:
+                t_arr.tofile(f)
+            with open(os.path.join(seg, channel + ".v"), "ab") as f:
+                v_arr.tofile(f)
+            self.bytes_written += t_arr.nbytes + v_arr.nbytes
+            self._index(seg, channel, t_arr, v_arr)
+        self._write_meta(seg)
+        self.recorded += n
+        self.flushes += 1
+        self.max_batch = max(self.max_batch, n)
+        return n
+
+    def _run(self):
+        while self._running:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print("Error grabando telemetría:", e)
+        self.flush()
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        else:
+            self.flush()
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "recorded": self.recorded,
+            "pending": len(self._pending),
+            "flushes": self.flushes,
+            "bytes": self.bytes_written,
+            "max_batch": self.max_batch,
+        }
+
+
+class RecordingReader:
+    """Lectura de una sesión grabada con np.memmap (sin cargarla en memoria)"""
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "session.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.segments_read = 0
+        self.segments_skipped = 0
+
+    def segments(self):
+        return sorted(d for d in os.listdir(self.path)
+                      if d.startswith("seg_") and os.path.isdir(os.path.join(self.path, d)))
+
+    def channels(self):
+        names = set()
+        for seg in self.segments():
+            for fname in os.listdir(os.path.join(self.path, seg)):
+                if fname.endswith(".t"):
+                    names.add(fname[:-2])
+        return sorted(names)
+
+    def segment_meta(self, segment):
+        """meta.json del segmento, o None si no lo tiene (grabación antigua)"""
+        try:
+            with open(os.path.join(self.path, segment, "meta.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _count(fname):
+        return os.path.getsize(fname) // COLUMN_DTYPE.itemsize if os.path.exists(fname) else 0
+
+    @staticmethod
+    def _map(fname, start, stop):
+        if stop <= start:
+            return np.empty(0, dtype=COLUMN_DTYPE)
+        return np.memmap(fname, dtype=COLUMN_DTYPE, mode="r",
+                         offset=start * COLUMN_DTYPE.itemsize, shape=(stop - start,))
+
+    def segment_arrays(self, segment, channel, t0=None, t1=None):
+        """
+        (instantes, valores) del canal en un segmento como memmaps. Con t0/t1 el
+        índice disperso acota la zona y solo se mapea esa parte del fichero.
+        """
+        base = os.path.join(self.path, segment, channel)
+        n = min(self._count(base + ".t"), self._count(base + ".v"))  # la última escritura puede estar a medias
+        lo, hi = 0, n
+        if (t0 is not None or t1 is not None) and os.path.exists(base + ".idx"):
+            idx = np.fromfile(base + ".idx", dtype=INDEX_DTYPE)
+            if t0 is not None:
+                k = int(np.searchsorted(idx["t"], t0, side="left")) - 1
+                if k >= 0:
+                    lo = int(idx["offset"][k]) // COLUMN_DTYPE.itemsize
+            if t1 is not None:
+                k = int(np.searchsorted(idx["t"], t1, side="right"))
+                if k < len(idx):
+                    hi = min(n, int(idx["offset"][k]) // COLUMN_DTYPE.itemsize)
+        return self._map(base + ".t", lo, hi), self._map(base + ".v", lo, hi)
+
+    def _skip(self, meta, channel, t0, t1, vmin, vmax):
+        if meta is None:
+            return False
+        info = meta["channels"].get(channel)
+        if info is None:
+            return True
+        if t0 is not None and info["t_max"] < t0:
+            return True
+        if t1 is not None and info["t_min"] > t1:
+            return True
+        if vmin is not None and info["v_max"] < vmin:
+            return True
+        if vmax is not None and info["v_min"] > vmax:
+            return True
+        return False
+
+    def read(self, channel, t0=None, t1=None, vmin=None, vmax=None):
+        """
+        (instantes, valores) del canal en [t0, t1] de todos los segmentos. Los
+        segmentos cuyo rango de tiempos o de valores no toca [t0, t1] / [vmin, vmax]
+        se saltan sin abrirlos (los valores no se filtran muestra a muestra).
+        """
+        ts, vs = [], []
+        for seg in self.segments():
+            if self._skip(self.segment_meta(seg), channel, t0, t1, vmin, vmax):
+                self.segments_skipped += 1
+                continue
+            self.segments_read += 1
+            t, v = self.segment_arrays(seg, channel, t0, t1)
+            if not len(t):
+                continue
+            i0 = 0 if t0 is None else np.searchsorted(t, t0, side="left")
+            i1 = len(t) if t1 is None else np.searchsorted(t, t1, side="right")
+            if i1 > i0:
+                ts.append(t[i0:i1])
+                vs.append(v[i0:i1])
+        if len(ts) == 1:
+            return ts[0], vs[0]
+        if not ts:
+            return np.empty(0, dtype=COLUMN_DTYPE), np.empty(0, dtype=COLUMN_DTYPE)
+        return np.concatenate(ts), np.concatenate(vs)
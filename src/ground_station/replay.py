@@ -0,0 +1,283 @@
+# replay.py
+"""
+Reproducción de sesiones grabadas como si fueran un puerto serie.
+
+ReplaySource imita lo que usa la ingesta de serial.Serial (in_waiting, read,
+write, timeout, close), así que entra por el mismo camino que un puerto real:
+MultiPortIngest -> StreamDemux -> dispatcher -> handlers -> GUI. No tiene
+fileno(), por lo que la ingesta lo sondea igual que un COMx de Windows.
+
+Velocidad: 1.0 tiempo real, N veces más rápido, o 0/None lo más rápido
+posible (sirve de benchmark de todo el camino). seek(t) salta a un instante.
+
+Fuentes: una sesión del Recorder (muestras decodificadas, se reescriben como
+líneas del protocolo) o un enlace de una captura en bruto .gscap (los bytes
+exactos de ese puerto). Las dos se leen del disco según avanza la reproducción
+(segmento a segmento / registro a registro), así que la memoria no depende de
+lo larga que sea la sesión; seek() usa el índice de la captura o el de los
+segmentos para no recorrer lo anterior.
+"""
+
+import time
+
+import numpy as np
+
+from .capture import CaptureReader, RX
+from .export import segment_ranges, session_time_range
+from .recorder import RecordingReader
+
+
+class ReplaySource:
+    def __init__(self, times, chunks, speed=1.0, **kwargs):
+        """Eventos ya en memoria (trozos sueltos, pruebas); las grabaciones van por from_capture/from_recording"""
+        times = np.asarray(times, dtype=np.float64)
+        chunks = list(chunks)
+        if len(times) != len(chunks):
+            raise ValueError("times y chunks deben tener la misma longitud")
+        if len(times) > 1 and np.any(np.diff(times) < 0):
+            raise ValueError("Los instantes deben estar ordenados")
+
+        def open_events(t0):
+            i = 0 if t0 is None else int(np.searchsorted(times, t0, side="left"))
+            return zip(times[i:].tolist(), chunks[i:])
+
+        start, end = (float(times[0]), float(times[-1])) if len(times) else (0.0, 0.0)
+        self._setup(open_events, start, end, speed, **kwargs)
+
+    @classmethod
+    def from_events(cls, open_events, start_time, end_time, speed=1.0, **kwargs):
+        """
+        open_events(t0) -> iterador de (instante, bytes) desde el primer evento con
+        instante >= t0 (None: desde el principio). Se consume según se reproduce.
+        """
+        src = cls.__new__(cls)
+        src._setup(open_events, start_time, end_time, speed, **kwargs)
+        return src
+
+    def _setup(self, open_events, start_time, end_time, speed=1.0, timeout=0.1,
+               clock=time.monotonic, sleep=time.sleep, max_buffer=65536):
+        self._open = open_events
+        self._start_time = start_time
+        self._end_time = end_time
+        self.timeout = timeout
+        self.max_buffer = max_buffer  # bytes ya vencidos que se sacan del disco de una vez
+        self._clock = clock
+        self._sleep = sleep
+        self._buf = bytearray()
+        self.is_open = True
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.events_read = 0
+        self._started = None
+        self._finished = None
+        self._speed = speed or None
+        self._events = iter(open_events(None))
+        self._next = next(self._events, None)
+        self._last_t = start_time
+        self._rebase(start_time)
+
+    # --- reloj de reproducción ---
+    @property
+    def start_time(self):
+        return self._start_time
+
+    @property
+    def end_time(self):
+        return self._end_time
+
+    def _rebase(self, t):
+        self._base_t = t
+        self._base_clock = self._clock()
+
+    @property
+    def position(self):
+        """Instante de la grabación que se está reproduciendo"""
+        if self._speed is None:
+            return self._last_t
+        return self._base_t + (self._clock() - self._base_clock) * self._speed
+
+    @property
+    def speed(self):
+        return self._speed or 0
+
+    @speed.setter
+    def speed(self, value):
+        self._rebase(self.position)
+        self._speed = value or None
+
+    def seek(self, t):
+        """Salta al primer evento con instante >= t"""
+        self._events = iter(self._open(t))
+        self._next = next(self._events, None)
+        self._buf.clear()
+        self._finished = None
+        self._last_t = t
+        self._rebase(t)
+
+    # --- interfaz tipo serial.Serial ---
+    def _fill(self):
+        """Pasa al búfer los eventos que ya tocan (como mucho max_buffer bytes)"""
+        limit = None if self._speed is None else self.position
+        buf = self._buf
+        while self._next is not None and len(buf) < self.max_buffer:
+            t, data = self._next
+            if limit is not None and t > limit:
+                break
+            buf += data
+            self._last_t = t
+            self.events_read += 1
+            self._next = next(self._events, None)
+
+    @property
+    def in_waiting(self):
+        self._fill()
+        return len(self._buf)
+
+    @property
+    def eof(self):
+        return self._next is None and not self._buf
+
+    def read(self, size=1):
+        if self._started is None:
+            self._started = self._clock()
+        self._fill()
+        if not self._buf and not self.eof and self.timeout:
+            # Como un read bloqueante: espera al siguiente evento (como mucho timeout)
+            wait = (self._next[0] - self.position) / self._speed
+            self._sleep(min(max(wait, 0.0), self.timeout))
+            self._fill()
+        elif self.eof and self.timeout:
+            self._sleep(self.timeout)
+        data = bytes(self._buf[:size])
+        del self._buf[:size]
+        self.bytes_read += len(data)
+        if self.eof and self._finished is None:
+            self._finished = self._clock()
+        return data
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+    def stats(self):
+        elapsed = ((self._finished or self._clock()) - self._started) if self._started else 0.0
+        return {
+            "bytes_read": self.bytes_read,
+            "events": self.events_read,
+            "elapsed": elapsed,
+            "bytes_per_second": self.bytes_read / elapsed if elapsed > 0 else 0.0,
+            "eof": self.eof,
+        }
+
+    # --- construcción desde grabaciones ---
+    @classmethod
+    def from_capture(cls, path, link=None, **kwargs):
+        """
+        Captura en bruto (.gscap) -> los bytes RX de un enlace, troceados como se
+        leyeron. Un ReplaySource por enlace (mezclar lecturas parciales de varios
+        puertos en un demux corrompe las líneas); por defecto el primero capturado.
+        """
+        reader = CaptureReader(path)
+        names = reader.link_names()
+        if link is None:
+            if not names:
+                return cls([], [], **kwargs)
+            link = names[0]
+        elif link not in names:
+            raise ValueError(f"{path}: no hay ningún enlace '{link}' (hay {names})")
+        # Solo cabeceras: rango de tiempos e índice para seek; los datos se leen al reproducir
+        info = reader.index(RX, link)
+        if not info["events"]:
+            return cls([], [], **kwargs)
+        return cls.from_events(lambda t0: reader.stream(RX, link, t0, info["index"]),
+                               info["t_start"], info["t_end"], **kwargs)
+
+    @classmethod
+    def from_recording(cls, path, t0=None, t1=None, **kwargs):
+        """Sesión de Recorder -> líneas del protocolo de la GS con su instante original"""
+        reader = RecordingReader(path)
+        ranges = segment_ranges(reader)
+        lo, hi = session_time_range(reader, ranges=ranges)
+        if lo is None:
+            return cls([], [], **kwargs)
+        start = lo if t0 is None else max(lo, t0)
+        end = hi if t1 is None else min(hi, t1)
+
+        def open_events(t):
+            return recording_to_lines(reader, start if t is None else max(t, start), t1, ranges)
+
+        return cls.from_events(open_events, start, end, **kwargs)
+
+
+def _line(text):
+    return (text + "\n").encode()
+
+
+def recording_samples(reader, t0=None, t1=None, ranges=None):
+    """
+    (instante, canal, valor) de toda la sesión en orden de tiempo, segmento a
+    segmento: en memoria solo está la parte del segmento actual que toca [t0, t1].
+    """
+    if ranges is None:
+        ranges = segment_ranges(reader)
+    for seg, seg_ranges in ranges:
+        names, ts, vs = [], [], []
+        for channel, (lo, hi) in seg_ranges.items():
+            if (t0 is not None and hi < t0) or (t1 is not None and lo > t1):
+                continue
+            t, v = reader.segment_arrays(seg, channel, t0, t1)
+            i0 = 0 if t0 is None else np.searchsorted(t, t0, side="left")
+            i1 = len(t) if t1 is None else np.searchsorted(t, t1, side="right")
+            if i1 > i0:
+                names.append(channel)
+                ts.append(np.asarray(t[i0:i1]))
+                vs.append(np.asarray(v[i0:i1]))
+        if not ts:
+            continue
+        which = np.repeat(np.arange(len(names)), [len(t) for t in ts])
+        t_all = np.concatenate(ts)
+        v_all = np.concatenate(vs)
+        for i in np.argsort(t_all, kind="stable"):
+            yield float(t_all[i]), names[which[i]], float(v_all[i])
+
+
+def recording_to_lines(reader, t0=None, t1=None, ranges=None):
+    """
+    Generador de (instante, línea): vuelve a escribir las muestras grabadas
+    como las mandaría la GS; las que comparten instante se juntan
+    (temp+hum -> ID 1, x/y/z -> Position).
+    """
+    last = {"hum": 0.0, "temp": 0.0}
+
+    def emit(t, g):
+        if "temp" in g or "hum" in g:
+            last.update((k, g[k]) for k in ("temp", "hum") if k in g)
+            yield t, _line(f"1:{round(last['hum'] * 100)}:{round(last['temp'] * 100)}")
+        if "x" in g and "y" in g and "z" in g:
+            yield t, _line(f"Position: (X: {g['x']:.2f} m, Y: {g['y']:.2f} m, Z: {g['z']:.2f} m)")
+        # El ángulo antes que la distancia: el radar pinta cada distancia con el último ángulo
+        if "angle" in g:
+            yield t, _line(f"6:{int(g['angle'])}")
+        if "distance" in g:
+            yield t, _line(f"2:{int(g['distance'])}")
+        if "temp_med" in g:
+            yield t, _line(f"7:{round(g['temp_med'] * 100)}")
+        if "panel" in g:
+            yield t, _line(f"Panel:{int(g['panel'])}")
+
+    group_t = None
+    group = {}
+    for t, channel, value in recording_samples(reader, t0, t1, ranges):
+        if t != group_t and group:
+            yield from emit(group_t, group)
+            group = {}
+        group_t = t
+        group[channel] = value
+    if group:
+        yield from emit(group_t, group)
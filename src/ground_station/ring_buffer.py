@@ -0,0 +1,86 @@
+# ring_buffer.py
+"""
+Búfer circular de capacidad fija sobre un array NumPy.
+
+Cada valor se escribe dos veces (posición i e i+capacidad), así que los
+últimos N valores siempre están contiguos en memoria: view() devuelve una
+vista ordenada sin copiar, lista para set_data/set_ydata. append es O(1) y la
+memoria no crece por mucho que dure la sesión.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    def __init__(self, capacity, dtype=np.float64, fill=None):
+        if capacity <= 0:
+            raise ValueError("La capacidad debe ser > 0")
+        self.capacity = capacity
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros(2 * capacity, dtype=self.dtype)
+        self._head = 0      # siguiente posición a escribir (0..capacity-1)
+        self._count = 0
+        self.total = 0      # valores añadidos desde el principio (incluidos los ya retirados)
+        if fill is not None:
+            self._data[:] = fill
+            self._count = capacity
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        i = self._head
+        self._data[i] = value
+        self._data[i + self.capacity] = value
+        self._head = i + 1 if i + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+        self.total += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.dtype)
+        n = len(values)
+        if n == 0:
+            return
+        self.total += n
+        cap = self.capacity
+        if n >= cap:
+            values = values[-cap:]
+            self._data[:cap] = values
+            self._data[cap:] = values
+            self._head = 0
+            self._count = cap
+            return
+        idx = (self._head + np.arange(n)) % cap
+        self._data[idx] = values
+        self._data[idx + cap] = values
+        self._head = (self._head + n) % cap
+        self._count = min(self._count + n, cap)
+
+    def view(self):
+        """Vista ordenada (más antiguo -> más reciente) sin copia"""
+        start = self._head - self._count
+        if start < 0:
+            start += self.capacity
+        return self._data[start:start + self._count]
+
+    def last(self, n=None):
+        """Último valor, o vista con los últimos n"""
+        if n is None:
+            if not self._count:
+                raise IndexError("RingBuffer vacío")
+            i = self._head - 1
+            return self._data[i if i >= 0 else self.capacity - 1]
+        v = self.view()
+        return v[max(0, len(v) - n):]
+
+    def __getitem__(self, key):
+        return self.view()[key]
+
+    def __array__(self, dtype=None, copy=None):
+        v = self.view()
+        return v if dtype is None else v.astype(dtype)
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
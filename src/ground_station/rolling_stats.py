@@ -0,0 +1,141 @@
+# rolling_stats.py
+"""
+Estadísticas móviles en la GS, O(1) amortizado por muestra.
+
+RollingStats mantiene una ventana por número de muestras (window=N) o por
+tiempo (duration=s):
+  - media y varianza con Welford (al entrar y al salir cada muestra)
+  - mínimo y máximo con deques monótonas
+  - EWMA (no depende de la ventana)
+
+RollingStatsEngine se engancha a un TelemetryStore y publica los resultados
+como canales derivados ("temp.mean_60s", "temp.max_60s", ...) que se pueden
+pintar o vigilar como cualquier otro canal.
+"""
+
+import math
+from collections import deque
+
+STATS = ("mean", "min", "max", "var", "std", "ewma")
+
+
+class RollingStats:
+    def __init__(self, window=None, duration=None, ewma_alpha=0.1):
+        if window is None and duration is None:
+            raise ValueError("Hace falta window (muestras) o duration (segundos)")
+        self.window = window
+        self.duration = duration
+        self.ewma_alpha = ewma_alpha
+        self._items = deque()    # (seq, t, valor)
+        self._mins = deque()     # (seq, valor) con valores crecientes
+        self._maxs = deque()     # (seq, valor) con valores decrecientes
+        self._seq = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.ewma = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def update(self, value, t=0.0):
+        value = float(value)
+        seq = self._seq
+        self._seq += 1
+        self._items.append((seq, t, value))
+        n = len(self._items)
+        d = value - self._mean
+        self._mean += d / n
+        self._m2 += d * (value - self._mean)
+
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((seq, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((seq, value))
+
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            self.ewma += self.ewma_alpha * (value - self.ewma)
+
+        self._evict(t)
+
+    def _evict(self, t):
+        items = self._items
+        while items and ((self.window is not None and len(items) > self.window) or
+                         (self.duration is not None and t - items[0][1] > self.duration)):
+            seq, _, value = items.popleft()
+            n = len(items)
+            if n == 0:
+                self._mean = self._m2 = 0.0
+            else:
+                d = value - self._mean
+                self._mean -= d / n
+                self._m2 -= d * (value - self._mean)
+            if self._mins[0][0] == seq:
+                self._mins.popleft()
+            if self._maxs[0][0] == seq:
+                self._maxs.popleft()
+
+    @property
+    def mean(self):
+        return self._mean if self._items else math.nan
+
+    @property
+    def var(self):
+        n = len(self._items)
+        return max(self._m2, 0.0) / (n - 1) if n > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.var)
+
+    @property
+    def min(self):
+        return self._mins[0][1] if self._mins else math.nan
+
+    @property
+    def max(self):
+        return self._maxs[0][1] if self._maxs else math.nan
+
+    def values(self, stats=STATS):
+        return {name: getattr(self, name) for name in stats}
+
+
+class RollingStatsEngine:
+    """
+    Calcula estadísticas móviles de canales de un TelemetryStore y las escribe
+    de vuelta como canales derivados con el mismo instante que la muestra.
+    """
+    def __init__(self, store):
+        self.store = store
+        self._specs = {}   # canal -> [(prefijo, RollingStats, stats)]
+        store.subscribe(self._on_sample)
+
+    def add(self, channel, window=None, duration=None, stats=("mean", "min", "max", "std"),
+            ewma_alpha=0.1, label=None):
+        """Devuelve los nombres de los canales derivados que se publicarán"""
+        for name in stats:
+            if name not in STATS:
+                raise ValueError(f"Estadística desconocida: {name}")
+        if label is None:
+            label = f"{duration:g}s" if duration is not None else f"{window}n"
+        rs = RollingStats(window=window, duration=duration, ewma_alpha=ewma_alpha)
+        self._specs.setdefault(channel, []).append((label, rs, tuple(stats)))
+        derived = [f"{channel}.{name}_{label}" for name in stats]
+        for name in derived:
+            self.store.add_channel(name)
+        return derived
+
+    def _on_sample(self, channel, value, t):
+        specs = self._specs.get(channel)
+        if not specs:
+            return
+        for label, rs, stats in specs:
+            rs.update(value, t)
+            for name in stats:
+                self.store.append(f"{channel}.{name}_{label}", getattr(rs, name), t)
+
+    def stats(self, channel):
+        return {label: rs.values() for label, rs, _ in self._specs.get(channel, [])}
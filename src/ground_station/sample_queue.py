@@ -0,0 +1,97 @@
+# sample_queue.py
+"""
+Cola acotada entre la ingesta (hilo lector) y los consumidores (GUI).
+
+Políticas:
+  KEEP_ALL    se guardan todas las muestras; si se llena se descarta la más antigua
+  KEEP_LATEST solo la última muestra de cada canal (para enlaces muy rápidos)
+  DECIMATE    todas mientras haya hueco; por encima del umbral 1 de cada N por canal
+
+Con KEEP_ALL y DECIMATE el productor solo hace deque.append (atómico con el
+GIL), sin locks. Los contadores (high-water, descartes) dicen cuándo y cuánto
+se está degradando.
+"""
+
+import threading
+import time
+from collections import deque
+
+KEEP_ALL = "keep_all"
+KEEP_LATEST = "latest"
+DECIMATE = "decimate"
+
+
+class SampleQueue:
+    def __init__(self, capacity=4096, policy=KEEP_ALL, decimate_factor=4, decimate_above=0.5):
+        if policy not in (KEEP_ALL, KEEP_LATEST, DECIMATE):
+            raise ValueError(f"Política desconocida: {policy}")
+        self.capacity = capacity
+        self.policy = policy
+        self.decimate_factor = decimate_factor
+        self.decimate_threshold = int(capacity * decimate_above)
+        self._queue = deque(maxlen=capacity)
+        self._latest = {}
+        self._latest_lock = threading.Lock()
+        self._decimate_count = {}
+
+        self.pushed = 0
+        self.popped = 0
+        self.dropped = 0      # expulsadas por cola llena
+        self.coalesced = 0    # pisadas por otra más nueva (KEEP_LATEST)
+        self.decimated = 0    # saltadas por DECIMATE
+        self.high_water = 0
+
+    def put(self, channel, value, t=None):
+        if t is None:
+            t = time.monotonic()
+        self.pushed += 1
+        if self.policy == KEEP_LATEST:
+            with self._latest_lock:
+                if channel in self._latest:
+                    self.coalesced += 1
+                self._latest[channel] = (channel, value, t)
+                n = len(self._latest)
+        else:
+            q = self._queue
+            n = len(q)
+            if self.policy == DECIMATE and n >= self.decimate_threshold:
+                k = self._decimate_count.get(channel, 0)
+                self._decimate_count[channel] = k + 1
+                if k % self.decimate_factor:
+                    self.decimated += 1
+                    return
+            if n >= self.capacity:
+                self.dropped += 1
+            else:
+                n += 1
+            q.append((channel, value, t))
+        if n > self.high_water:
+            self.high_water = n
+
+    def drain(self, max_items=None):
+        """Devuelve las muestras pendientes en orden de llegada [(canal, valor, t)]"""
+        if self.policy == KEEP_LATEST:
+            with self._latest_lock:
+                items, self._latest = self._latest, {}
+            out = sorted(items.values(), key=lambda s: s[2])
+        else:
+            q = self._queue
+            n = len(q) if max_items is None else min(max_items, len(q))
+            out = [q.popleft() for _ in range(n)]
+        self.popped += len(out)
+        return out
+
+    def __len__(self):
+        return len(self._latest) if self.policy == KEEP_LATEST else len(self._queue)
+
+    def stats(self):
+        return {
+            "policy": self.policy,
+            "pending": len(self),
+            "pushed": self.pushed,
+            "popped": self.popped,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "decimated": self.decimated,
+            "high_water": self.high_water,
+        }
@@ -0,0 +1,217 @@
+# scheduler.py
+"""
+Planificador único de refrescos de la GUI.
+
+En vez de una cadena window.after por gráfica, cada panel se registra con su
+función de pintado y su intervalo mínimo. En cada tick se ejecutan primero los
+hooks (p.ej. vaciar la cola de muestras, que marca paneles como sucios) y
+después, en una sola pasada, solo los paneles sucios a los que ya les toca.
+
+Sin datos nuevos no se pinta nada y el tick se va espaciando (hasta
+max_idle_ms), así que con el enlace parado la GUI casi no gasta CPU.
+
+Gobernador (budget = fracción de CPU para pintar, p.ej. 0.5): se mide lo que
+tarda cada panel (media exponencial) y se reparte el presupuesto entre ellos.
+Los baratos se quedan en su intervalo; los caros se espacian lo justo (hasta
+max_interval) y vuelven solos a su ritmo cuando hay margen. Además cada tick
+pinta como mucho su parte del presupuesto y el siguiente se retrasa para que
+el bucle de Tk (botones, teclado) tenga siempre el resto del tiempo.
+"""
+
+import time
+
+
+class Panel:
+    def __init__(self, name, render, interval, is_dirty=None, max_interval=2.0):
+        self.name = name
+        self.render = render
+        self.interval = interval
+        self.base_interval = interval  # el que se pidió; el gobernador nunca baja de aquí
+        self.max_interval = max(max_interval, interval)
+        self.cost = None              # coste medio de pintado (s), media exponencial
+        self.is_dirty = is_dirty      # comprobación propia (opcional), además de mark_dirty
+        self.dirty = True             # la primera pasada siempre pinta
+        self.last_render = None
+        self.renders = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+
+    def due(self, now):
+        return self.last_render is None or now - self.last_render >= self.interval
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.renders if self.renders else 0.0
+
+
+class RenderScheduler:
+    def __init__(self, window, tick_ms=50, max_idle_ms=400, clock=time.perf_counter,
+                 budget=None, max_interval=2.0, cost_alpha=0.3):
+        if budget is not None and not 0 < budget <= 1:
+            raise ValueError("budget debe estar en (0, 1]")
+        self.window = window
+        self.tick_ms = tick_ms
+        self.max_idle_ms = max_idle_ms
+        self.clock = clock
+        self.budget = budget
+        self.max_interval = max_interval
+        self.cost_alpha = cost_alpha
+        self.last_tick_time = 0.0
+        self.panels = {}
+        self._hooks = []
+        self._delay = tick_ms
+        self._after_id = None
+        self._in_tick = False   # dentro de _run: solo _run vuelve a programar el siguiente tick
+        self._woken = False
+        self._stopped = False
+        self.ticks = 0
+        self.passes = 0
+        self.pending = 0   # paneles sucios que en el último tick aún no tocaban (o no cupieron)
+
+    def register(self, name, render, interval=0.1, is_dirty=None, max_interval=None):
+        panel = Panel(name, render, interval, is_dirty,
+                      self.max_interval if max_interval is None else max_interval)
+        self.panels[name] = panel
+        return panel
+
+    def unregister(self, name):
+        self.panels.pop(name, None)
+
+    def add_hook(self, func):
+        """func() al principio de cada tick, antes de pintar"""
+        self._hooks.append(func)
+
+    def mark_dirty(self, *names):
+        for name in names:
+            panel = self.panels.get(name)
+            if panel is not None:
+                panel.dirty = True
+
+    def tick(self):
+        """Una pasada: hooks y después los paneles sucios que ya tocan. Devuelve cuántos se pintaron"""
+        self.ticks += 1
+        for hook in self._hooks:
+            try:
+                hook()
+            except Exception as e:
+                print("Error en hook de refresco:", e)
+        now = self.clock()
+        rendered = 0
+        spent = 0.0
+        self.pending = 0
+        # Primero los que llevan más tiempo sin pintarse, por si el tick se queda sin presupuesto
+        due = []
+        for panel in self.panels.values():
+            if panel.due(now):
+                due.append(panel)
+            elif self._is_dirty(panel):
+                self.pending += 1
+        due.sort(key=lambda p: -1.0 if p.last_render is None else p.last_render)
+        for i, panel in enumerate(due):
+            if self.budget is not None and spent > 0 and spent >= self.tick_ms / 1000 * self.budget:
+                # El resto sigue sucio y va en el siguiente tick
+                self.pending += sum(1 for p in due[i:] if self._is_dirty(p))
+                break
+            if not self._is_dirty(panel):
+                continue
+            panel.dirty = False
+            t0 = self.clock()
+            try:
+                panel.render()
+            except Exception as e:
+                print(f"Error pintando {panel.name}:", e)
+            dt = self.clock() - t0
+            panel.last_render = now
+            panel.renders += 1
+            panel.total_time += dt
+            panel.last_time = dt
+            panel.cost = dt if panel.cost is None else panel.cost + self.cost_alpha * (dt - panel.cost)
+            spent += dt
+            rendered += 1
+        self.last_tick_time = spent
+        if rendered:
+            self.passes += 1
+            if self.budget is not None:
+                self._govern()
+        return rendered
+
+    @staticmethod
+    def _is_dirty(panel):
+        return panel.dirty or (panel.is_dirty is not None and panel.is_dirty())
+
+    def _govern(self):
+        """
+        Reparte el presupuesto: por orden de carga (coste / intervalo base),
+        cada panel se lleva lo que necesita si cabe en su parte del resto; si
+        no, su intervalo se alarga hasta que quepa.
+        """
+        tick = self.tick_ms / 1000  # un intervalo 0 significa "cada tick"
+        measured = sorted((p for p in self.panels.values() if p.cost is not None),
+                          key=lambda p: p.cost / max(p.base_interval, tick))
+        remaining = self.budget
+        left = len(measured)
+        for panel in measured:
+            share = remaining / left
+            need = panel.cost / max(panel.base_interval, tick)
+            if need <= share:
+                panel.interval = panel.base_interval
+            elif share <= 0:
+                panel.interval = panel.max_interval
+            else:
+                panel.interval = min(panel.cost / share, panel.max_interval)
+            remaining -= panel.cost / max(panel.interval, tick)
+            left -= 1
+
+    @property
+    def load(self):
+        """Fracción de CPU estimada para pintar con los intervalos actuales"""
+        tick = self.tick_ms / 1000
+        return sum(p.cost / max(p.interval, tick) for p in self.panels.values() if p.cost is not None)
+
+    def _run(self):
+        self._after_id = None  # el after que nos ha llamado ya no está pendiente
+        self._in_tick = True
+        try:
+            rendered = self.tick()
+        finally:
+            self._in_tick = False
+        if self._stopped:
+            return
+        # Sin nada sucio el siguiente tick se retrasa (x2 hasta max_idle_ms); si hay
+        # paneles sucios esperando su intervalo (o un wake() durante el tick) se
+        # sigue al ritmo normal
+        busy = rendered or self.pending or self._woken
+        self._woken = False
+        self._delay = self.tick_ms if busy else min(self._delay * 2, self.max_idle_ms)
+        delay = self._delay
+        if self.budget is not None and self.last_tick_time > 0:
+            # Tras un tick caro se deja libre al menos (1 - budget) del tiempo para la entrada
+            delay = max(delay, int(self.last_tick_time * 1000 * (1 - self.budget) / self.budget))
+        self._after_id = self.window.after(delay, self._run)
+
+    def start(self):
+        self._stopped = False
+        self._after_id = self.window.after(self.tick_ms, self._run)
+
+    def stop(self):
+        self._stopped = True  # si se para desde un panel, _run ya no reprograma
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+            self._after_id = None
+
+    def wake(self):
+        """Vuelve al tick normal enseguida (p.ej. tras una pulsación de botón)"""
+        self._delay = self.tick_ms
+        if self._in_tick:
+            # Llamado desde un panel o un evento atendido durante el tick: el after
+            # que disparó este tick ya no existe y _run programa el siguiente
+            self._woken = True
+        elif self._after_id is not None:
+            # El after pendiente puede ser de hasta max_idle_ms: se cambia por uno de tick_ms
+            self.window.after_cancel(self._after_id)
+            self._after_id = self.window.after(self.tick_ms, self._run)
+
+    def report(self):
+        return [f"{p.name}: {p.renders} refrescos, {p.mean_time * 1000:.1f} ms de media, "
+                f"cada {p.interval * 1000:.0f} ms (pedido {p.base_interval * 1000:.0f} ms)"
+                for p in self.panels.values()]
@@ -0,0 +1,181 @@
+# serial_ingest.py
+"""
+Lectura en bloque del puerto serie sin sleeps fijos.
+
+En lugar de hacer un readline() por mensaje y dormir 5-10 ms entre líneas,
+se vacía todo lo que haya en in_waiting de una vez sobre un bytearray y se
+separan las líneas completas. Cuando no llega nada se bloquea sobre el
+descriptor del puerto (select) o, si el puerto no tiene fileno (Windows),
+sobre un read(1) con el timeout del propio puerto.
+"""
+
+import select
+import time
+
+
+class RateCounter:
+    """
+    Mensajes y bytes por segundo en ventanas de `window` segundos.
+
+    add() la llama quien lee; lines_per_second/bytes_per_second se pueden
+    leer desde otro hilo: si el enlace se calla y nadie cierra la ventana, lo
+    pendiente se reparte sobre todo el tiempo transcurrido y la tasa cae a 0
+    en vez de quedarse con el último valor.
+    """
+    def __init__(self, window=1.0, clock=time.monotonic):
+        self.window = window
+        self.clock = clock
+        self._lines_rate = 0.0
+        self._bytes_rate = 0.0
+        self._t0 = clock()
+        self._lines = 0
+        self._bytes = 0
+
+    def add(self, lines=0, nbytes=0):
+        self._lines += lines
+        self._bytes += nbytes
+        self.update()
+
+    def update(self):
+        now = self.clock()
+        dt = now - self._t0
+        if dt >= self.window:
+            self._lines_rate = self._lines / dt
+            self._bytes_rate = self._bytes / dt
+            self._t0 = now
+            self._lines = 0
+            self._bytes = 0
+
+    def _rate(self, last, pending):
+        dt = self.clock() - self._t0
+        return last if dt < self.window else pending / dt
+
+    @property
+    def lines_per_second(self):
+        return self._rate(self._lines_rate, self._lines)
+
+    @property
+    def bytes_per_second(self):
+        return self._rate(self._bytes_rate, self._bytes)
+
+
+class SerialIngest:
+    def __init__(self, ser, idle_timeout=0.5, max_line=4096):
+        self.ser = ser
+        self.idle_timeout = idle_timeout
+        self.max_line = max_line
+        self.buffer = bytearray()
+
+        # Estadísticas
+        self.total_bytes = 0
+        self.total_lines = 0
+        self.overflows = 0
+        self.rate = RateCounter()
+
+        self._fd = self._get_fileno()
+
+    def _get_fileno(self):
+        try:
+            fd = self.ser.fileno()
+        except Exception:
+            return None
+        if not isinstance(fd, int) or fd < 0:
+            return None
+        return fd
+
+    @property
+    def fd(self):
+        """Descriptor del puerto (None si no se puede usar select sobre él)"""
+        return self._fd
+
+    def wait_readable(self, timeout=None):
+        """Bloquea hasta que el puerto tenga datos (o venza el timeout)"""
+        if self._fd is None:
+            return False
+        if timeout is None:
+            timeout = self.idle_timeout
+        try:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+        except (OSError, ValueError):
+            # fd no seleccionable: usamos el read bloqueante del puerto
+            self._fd = None
+            return False
+        return bool(readable)
+
+    def read_chunk(self):
+        """Lee todo lo disponible en el puerto; bloquea solo si no hay nada"""
+        data = self._read_available()
+        self.total_bytes += len(data)
+        self.rate.add(nbytes=len(data))
+        return data
+
+    def _read_available(self):
+        n = self.ser.in_waiting
+        if not n:
+            if self._fd is not None:
+                if not self.wait_readable():
+                    return b""
+                n = self.ser.in_waiting
+            if not n:
+                # Sin fileno (o select sin datos contados): read(1) bloquea con el timeout del puerto
+                data = self.ser.read(1)
+                if not data:
+                    return b""
+                n = self.ser.in_waiting
+                if n:
+                    data += self.ser.read(n)
+                return data
+        return self.ser.read(n)
+
+    def feed(self, data):
+        """Añade bytes al búfer y devuelve las líneas completas (bytes, sin \\r\\n)"""
+        if not data:
+            return []
+        buf = self.buffer
+        buf += data
+
+        end = buf.rfind(b"\n")
+        if end < 0:
+            if len(buf) > self.max_line:
+                # Basura sin fin de línea: descartamos para no crecer sin límite
+                self.overflows += 1
+                del buf[:]
+            return []
+
+        lines = bytes(buf[:end]).split(b"\n")
+        del buf[:end + 1]
+        lines = [ln.rstrip(b"\r") for ln in lines]
+        self.count_lines(len(lines))
+        return lines
+
+    def count_lines(self, n):
+        """Suma mensajes a la estadística (también si el troceado se hace fuera)"""
+        self.total_lines += n
+        self.rate.add(lines=n)
+
+    def read_lines(self):
+        """Una pasada de lectura: devuelve las líneas completas recibidas"""
+        return self.feed(self.read_chunk())
+
+    def iter_lines(self, encoding="utf-8"):
+        """Generador infinito de líneas ya decodificadas y sin espacios"""
+        while True:
+            for raw in self.read_lines():
+                yield raw.decode(encoding, errors="ignore").strip()
+
+    @property
+    def lines_per_second(self):
+        return self.rate.lines_per_second
+
+    @property
+    def bytes_per_second(self):
+        return self.rate.bytes_per_second
+
+    def stats(self):
+        return {
+            "lines": self.total_lines,
+            "bytes": self.total_bytes,
+            "overflows": self.overflows,
+            "lines_per_second": self.lines_per_second,
+            "bytes_per_second": self.bytes_per_second,
+        }
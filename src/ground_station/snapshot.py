@@ -0,0 +1,80 @@
+# snapshot.py
+"""
+Series con instantáneas inmutables para compartir datos entre el hilo lector
+y la GUI sin locks.
+
+El escritor añade filas en arrays NumPy preasignados y, cuando la fila está
+completa (X, Y y Z escritos), publica una tupla de vistas [inicio:fin] con una
+sola asignación de referencia (atómica con el GIL). El escritor nunca vuelve a
+escribir dentro de una zona ya publicada: al crecer o recortar copia a arrays
+nuevos, así que una instantánea que tenga la GUI no cambia bajo sus pies.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+
+class SnapshotSeries:
+    def __init__(self, columns, capacity=1024, max_len=None, dtype=np.float64):
+        self.columns = tuple(columns)
+        self.max_len = max_len
+        self.dtype = dtype
+        if max_len is not None:
+            capacity = max(capacity, 2 * max_len)
+        self._arrays = [np.empty(capacity, dtype=dtype) for _ in self.columns]
+        self._start = 0
+        self._end = 0
+        self.version = 0
+        self._snapshot_type = namedtuple("Snapshot", ("version",) + self.columns)
+        self._snapshot = self._snapshot_type(0, *(a[:0] for a in self._arrays))
+
+    @staticmethod
+    def _view(a, start, end):
+        v = a[start:end]
+        v.flags.writeable = False
+        return v
+
+    def __len__(self):
+        return self._end - self._start
+
+    def _make_room(self):
+        n = self._end - self._start
+        keep = n if self.max_len is None else min(n, self.max_len - 1)
+        capacity = len(self._arrays[0])
+        if self.max_len is None:
+            capacity *= 2
+        new_arrays = []
+        for a in self._arrays:
+            b = np.empty(capacity, dtype=self.dtype)
+            b[:keep] = a[self._end - keep:self._end]
+            new_arrays.append(b)
+        # Las vistas ya publicadas siguen apuntando a los arrays viejos
+        self._arrays = new_arrays
+        self._start = 0
+        self._end = keep
+
+    def append(self, *values):
+        """Añade una fila completa (un valor por columna) y la publica"""
+        if self._end == len(self._arrays[0]):
+            self._make_room()
+        end = self._end
+        for a, v in zip(self._arrays, values):
+            a[end] = v
+        end += 1
+        start = self._start
+        if self.max_len is not None and end - start > self.max_len:
+            start = end - self.max_len
+        self._start, self._end = start, end
+        self.version += 1
+        self._snapshot = self._snapshot_type(self.version, *(self._view(a, start, end) for a in self._arrays))
+
+    def snapshot(self):
+        """Última instantánea publicada: (version, col1, col2, ...) con vistas de solo lectura"""
+        return self._snapshot
+
+    def clear(self):
+        self._start = self._end = 0
+        self._arrays = [np.empty(len(a), dtype=self.dtype) for a in self._arrays]
+        self.version += 1
+        self._snapshot = self._snapshot_type(self.version, *(a[:0] for a in self._arrays))
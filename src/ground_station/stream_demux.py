@@ -0,0 +1,140 @@
+# stream_demux.py
+"""
+Separador del flujo USB de la GS en tres tipos de mensaje:
+
+  - línea de protocolo: "1:4500:2300", "99:3", "Position: (X: ...)", "Panel:60"
+  - línea de depuración: "GS listo", "ERROR: header inválido", " -> OK!", "TX: H=..."
+  - frame binario 0xAA (26 bytes, puede contener bytes '\\n')
+
+Cada tipo va a su propio consumidor. Un 0xAA solo se acepta como frame si el
+checksum cuadra; si no, ese byte se trata como texto. Los regex del protocolo
+nunca ven bytes binarios y un frame nunca se parte por un '\\n' interno.
+El separador es incremental: lo que quede a medias espera a la siguiente lectura.
+Un 0xAA cuyo principio ya no puede ser un frame (campos fuera de rango, p.ej.
+la 'ª' de un texto UTF-8) no retiene nada: se trata como texto enseguida.
+Si un consumidor lanza una excepción se cuenta (callback_errors) y se sigue con
+el mensaje siguiente: un fallo de parseo no para la ingesta ni repite bytes.
+"""
+
+from .telemetry_frame import FRAME_HEADER, FRAME_SIZE, decode_frame, plausible_prefix
+
+PROTOCOL_PREFIXES = (b"Position:", b"Panel:")
+
+
+def is_protocol_line(line):
+    """Clasificación por los primeros bytes: 'NN:' o los prefijos de órbita/panel"""
+    colon = line.find(b":", 0, 4)
+    if colon > 0 and line[:colon].isdigit():
+        return True
+    return line.startswith(PROTOCOL_PREFIXES)
+
+
+class StreamDemux:
+    def __init__(self, on_protocol=None, on_debug=None, on_frame=None, max_line=4096):
+        self.on_protocol = on_protocol
+        self.on_debug = on_debug
+        self.on_frame = on_frame
+        self.max_line = max_line
+        self.buffer = bytearray()
+
+        self.protocol_lines = 0
+        self.debug_lines = 0
+        self.frames = 0
+        self.discarded_bytes = 0
+        self.callback_errors = 0
+
+    def feed(self, data):
+        """Procesa los bytes nuevos; devuelve cuántos mensajes se han entregado"""
+        buf = self.buffer
+        buf += data
+        end = len(buf)
+        pos = 0
+        delivered = 0
+
+        try:
+            while pos < end:
+                if buf[pos] == FRAME_HEADER:
+                    if end - pos < FRAME_SIZE:
+                        if plausible_prefix(buf, pos, end):
+                            break  # posible frame a medias: esperamos más bytes
+                        frame = None
+                    else:
+                        frame = decode_frame(buf, pos)
+                    if frame is not None:
+                        pos += FRAME_SIZE
+                        self._emit_frame(frame)
+                        delivered += 1
+                        continue
+
+                nl = buf.find(b"\n", pos)
+                stop = nl if nl >= 0 else end
+
+                # ¿Empieza un frame antes del fin de línea? (texto de depuración sin '\n')
+                hdr = buf.find(FRAME_HEADER, pos + 1, stop)
+                waiting = False
+                while hdr >= 0:
+                    if end - hdr < FRAME_SIZE:
+                        if plausible_prefix(buf, hdr, end):
+                            waiting = True
+                            break
+                        hdr = buf.find(FRAME_HEADER, hdr + 1, stop)
+                        continue
+                    if decode_frame(buf, hdr) is not None:
+                        break
+                    hdr = buf.find(FRAME_HEADER, hdr + 1, stop)
+                if waiting:
+                    break
+                if hdr >= 0:
+                    raw, pos = bytes(buf[pos:hdr]), hdr
+                    delivered += self._emit_line(raw, partial=True)
+                    continue
+
+                if nl < 0:
+                    if end - pos > self.max_line:
+                        self.discarded_bytes += end - pos
+                        pos = end
+                    break
+
+                raw, pos = bytes(buf[pos:nl]), nl + 1
+                delivered += self._emit_line(raw)
+        finally:
+            # Lo ya entregado nunca se vuelve a procesar, pase lo que pase
+            if pos:
+                del buf[:pos]
+        return delivered
+
+    def _call(self, callback, arg):
+        try:
+            callback(arg)
+        except Exception as e:
+            self.callback_errors += 1
+            print("Error en consumidor del demux:", e)
+
+    def _emit_frame(self, frame):
+        self.frames += 1
+        if self.on_frame is not None:
+            self._call(self.on_frame, frame)
+
+    def _emit_line(self, raw, partial=False):
+        raw = raw.rstrip(b"\r")
+        if not raw.strip():
+            return 0
+        # Un trozo de texto cortado por un frame nunca es protocolo válido
+        if not partial and is_protocol_line(raw):
+            self.protocol_lines += 1
+            if self.on_protocol is not None:
+                self._call(self.on_protocol, raw.decode("utf-8", errors="ignore").strip())
+        else:
+            self.debug_lines += 1
+            if self.on_debug is not None:
+                self._call(self.on_debug, raw.decode("utf-8", errors="ignore").strip())
+        return 1
+
+    def stats(self):
+        return {
+            "protocol_lines": self.protocol_lines,
+            "debug_lines": self.debug_lines,
+            "frames": self.frames,
+            "discarded_bytes": self.discarded_bytes,
+            "callback_errors": self.callback_errors,
+        }
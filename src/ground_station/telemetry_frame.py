@@ -0,0 +1,140 @@
+# telemetry_frame.py
+"""
+Decodificador del frame binario de telemetría (0xAA) que envía el SAT.
+
+Layout (#pragma pack(1), little-endian), idéntico a Sat_keplerian_orbit.ino:
+  header(0xAA) hum×100 temp×100 tempAvg×100 distance servoAngle time_s
+  X(4 bytes) Y(4 bytes) Z(4 bytes) panelState checksum(XOR de los bytes anteriores)
+
+Los bytes x_b0..x_b3 del struct van en orden little-endian, así que se leen
+directamente como int32.
+"""
+
+import struct
+from collections import namedtuple
+
+FRAME_HEADER = 0xAA
+FRAME_STRUCT = struct.Struct("<BHhHHBHiiiBB")
+FRAME_SIZE = FRAME_STRUCT.size  # 26 bytes
+
+# Valores ya escalados (°C, %, m), igual que los que dejan prot1/prot7/prot_orbit/prot_solar
+TelemetryFrame = namedtuple(
+    "TelemetryFrame",
+    "hum temp temp_avg distance servo_angle time_s x y z panel_state"
+)
+
+_HEADER_BYTE = bytes([FRAME_HEADER])
+
+
+def frame_checksum(data):
+    """XOR de todos los bytes del frame salvo el último (checksum)"""
+    cs = 0
+    for b in memoryview(data)[:FRAME_SIZE - 1]:
+        cs ^= b
+    return cs
+
+
+def encode_frame(hum, temp, temp_avg, distance, servo_angle, time_s, x, y, z, panel_state):
+    """Construye un frame como lo haría el SAT (útil para pruebas y simulación)"""
+    raw = bytearray(FRAME_STRUCT.pack(
+        FRAME_HEADER,
+        int(round(hum * 100)), int(round(temp * 100)), int(round(temp_avg * 100)),
+        int(distance), int(servo_angle), int(time_s),
+        int(x), int(y), int(z), int(panel_state), 0
+    ))
+    raw[-1] = frame_checksum(raw)
+    return bytes(raw)
+
+
+def decode_frame(data, offset=0):
+    """Decodifica un frame completo; devuelve None si header o checksum no cuadran"""
+    fields = FRAME_STRUCT.unpack_from(data, offset)
+    if fields[0] != FRAME_HEADER:
+        return None
+    if frame_checksum(memoryview(data)[offset:offset + FRAME_SIZE]) != fields[11]:
+        return None
+    return TelemetryFrame(
+        fields[1] / 100.0, fields[2] / 100.0, fields[3] / 100.0,
+        fields[4], fields[5], fields[6],
+        fields[7], fields[8], fields[9], fields[10]
+    )
+
+
+# Rangos físicos de los campos que se pueden comprobar antes de tener el frame
+# entero: (bytes necesarios desde el header, índice en FRAME_STRUCT, mín, máx)
+_PREFIX_LIMITS = (
+    (3, 1, 0, 10000),      # hum×100 <= 100 %
+    (5, 2, -5000, 15000),  # temp×100 en [-50, 150] °C
+    (7, 3, 0, 15000),      # tempAvg×100
+    (10, 5, 0, 180),       # servoAngle
+    (25, 10, 0, 100),      # panelState
+)
+
+
+def plausible_prefix(data, offset=0, end=None):
+    """
+    ¿Pueden los bytes ya recibidos desde un 0xAA ser el principio de un frame?
+    Sin el checksum no hay certeza, pero un campo fuera de rango basta para
+    descartarlo y no quedarse esperando los 26 bytes.
+    """
+    if end is None:
+        end = len(data)
+    n = min(end - offset, FRAME_SIZE)
+    if n <= 0 or data[offset] != FRAME_HEADER:
+        return False
+    head = bytes(data[offset:offset + n]) + bytes(FRAME_SIZE - n)
+    fields = FRAME_STRUCT.unpack(head)
+    for needed, i, lo, hi in _PREFIX_LIMITS:
+        if n >= needed and not lo <= fields[i] <= hi:
+            return False
+    return True
+
+
+class FrameDecoder:
+    """
+    Decodificador incremental: se le pasan trozos de bytes con feed() y
+    devuelve los frames válidos. Ante basura o checksum erróneo descarta
+    bytes hasta el siguiente 0xAA (resincronización).
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+        self.frames_ok = 0
+        self.checksum_errors = 0
+        self.discarded_bytes = 0
+
+    def feed(self, data):
+        buf = self.buffer
+        buf += data
+        frames = []
+        pos = 0
+        end = len(buf)
+        while True:
+            start = buf.find(_HEADER_BYTE, pos)
+            if start < 0:
+                self.discarded_bytes += end - pos
+                pos = end
+                break
+            self.discarded_bytes += start - pos
+            pos = start
+            if end - pos < FRAME_SIZE:
+                break
+            frame = decode_frame(buf, pos)
+            if frame is None:
+                # 0xAA falso o frame corrupto: saltamos solo el header
+                self.checksum_errors += 1
+                self.discarded_bytes += 1
+                pos += 1
+                continue
+            frames.append(frame)
+            self.frames_ok += 1
+            pos += FRAME_SIZE
+        if pos:
+            del buf[:pos]
+        return frames
+
+    def stats(self):
+        return {
+            "frames_ok": self.frames_ok,
+            "checksum_errors": self.checksum_errors,
+            "discarded_bytes": self.discarded_bytes,
+        }
@@ -0,0 +1,116 @@
+# telemetry_store.py
+"""
+Almacén de telemetría: cada canal es una columna de valores más otra de
+instantes de captura (time.monotonic), ambas en RingBuffer.
+
+append es O(1), las vistas no copian y range(t0, t1) busca por tiempo con
+searchsorted (los instantes de un canal siempre crecen). Un solo escritor:
+en la GUI las muestras se vuelcan desde el hilo de Tk, que es también el que
+lee, así que no hacen falta locks.
+"""
+
+import time
+
+import numpy as np
+
+from .ring_buffer import RingBuffer
+
+
+class Channel:
+    def __init__(self, name, capacity, dtype=np.float64):
+        self.name = name
+        self.times = RingBuffer(capacity)
+        self.values = RingBuffer(capacity, dtype=dtype)
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def total(self):
+        """Muestras recibidas desde el principio (sirve de cursor)"""
+        return self.values.total
+
+    def append(self, value, t):
+        if len(self.times) and t < self.times.last():
+            t = self.times.last()  # nunca hacia atrás: range() depende de ello
+        self.times.append(t)
+        self.values.append(value)
+
+    def view(self):
+        """(instantes, valores) sin copia"""
+        return self.times.view(), self.values.view()
+
+    def latest(self, default=None):
+        if not len(self.values):
+            return default
+        return self.values.last()
+
+    def latest_time(self, default=None):
+        if not len(self.times):
+            return default
+        return self.times.last()
+
+    def range(self, t0=None, t1=None):
+        """Muestras con t0 <= t <= t1 (vistas sin copia)"""
+        t, v = self.view()
+        i0 = 0 if t0 is None else np.searchsorted(t, t0, side="left")
+        i1 = len(t) if t1 is None else np.searchsorted(t, t1, side="right")
+        return t[i0:i1], v[i0:i1]
+
+
+class TelemetryStore:
+    def __init__(self, capacity=4096, clock=time.monotonic):
+        self.capacity = capacity
+        self.clock = clock
+        self._channels = {}
+        self._listeners = []
+        self.version = 0
+
+    def add_channel(self, name, capacity=None, dtype=np.float64):
+        if name not in self._channels:
+            self._channels[name] = Channel(name, capacity or self.capacity, dtype)
+        return self._channels[name]
+
+    def channel(self, name):
+        return self._channels[name]
+
+    def __getitem__(self, name):
+        return self._channels[name]
+
+    def __contains__(self, name):
+        return name in self._channels
+
+    def channels(self):
+        return list(self._channels)
+
+    def subscribe(self, func):
+        """func(canal, valor, t) tras cada append"""
+        self._listeners.append(func)
+
+    def append(self, name, value, t=None):
+        if t is None:
+            t = self.clock()
+        ch = self._channels.get(name)
+        if ch is None:
+            ch = self.add_channel(name)
+        ch.append(value, t)
+        self.version += 1
+        for func in self._listeners:
+            func(name, value, t)
+
+    def latest(self, name, default=None):
+        ch = self._channels.get(name)
+        return default if ch is None else ch.latest(default)
+
+    def latest_time(self, name, default=None):
+        ch = self._channels.get(name)
+        return default if ch is None else ch.latest_time(default)
+
+    def view(self, name):
+        return self._channels[name].view()
+
+    def range(self, name, t0=None, t1=None):
+        return self._channels[name].range(t0, t1)
+
+    def stats(self):
+        return {name: {"len": len(ch), "total": ch.total} for name, ch in self._channels.items()}
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.archive import (ArchiveWriter, ArchiveReader, archive_recording,
+                                        delta_encode, delta_decode)
+from src.ground_station.recorder import Recorder, RecordingReader
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "a.gsa")
+        n = 20000
+        self.t = 1.7e9 + np.arange(n) * 0.2
+        self.temp = np.round(20 + 5 * np.sin(np.arange(n) / 500.0), 2)
+        self.noise = np.random.default_rng(0).normal(size=n)
+
+    def test_delta_roundtrip(self):
+        a = np.array([5, 7, 7, 3, 100], dtype=np.int64)
+        np.testing.assert_array_equal(delta_decode(delta_encode(a)), a)
+
+    def test_roundtrip_and_ratio(self):
+        for codec in ("zlib", "lzma"):
+            with ArchiveWriter(self.path, codec=codec, chunk_size=1000) as w:
+                w.write("temp", self.t, self.temp)
+                w.write("ruido", self.t, self.noise)
+            with ArchiveReader(self.path) as r:
+                self.assertEqual(r.channels(), ["ruido", "temp"])
+                t, v = r.read("temp")
+                np.testing.assert_allclose(t, self.t, atol=1e-6)
+                np.testing.assert_allclose(v, self.temp, atol=1e-9)
+                t, v = r.read("ruido")
+                np.testing.assert_array_equal(v, self.noise)
+            # Tiempos + temperatura: varias veces menos que en bruto (16 bytes por muestra)
+            with ArchiveWriter(self.path, codec=codec) as w:
+                w.write("temp", self.t, self.temp)
+            self.assertLess(os.path.getsize(self.path) * 4, w.raw_bytes)
+
+    def test_random_access(self):
+        with ArchiveWriter(self.path, chunk_size=1000) as w:
+            w.write("temp", self.t, self.temp)
+        with ArchiveReader(self.path) as r:
+            t0 = self.t[5500]
+            t, v = r.read("temp", t0, t0 + 100 * 0.2)
+            self.assertEqual(len(t), 101)
+            self.assertEqual(r.chunks_read, 1)
+            self.assertAlmostEqual(v[0], self.temp[5500])
+
+    def test_bad_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"nope" * 10)
+        with self.assertRaises(ValueError):
+            ArchiveReader(self.path)
+
+    def test_from_recording(self):
+        rec = Recorder(self.tmp.name, session="s", time_offset=0.0)
+        for i in range(3000):
+            rec.record("temp", 21.0 + (i % 7) / 100, i * 0.2)
+            rec.record("x", 7000000.0 + i * 7.5, i * 0.2)
+        rec.close()
+        raw, packed = archive_recording(rec.path, self.path)
+        self.assertGreater(raw / packed, 4)
+        with ArchiveReader(self.path) as r:
+            t, v = r.read("x")
+            self.assertAlmostEqual(v[-1], 7000000.0 + 2999 * 7.5)
+
+    def test_from_recording_by_segment(self):
+        rec = Recorder(self.tmp.name, session="seg", time_offset=0.0, segment_seconds=100)
+        for i in range(1000):
+            rec.record("temp", 20.0 + i / 100, i * 0.5)
+            if i % 50 == 49:
+                rec.flush()
+        rec.close()
+        self.assertGreater(len(RecordingReader(rec.path).segments()), 1)
+        archive_recording(rec.path, self.path, chunk_size=64)
+        with ArchiveReader(self.path) as r:
+            self.assertTrue(all(c["count"] <= 64 for c in r.index))
+            t, v = r.read("temp")
+        self.assertEqual(len(t), 1000)
+        np.testing.assert_allclose(v, 20.0 + np.arange(1000) / 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import asyncio
+import socket
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.async_core import AsyncGroundStation, TkBridge
+from src.ground_station.telemetry_frame import encode_frame
+
+
+class SocketSerial:
+    """Imita lo mínimo de serial.Serial sobre un extremo de socketpair"""
+    def __init__(self, sock):
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.timeout = 1
+
+    @property
+    def in_waiting(self):
+        return 0
+
+    def read(self, n=1):
+        try:
+            return self.sock.recv(max(n, 4096))
+        except BlockingIOError:
+            return b""
+
+    def write(self, data):
+        return self.sock.send(data)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+
+class TestAsyncGroundStation(unittest.TestCase):
+    def setUp(self):
+        self.gs_end, self.port_end = socket.socketpair()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.event_file = os.path.join(self.tmp.name, "eventos.txt")
+
+    def tearDown(self):
+        self.gs_end.close()
+        self.port_end.close()
+        self.tmp.cleanup()
+
+    def test_reader_writer_and_event_log(self):
+        async def scenario():
+            core = AsyncGroundStation(event_file=self.event_file, flush_interval=0.01)
+            core.add_link("GS1", SocketSerial(self.port_end))
+            await core.start()
+            inbox = core.subscribe()
+
+            self.gs_end.send(b"GS listo\r\n1:4500:2300\r\n" + encode_frame(45, 23, 22, 5, 90, 1, 1, 2, 3, 0))
+            msgs = [await asyncio.wait_for(inbox.get(), 1) for _ in range(3)]
+
+            await core.send("3:i")
+            await asyncio.sleep(0.05)
+            core.stop()
+            return msgs
+
+        msgs = asyncio.run(scenario())
+        self.assertEqual([m[0] for m in msgs], ["debug", "protocol", "frame"])
+        self.assertEqual(msgs[1][1], "1:4500:2300")
+        self.assertEqual(msgs[2][2], "GS1")
+        self.assertEqual(self.gs_end.recv(64), b"3:i*60\n")
+        with open(self.event_file, encoding="utf-8") as f:
+            self.assertIn("|comando|3:i", f.read())
+
+    def test_dead_port_is_dropped(self):
+        class UnpluggedSerial(SocketSerial):
+            reads = 0
+            closed = False
+
+            def read(self, n=1):
+                self.reads += 1
+                raise OSError("dispositivo desconectado")
+
+            def close(self):
+                self.closed = True
+
+        ser = UnpluggedSerial(self.port_end)
+
+        async def scenario():
+            core = AsyncGroundStation(event_file=self.event_file)
+            link = core.add_link("GS1", ser)
+            await core.start()
+            self.gs_end.send(b"1:4500:2300\n")  # el fd queda legible para siempre
+            await asyncio.sleep(0.1)
+            registered = core.loop.remove_reader(self.port_end.fileno())  # True si seguía registrado
+            core.stop()
+            return link, registered
+
+        link, registered = asyncio.run(scenario())
+        self.assertEqual(ser.reads, 1)
+        self.assertTrue(ser.closed)
+        self.assertFalse(link.alive)
+        self.assertEqual(link.errors, 1)
+        self.assertFalse(registered)
+
+
+class FailingCore:
+    async def start(self):
+        raise OSError("puerto ocupado")
+
+
+class HangingCore:
+    async def start(self):
+        await asyncio.sleep(10)
+
+
+class FakeWindow:
+    def __init__(self):
+        self.calls = []
+
+    def after(self, ms, func):
+        self.calls.append((ms, func))
+
+
+class TestTkBridge(unittest.TestCase):
+    def test_start_error_is_raised_in_caller(self):
+        window = FakeWindow()
+        bridge = TkBridge(FailingCore(), window, lambda *a: None)
+        with self.assertRaises(OSError):
+            bridge.start()
+        self.assertEqual(window.calls, [])
+
+    def test_start_timeout(self):
+        bridge = TkBridge(HangingCore(), FakeWindow(), lambda *a: None, start_timeout=0.05)
+        with self.assertRaises(TimeoutError):
+            bridge.start()
+
+
+if __name__ == '__main__':
+    unittest.main()
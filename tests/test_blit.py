@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from src.ground_station.blit import BlitManager
+
+
+class TestBlitManager(unittest.TestCase):
+    def setUp(self):
+        self.fig = Figure(figsize=(4, 3))
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 10)
+        self.line, = self.ax.plot([1, 2], [1, 2])
+        self.bm = BlitManager(self.canvas, [self.line])
+
+    def test_first_update_is_full_then_blit(self):
+        self.assertTrue(self.line.get_animated())
+        self.bm.update()
+        self.assertEqual((self.bm.full_draws, self.bm.blits), (1, 0))
+        for i in range(5):
+            self.line.set_data([0, i], [0, i])
+            self.bm.update()
+        self.assertEqual((self.bm.full_draws, self.bm.blits), (1, 5))
+
+    def test_limit_change_invalidates(self):
+        self.bm.update()
+        self.ax.set_xlim(0, 20)
+        self.bm.update()
+        self.assertEqual(self.bm.full_draws, 2)
+        self.bm.update()
+        self.assertEqual(self.bm.blits, 1)
+        self.bm.invalidate()
+        self.bm.update()
+        self.assertEqual(self.bm.full_draws, 3)
+
+    def test_resize_invalidates(self):
+        self.bm.update()
+        self.fig.set_size_inches(6, 4)
+        self.bm.update()
+        self.assertEqual(self.bm.full_draws, 2)
+
+    def test_foreign_artist(self):
+        other, = Figure().add_subplot().plot([0], [0])
+        with self.assertRaises(ValueError):
+            self.bm.add_artist(other)
+
+
+class TestBlit3D(unittest.TestCase):
+    def setUp(self):
+        import numpy as np
+        self.np = np
+        self.fig = Figure(figsize=(4, 3))
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(projection="3d")
+        u, v = np.meshgrid(np.linspace(0, 2 * np.pi, 20), np.linspace(0, np.pi, 10))
+        self.ax.plot_surface(np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v), alpha=0.3)
+        for set_lim in (self.ax.set_xlim, self.ax.set_ylim, self.ax.set_zlim):
+            set_lim(-2, 2)
+        self.line, = self.ax.plot([], [], [])
+        self.point = self.ax.scatter([], [], [], s=80)
+        self.bm = BlitManager(self.canvas, [self.line, self.point])
+
+    def set_orbit(self, n):
+        t = self.np.linspace(0, n / 10, n)
+        x, y, z = 1.5 * self.np.cos(t), 1.5 * self.np.sin(t), 0.5 * self.np.sin(t)
+        self.line.set_data(x, y)
+        self.line.set_3d_properties(z)
+        self.point._offsets3d = ([x[-1]], [y[-1]], [z[-1]])
+
+    def test_trajectory_updates_are_blits(self):
+        self.bm.update()
+        for n in range(5, 30, 5):
+            self.set_orbit(n)
+            self.bm.update()
+        self.assertEqual((self.bm.full_draws, self.bm.blits), (1, 5))
+
+    def test_view_angle_invalidates(self):
+        self.bm.update()
+        self.ax.view_init(elev=10, azim=45)
+        self.bm.update()
+        self.assertEqual(self.bm.full_draws, 2)
+        self.ax.set_zlim(-3, 3)
+        self.bm.update()
+        self.assertEqual(self.bm.full_draws, 3)
+
+    def test_blit_matches_full_draw(self):
+        self.bm.update()
+        self.set_orbit(25)
+        self.bm.update()
+        blitted = self.np.asarray(self.canvas.buffer_rgba()).copy()
+        self.bm.invalidate()
+        self.bm.update()
+        full = self.np.asarray(self.canvas.buffer_rgba())
+        self.assertEqual(self.bm.full_draws, 2)
+        self.assertTrue(self.np.array_equal(blitted, full))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+import math
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.bounds import SlidingBounds, AxisLimits, combined
+
+
+class TestSlidingBounds(unittest.TestCase):
+    def test_empty(self):
+        b = SlidingBounds(10)
+        self.assertIsNone(b.min)
+        self.assertIsNone(b.max)
+
+    def test_matches_brute_force_window(self):
+        rng = np.random.default_rng(1)
+        data = rng.normal(size=2000)
+        b = SlidingBounds(50)
+        for i, v in enumerate(data):
+            b.append(float(v))
+            window = data[max(0, i - 49):i + 1]
+            self.assertEqual(b.min, window.min())
+            self.assertEqual(b.max, window.max())
+
+    def test_deques_stay_small(self):
+        b = SlidingBounds(100)
+        for v in range(10000):
+            b.append(float(v % 37))
+        self.assertLessEqual(len(b), 100)
+
+    def test_retire_by_time(self):
+        b = SlidingBounds()
+        for t, v in enumerate([5.0, 1.0, 9.0, 3.0, 4.0]):
+            b.append(v, float(t))
+        self.assertEqual((b.min, b.max), (1.0, 9.0))
+        b.retire_before(2.0)
+        self.assertEqual((b.min, b.max), (3.0, 9.0))
+        b.retire_before(3.0)
+        self.assertEqual((b.min, b.max), (3.0, 4.0))
+        b.retire_before(10.0)
+        self.assertIsNone(b.min)
+
+    def test_nan_ignored(self):
+        b = SlidingBounds()
+        b.append(1.0)
+        b.append(math.nan)
+        self.assertEqual((b.min, b.max), (1.0, 1.0))
+
+    def test_extend_and_clear(self):
+        b = SlidingBounds()
+        b.extend(np.array([3, 1, 2]), np.array([0, 1, 2]))
+        self.assertEqual((b.min, b.max), (1.0, 3.0))
+        b.clear()
+        self.assertIsNone(b.max)
+
+    def test_combined(self):
+        a, b, c = SlidingBounds(), SlidingBounds(), SlidingBounds()
+        a.extend([1, 5])
+        b.extend([-2, 3])
+        self.assertEqual(combined([a, b, c]), (-2, 5))
+        self.assertEqual(combined([c]), (None, None))
+
+
+class TestAxisLimits(unittest.TestCase):
+    def test_no_change_inside_view(self):
+        lim = AxisLimits(0, 100)
+        self.assertFalse(lim.update(20, 80))
+        self.assertFalse(lim.update(None, None))
+        self.assertEqual(lim.limits, (0, 100))
+
+    def test_expands_with_margin(self):
+        lim = AxisLimits(0, 100, margin=0.05)
+        self.assertTrue(lim.update(0, 120))
+        self.assertAlmostEqual(lim.lo, -6.0)
+        self.assertAlmostEqual(lim.hi, 126.0)
+        # La siguiente muestra un poco más alta cabe en el margen: sin cambio
+        self.assertFalse(lim.update(0, 124))
+        self.assertEqual(lim.changes, 1)
+
+    def test_shrinks_when_data_is_small(self):
+        lim = AxisLimits(0, 100, margin=0.05, shrink=0.3)
+        self.assertFalse(lim.update(40, 75))
+        self.assertTrue(lim.update(20, 25))
+        self.assertAlmostEqual(lim.lo, 19.75)
+        self.assertAlmostEqual(lim.hi, 25.25)
+
+    def test_min_span(self):
+        lim = AxisLimits(0, 100, margin=0.5, min_span=2.0)
+        self.assertTrue(lim.update(10, 10))
+        self.assertEqual(lim.limits, (9.0, 11.0))
+
+    def test_floor(self):
+        lim = AxisLimits(-7e6, 7e6, margin=0.05, floor=(-7e6, 7e6))
+        self.assertFalse(lim.update(-1e6, 1e6))
+        self.assertTrue(lim.update(-8e6, 8e6))
+        self.assertAlmostEqual(lim.hi, 8.8e6)
+        self.assertTrue(lim.update(-1e6, 1e6))
+        self.assertEqual(lim.limits, (-7e6, 7e6))
+
+
+if __name__ == '__main__':
+    unittest.main()
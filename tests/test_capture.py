@@ -0,0 +1,125 @@
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.capture import CaptureWriter, CaptureReader, capture_stats, RX, TX
+from src.ground_station.telemetry_frame import encode_frame
+from src.ground_station.replay import ReplaySource
+from src.ground_station.multi_port import MultiPortIngest
+
+
+class TestCapture(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "c.gscap")
+        self.frame = encode_frame(45.0, 21.5, 21.0, 300, 90, 12, 7000000, 0, 0, 60)
+
+    def test_roundtrip(self):
+        cap = CaptureWriter(self.path, time_offset=0.0)
+        cap.tap("COM13", RX, b"1:4500:2150\n", t=1.0)
+        cap.tap("COM14", RX, self.frame, t=1.5)
+        cap.tx("COM13", b"3:i*60\n")
+        cap.close()
+        records = list(CaptureReader(self.path))
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0], (1.0, RX, "COM13", b"1:4500:2150\n"))
+        self.assertEqual(records[1][2:], ("COM14", self.frame))
+        self.assertEqual(records[2][1:], (TX, "COM13", b"3:i*60\n"))
+        self.assertEqual(cap.stats()["bytes_tx"], 7)
+
+    def test_truncated_tail_ignored(self):
+        cap = CaptureWriter(self.path)
+        cap.rx("gs", b"abc\n")
+        cap.rx("gs", b"def\n")
+        cap.close()
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 2)
+        self.assertEqual([r[3] for r in CaptureReader(self.path)], [b"abc\n"])
+
+    def test_stats_and_byte_exact_replay(self):
+        cap = CaptureWriter(self.path).start()
+        data = b"GS listo\n1:4500:2150\n" + self.frame + b"Panel:60\n"
+        # Trozos arbitrarios, como llegarían del puerto
+        for i in range(0, len(data), 5):
+            cap.rx("gs", data[i:i + 5])
+        cap.tx("gs", b"3:i*60\n")
+        cap.close()
+        st = capture_stats(self.path)["gs"]
+        self.assertEqual((st["protocol_lines"], st["debug_lines"], st["frames"]), (2, 1, 1))
+        self.assertEqual((st["bytes_rx"], st["commands"]), (len(data), 1))
+
+        src = ReplaySource.from_capture(self.path, speed=0, timeout=0)
+        got = []
+        ingest = MultiPortIngest(on_protocol=lambda link, linea: got.append(linea),
+                                 on_frame=lambda link, frame: got.append("frame"),
+                                 on_raw=lambda link, chunk: raw.append(chunk))
+        raw = []
+        ingest.add_link("replay", src)
+        while not src.eof:
+            ingest.poll_once(0)
+        self.assertEqual(got, ["1:4500:2150", "frame", "Panel:60"])
+        self.assertEqual(b"".join(raw), data)
+
+
+    def test_one_link_per_replay(self):
+        # Dos puertos con lecturas parciales intercaladas en el tiempo
+        cap = CaptureWriter(self.path, time_offset=0.0)
+        cap.tap("COM13", RX, b"1:45", t=1.0)
+        cap.tap("COM14", RX, b"2:1", t=1.1)
+        cap.tap("COM13", RX, b"00:2150\n", t=1.2)
+        cap.tap("COM14", RX, b"50\n", t=1.3)
+        cap.close()
+        reader = CaptureReader(self.path)
+        self.assertEqual(reader.link_names(), ["COM13", "COM14"])
+
+        def replay(**kwargs):
+            got = []
+            src = ReplaySource.from_capture(self.path, speed=0, timeout=0, **kwargs)
+            ingest = MultiPortIngest(on_protocol=lambda link, linea: got.append(linea))
+            ingest.add_link("replay", src)
+            while not src.eof:
+                ingest.poll_once(0)
+            return got
+
+        self.assertEqual(replay(), ["1:4500:2150"])  # por defecto el primer enlace
+        self.assertEqual(replay(link="COM14"), ["2:150"])
+        with self.assertRaises(ValueError):
+            ReplaySource.from_capture(self.path, link="COM99")
+
+    def test_index_seek_and_bounded_buffer(self):
+        cap = CaptureWriter(self.path, time_offset=0.0)
+        for i in range(1000):
+            cap.tap("gs", RX, b"2:%03d\n" % i, t=float(i))
+            cap.tap("otro", RX, b"x\n", t=float(i))
+        cap.close()
+        reader = CaptureReader(self.path)
+        info = reader.index(RX, "gs", every=64)
+        self.assertEqual((info["t_start"], info["t_end"], info["events"]), (0.0, 999.0, 1000))
+        self.assertEqual(len(info["index"]), 16)
+        first = next(reader.stream(RX, "gs", t0=500.0, index=info["index"]))
+        self.assertEqual(first, (500.0, b"2:500\n"))
+
+        src = ReplaySource.from_capture(self.path, speed=0, timeout=0, max_buffer=60)
+        self.assertLessEqual(src.in_waiting, 60 + 6)  # del disco solo se saca lo que cabe en el búfer
+        src.seek(990.0)
+        self.assertEqual(src.read(6), b"2:990\n")
+        data = b""
+        while not src.eof:
+            data += src.read(100)
+        self.assertEqual(data, b"".join(b"2:%03d\n" % i for i in range(991, 1000)))
+
+    def test_link_names_on_truncated_file(self):
+        cap = CaptureWriter(self.path)
+        cap.rx("gs", b"abc\n")
+        cap.close()
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 2)
+        reader = CaptureReader(self.path)
+        self.assertEqual(reader.link_names(), ["gs"])
+        self.assertEqual(list(reader), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.dispatch import MessageDispatcher
+
+
+class TestMessageDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.seen = []
+        self.dispatcher = MessageDispatcher()
+        self.h1 = self.dispatcher.register('1', lambda parts: self.seen.append(("1", parts)), "prot1")
+        self.dispatcher.register('99', lambda parts: self.seen.append(("99", parts)), "corrupt")
+        self.dispatcher.register_prefix("Panel:", lambda linea: self.seen.append(("panel", linea)), "prot_solar")
+
+    def test_dispatch_by_id_and_prefix(self):
+        self.assertTrue(self.dispatcher.dispatch("1:4500:2300"))
+        self.assertTrue(self.dispatcher.dispatch("99:3"))
+        self.assertTrue(self.dispatcher.dispatch("Panel:60"))
+        self.assertEqual(self.seen, [("1", ["1", "4500", "2300"]), ("99", ["99", "3"]), ("panel", "Panel:60")])
+
+    def test_unhandled_lines(self):
+        self.assertFalse(self.dispatcher.dispatch("67:0"))
+        self.assertFalse(self.dispatcher.dispatch("10"))
+        self.assertFalse(self.dispatcher.dispatch("GS listo"))
+        self.assertEqual(self.dispatcher.unhandled, 3)
+
+    def test_handler_stats_and_errors(self):
+        def broken(parts):
+            raise ValueError("x")
+        h = self.dispatcher.register('2', broken)
+        self.dispatcher.dispatch("1:1:1")
+        self.dispatcher.dispatch("1:2:2")
+        self.dispatcher.dispatch("2:abc")
+        self.assertEqual(self.h1.calls, 2)
+        self.assertGreater(self.h1.total_time, 0.0)
+        self.assertEqual((h.calls, h.errors), (1, 1))
+        self.assertTrue(self.dispatcher.report()[0].split()[0] in ("prot1", "broken"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import sys
+import os
+import csv
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.recorder import Recorder, RecordingReader
+from src.ground_station import export
+
+
+def make_session(root, name, n=500):
+    rec = Recorder(root, session=name, time_offset=0.0, segment_seconds=30)
+    for i in range(n):
+        rec.record("temp", 20.0 + i / 100, float(i) * 0.5)
+        if i % 2 == 0:
+            rec.record("hum", 40.0, float(i) * 0.5)
+        if i % 50 == 49:
+            rec.flush()
+    rec.close()
+    return rec.path
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.session = make_session(self.tmp.name, "s1")
+
+    def test_chunks_cover_everything_once(self):
+        total = 0
+        last_t = -1.0
+        for t, c, v, names in export.iter_chunks(self.session, chunk_seconds=7.0):
+            self.assertEqual(names, ["hum", "temp"])
+            self.assertGreaterEqual(t[0], last_t)
+            last_t = t[-1]
+            total += len(t)
+        self.assertEqual(total, 750)
+
+    def test_csv_range(self):
+        out = os.path.join(self.tmp.name, "s1.csv")
+        rows = export.export_csv(self.session, out, t0=10.0, t1=20.0, chunk_seconds=3.0)
+        with open(out, newline="") as f:
+            data = list(csv.DictReader(f))
+        self.assertEqual(len(data), rows)
+        # temp cada 0.5 s (21) + hum cada 1 s (11)
+        self.assertEqual(rows, 32)
+        self.assertEqual(data[0], {"t": "10.000000", "channel": "hum", "value": "40.0"})
+        self.assertEqual(data[1], {"t": "10.000000", "channel": "temp", "value": "20.2"})
+
+    @unittest.skipIf(export.pd is None, "pandas no instalado")
+    def test_dataframes(self):
+        dfs = list(export.iter_dataframes(self.session, chunk_seconds=50.0))
+        self.assertGreater(len(dfs), 1)
+        self.assertEqual(sum(len(df) for df in dfs), 750)
+        self.assertEqual(list(dfs[0].columns), ["t", "channel", "value"])
+        self.assertEqual(set(dfs[0]["channel"].cat.categories), {"hum", "temp"})
+
+    @unittest.skipIf(export.pa is None, "pyarrow no instalado")
+    def test_parquet(self):
+        out = os.path.join(self.tmp.name, "s1.parquet")
+        self.assertEqual(export.export_parquet(self.session, out, chunk_seconds=50.0), 750)
+        self.assertEqual(export.pq.read_table(out).num_rows, 750)
+
+    def test_parallel_sessions(self):
+        other = make_session(self.tmp.name, "s2", n=100)
+        out_dir = os.path.join(self.tmp.name, "out")
+        results = export.export_sessions([self.session, other], out_dir, workers=2)
+        self.assertEqual([os.path.basename(p) for p, _ in results], ["s1.csv", "s2.csv"])
+        self.assertEqual([rows for _, rows in results], [750, 150])
+        with self.assertRaises(ValueError):
+            export.export_sessions([self.session], out_dir, fmt="xlsx")
+
+
+    def test_metadata_read_once_and_only_overlapping_segments(self):
+        class CountingReader(RecordingReader):
+            meta_reads = 0
+            array_reads = 0
+
+            def segment_meta(self, segment):
+                CountingReader.meta_reads += 1
+                return super().segment_meta(segment)
+
+            def segment_arrays(self, *args, **kwargs):
+                CountingReader.array_reads += 1
+                return super().segment_arrays(*args, **kwargs)
+
+        reader = CountingReader(self.session)
+        n_segments = len(reader.segments())
+        chunks = list(export.iter_chunks(reader, chunk_seconds=7.0))
+        self.assertEqual(CountingReader.meta_reads, n_segments)
+        # Cada ventana toca uno o dos segmentos por canal
+        self.assertLessEqual(CountingReader.array_reads, len(chunks) * 2 * 2)
+
+    def test_empty_windows_open_nothing(self):
+        rec = Recorder(self.tmp.name, session="gap", time_offset=0.0, segment_seconds=30)
+        for t in (0.0, 1.0, 1000.0, 1001.0):
+            rec.record("temp", t, t)
+            rec.flush()
+        rec.close()
+        calls = []
+        reader = RecordingReader(rec.path)
+        original = reader.segment_arrays
+        reader.segment_arrays = lambda *a, **k: calls.append(a) or original(*a, **k)
+        rows = sum(len(t) for t, _, _, _ in export.iter_chunks(reader, chunk_seconds=10.0))
+        self.assertEqual(rows, 4)
+        # La primera ventana, la última y la anterior (su borde w_end toca la muestra en 1000);
+        # las ~100 ventanas del hueco no abren nada
+        self.assertEqual(len(calls), 3)
+
+if __name__ == '__main__':
+    unittest.main()
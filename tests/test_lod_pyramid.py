@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.lod_pyramid import MinMaxPyramid
+
+
+class TestMinMaxPyramid(unittest.TestCase):
+    def fill(self, pyr, n):
+        data = np.sin(np.arange(n) / 50.0) * 100
+        for i, v in enumerate(data):
+            pyr.append(v, float(i))
+        return data
+
+    def test_raw_level_when_small(self):
+        pyr = MinMaxPyramid(levels=3, factor=4, capacity=1000)
+        data = self.fill(pyr, 100)
+        t, v, level = pyr.select(10.0, 20.0, max_points=100)
+        self.assertEqual(level, 0)
+        np.testing.assert_array_equal(v, data[9:21])
+
+    def test_levels_keep_extremes(self):
+        pyr = MinMaxPyramid(levels=4, factor=4, capacity=1000)
+        data = self.fill(pyr, 4096)
+        t, v, level = pyr.select(max_points=200)
+        self.assertGreater(level, 0)
+        self.assertLessEqual(len(v), 200)
+        self.assertAlmostEqual(v.max(), data.max())
+        self.assertAlmostEqual(v.min(), data.min())
+        self.assertTrue(np.all(np.diff(t) >= 0))
+
+    def test_bucket_contents(self):
+        pyr = MinMaxPyramid(levels=2, factor=4, capacity=100)
+        for i, v in enumerate([3, 1, 4, 1, 5, 9, 2, 6]):
+            pyr.append(v, float(i))
+        lvl = pyr.levels[0]
+        self.assertEqual(lvl.vmin.view().tolist(), [1, 2])
+        self.assertEqual(lvl.vmax.view().tolist(), [4, 9])
+        self.assertEqual(lvl.t.view().tolist(), [0.0, 4.0])
+        self.assertEqual(pyr.bucket_size(2), 16)
+        self.assertIsNotNone(pyr.levels[1].pending)
+
+    def test_long_history_uses_coarse_level(self):
+        # El nivel en bruto solo guarda 256 muestras: para ver todo hay que subir
+        pyr = MinMaxPyramid(levels=5, factor=4, capacity=256)
+        self.fill(pyr, 20000)
+        t, v, level = pyr.select(0.0, 20000.0, max_points=500)
+        self.assertGreaterEqual(level, 3)
+        self.assertLessEqual(t[0], 0.0 + pyr.bucket_size(level))
+        self.assertGreater(t[-1], 19000)
+        # Una ventana reciente y corta sale del nivel en bruto
+        t, v, level = pyr.select(19900.0, 20000.0, max_points=500)
+        self.assertEqual(level, 0)
+
+    def test_pending_bucket_included(self):
+        pyr = MinMaxPyramid(levels=1, factor=4, capacity=100)
+        for i, v in enumerate([1, 2, 3, 4, 50]):
+            pyr.append(v, float(i))
+        t, v, level = pyr.select(max_points=2)
+        self.assertEqual(level, 1)
+        self.assertIn(50, v.tolist())
+
+
+    def test_lower_pending_buckets_included(self):
+        # 4**3 + 4**2 + 4 + 3 muestras: cada nivel tiene una cubeta a medias
+        pyr = MinMaxPyramid(levels=3, factor=4, capacity=1000, raw_capacity=16)
+        n = 64 + 16 + 4 + 3
+        data = np.arange(n, dtype=float)
+        data[-1] = 999.0   # el extremo más reciente solo está en la cubeta en curso del nivel 0
+        data[-5] = -999.0  # y este en la del nivel 1
+        for i, v in enumerate(data):
+            pyr.append(v, float(i))
+        t, v, level = pyr.select(max_points=12)
+        self.assertEqual(level, 3)
+        self.assertEqual(v.max(), 999.0)
+        self.assertEqual(v.min(), -999.0)
+        self.assertEqual(t[-1], n - 1)
+        self.assertTrue(np.all(np.diff(t) >= 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import socket
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.multi_port import MultiPortIngest
+from src.ground_station.telemetry_frame import encode_frame
+
+
+class SocketSerial:
+    def __init__(self, sock):
+        self.sock = sock
+        self.sock.setblocking(False)
+
+    @property
+    def in_waiting(self):
+        try:
+            return len(self.sock.recv(65536, socket.MSG_PEEK))
+        except BlockingIOError:
+            return 0
+
+    def read(self, n=1):
+        try:
+            return self.sock.recv(n)
+        except BlockingIOError:
+            return b""
+
+    def fileno(self):
+        return self.sock.fileno()
+
+
+class TestMultiPortIngest(unittest.TestCase):
+    def setUp(self):
+        self.pairs = [socket.socketpair() for _ in range(3)]
+        self.seen = []
+        self.ingest = MultiPortIngest(
+            on_protocol=lambda link, linea: self.seen.append((link.name, linea)),
+            on_frame=lambda link, frame: self.seen.append((link.name, f"frame {frame.time_s}")),
+        )
+        for i, (_, port_end) in enumerate(self.pairs):
+            self.ingest.add_link(f"GS{i}", SocketSerial(port_end))
+
+    def tearDown(self):
+        for a, b in self.pairs:
+            a.close()
+            b.close()
+
+    def test_links_keep_separate_buffers(self):
+        gs0, gs1, gs2 = (a for a, _ in self.pairs)
+        gs0.send(b"1:4500:")
+        gs1.send(b"2:150\n" + encode_frame(1, 1, 1, 1, 1, 42, 1, 1, 1, 0)[:10])
+        self.ingest.poll_once(0.1)
+        gs0.send(b"2300\n")
+        gs1.send(encode_frame(1, 1, 1, 1, 1, 42, 1, 1, 1, 0)[10:])
+        gs2.send(b"Panel:100\n")
+        for _ in range(3):
+            self.ingest.poll_once(0.1)
+        self.assertEqual(sorted(self.seen), [("GS0", "1:4500:2300"), ("GS1", "2:150"),
+                                             ("GS1", "frame 42"), ("GS2", "Panel:100")])
+        stats = self.ingest.stats()
+        self.assertEqual(stats["GS1"]["frames"], 1)
+        self.assertEqual(stats["GS0"]["protocol_lines"], 1)
+
+    def test_idle_poll_returns_zero(self):
+        self.assertEqual(self.ingest.poll_once(0.01), 0)
+
+
+    def test_handler_error_does_not_drop_link(self):
+        calls = []
+
+        def on_protocol(link, linea):
+            calls.append(linea)
+            if linea == "1:bad":
+                raise ValueError("parseo")
+
+        ingest = MultiPortIngest(on_protocol=on_protocol, on_raw=lambda link, data: 1 / 0)
+        gs, port_end = socket.socketpair()
+        try:
+            link = ingest.add_link("GS", SocketSerial(port_end))
+            gs.send(b"1:bad\n2:150\n")
+            ingest.poll_once(0.1)
+            gs.send(b"Panel:40\n")
+            ingest.poll_once(0.1)
+            self.assertEqual(calls, ["1:bad", "2:150", "Panel:40"])
+            self.assertTrue(link.alive)
+            st = link.stats()
+            self.assertEqual(st["errors"], 0)
+            self.assertEqual(st["callback_errors"], 3)  # 1 del handler + 2 de on_raw
+        finally:
+            gs.close()
+            port_end.close()
+
+    def test_port_error_drops_link(self):
+        link = self.ingest.links[0]
+        link.ingest.read_chunk = lambda: (_ for _ in ()).throw(OSError("desconectado"))
+        self.pairs[0][0].send(b"2:1\n")
+        self.ingest.poll_once(0.1)
+        self.assertFalse(link.alive)
+        self.assertEqual(link.errors, 1)
+
+if __name__ == '__main__':
+    unittest.main()
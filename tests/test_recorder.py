@@ -0,0 +1,120 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.recorder import Recorder, RecordingReader
+
+
+class TestRecorder(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_roundtrip_columns(self):
+        rec = Recorder(self.tmp.name, session="s1", time_offset=1000.0)
+        for i in range(100):
+            rec.record("temp", 20 + i / 10, float(i))
+            if i % 2 == 0:
+                rec.record("hum", 50.0, float(i))
+        rec.close()
+        reader = RecordingReader(rec.path)
+        self.assertEqual(reader.channels(), ["hum", "temp"])
+        t, v = reader.read("temp")
+        self.assertEqual(len(t), 100)
+        self.assertEqual(t[0], 1000.0)
+        self.assertAlmostEqual(v[-1], 29.9)
+        self.assertIsInstance(t, np.memmap)
+        t, v = reader.read("hum", 1010.0, 1020.0)
+        self.assertEqual(t.tolist(), [1010.0 + 2 * k for k in range(6)])
+        self.assertEqual(rec.stats()["recorded"], 150)
+
+    def test_background_thread_and_live_read(self):
+        rec = Recorder(self.tmp.name, session="s2", flush_interval=0.01, time_offset=0.0).start()
+        for i in range(1000):
+            rec.record("d", i, float(i))
+        rec._wake.set()
+        for _ in range(200):
+            if rec.recorded == 1000:
+                break
+            rec._thread.join(0.01)
+        # Se puede leer mientras sigue grabando
+        t, v = RecordingReader(rec.path).read("d")
+        self.assertEqual(len(v), 1000)
+        rec.record("d", 1000, 1000.0)
+        rec.close()
+        t, v = RecordingReader(rec.path).read("d")
+        self.assertEqual(v[-1], 1000)
+
+    def test_segments_rotate(self):
+        rec = Recorder(self.tmp.name, session="s3", segment_seconds=10, time_offset=0.0)
+        for i in range(30):
+            rec.record("x", i, float(i))
+            if i % 5 == 4:
+                rec.flush()
+        rec.close()
+        reader = RecordingReader(rec.path)
+        self.assertEqual(len(reader.segments()), 3)
+        t, v = reader.read("x", 8.0, 22.0)
+        self.assertEqual(v.tolist(), list(range(8, 23)))
+
+    def test_partial_write_is_ignored(self):
+        rec = Recorder(self.tmp.name, session="s4", time_offset=0.0)
+        rec.record("x", 1.0, 1.0)
+        rec.close()
+        seg = os.path.join(rec.path, "seg_000000")
+        with open(os.path.join(seg, "x.t"), "ab") as f:
+            np.array([2.0], dtype="<f8").tofile(f)
+        t, v = RecordingReader(rec.path).read("x")
+        self.assertEqual(len(t), 1)
+
+
+class TestRecordingIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        rec = Recorder(self.tmp.name, session="idx", segment_seconds=100, time_offset=0.0, index_every=16)
+        for i in range(1000):
+            rec.record("temp", 20 + (i // 100), float(i))
+            if i % 10 == 9:
+                rec.flush()
+        rec.close()
+        self.path = rec.path
+
+    def test_meta_per_segment(self):
+        reader = RecordingReader(self.path)
+        segs = reader.segments()
+        self.assertEqual(len(segs), 10)
+        meta = reader.segment_meta(segs[3])
+        self.assertEqual((meta["t_min"], meta["t_max"]), (300.0, 399.0))
+        info = meta["channels"]["temp"]
+        self.assertEqual((info["count"], info["v_min"], info["v_max"]), (100, 23.0, 23.0))
+        idx = np.fromfile(os.path.join(self.path, segs[3], "temp.idx"), dtype=[("t", "<f8"), ("offset", "<i8")])
+        self.assertEqual(idx["t"][:2].tolist(), [300.0, 316.0])
+        self.assertEqual(idx["offset"][:2].tolist(), [0, 128])
+
+    def test_range_skips_segments(self):
+        reader = RecordingReader(self.path)
+        t, v = reader.read("temp", 420.5, 433.0)
+        self.assertEqual(t.tolist(), [float(i) for i in range(421, 434)])
+        self.assertEqual(reader.segments_read, 1)
+        self.assertEqual(reader.segments_skipped, 9)
+        # El índice acota la parte mapeada del fichero
+        t, v = reader.segment_arrays("seg_000004", "temp", 420.5, 433.0)
+        self.assertLessEqual(len(t), 3 * 16)
+        self.assertLessEqual(t[0], 420.5)
+        self.assertGreaterEqual(t[-1], 433.0)
+
+    def test_value_bounds_skip(self):
+        reader = RecordingReader(self.path)
+        t, v = reader.read("temp", vmin=27.5)
+        self.assertEqual(set(v.tolist()), {28.0, 29.0})
+        self.assertEqual(reader.segments_skipped, 8)
+        t, v = reader.read("hum")
+        self.assertEqual(len(t), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.recorder import Recorder
+from src.ground_station.replay import ReplaySource, recording_to_lines
+from src.ground_station.recorder import RecordingReader
+from src.ground_station.multi_port import MultiPortIngest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, dt):
+        self.now += dt
+
+
+class TestReplaySource(unittest.TestCase):
+    def test_paced_playback(self):
+        clock = FakeClock()
+        src = ReplaySource([10.0, 11.0, 13.0], [b"a\n", b"b\n", b"c\n"], speed=2.0,
+                           clock=clock, sleep=clock.sleep)
+        self.assertEqual(src.in_waiting, 2)
+        self.assertEqual(src.read(100), b"a\n")
+        clock.now = 0.5   # 1 s de grabación a 2x
+        self.assertEqual(src.read(100), b"b\n")
+        # Nada pendiente: read espera (reloj falso) hasta el siguiente evento
+        self.assertEqual(src.read(100), b"")
+        clock.now = 1.5
+        self.assertEqual(src.read(100), b"c\n")
+        self.assertTrue(src.eof)
+
+    def test_max_speed_and_seek(self):
+        src = ReplaySource([0.0, 1.0, 2.0], [b"a\n", b"b\n", b"c\n"], speed=0, timeout=0)
+        self.assertEqual(src.in_waiting, 6)
+        self.assertEqual(src.read(3), b"a\nb")
+        src.seek(2.0)
+        self.assertEqual(src.read(100), b"c\n")
+        src.seek(0.5)
+        self.assertEqual(src.read(100), b"b\nc\n")
+        self.assertEqual(src.write(b"xx"), 2)
+        self.assertEqual(src.stats()["bytes_read"], 9)
+
+
+class TestRecordingReplay(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        rec = Recorder(self.tmp.name, session="s", time_offset=0.0)
+        rec.record("temp", 21.5, 1.0)
+        rec.record("hum", 40.25, 1.0)
+        for k, v in (("x", 7000000.0), ("y", -5.5), ("z", 12.0)):
+            rec.record(k, v, 2.0)
+        rec.record("distance", 120, 3.0)
+        rec.record("angle", 45, 3.0)
+        rec.record("temp_med", 20.0, 4.0)
+        rec.record("panel", 60, 5.0)
+        rec.close()
+        self.path = rec.path
+
+    def test_lines(self):
+        times, chunks = map(list, zip(*recording_to_lines(RecordingReader(self.path))))
+        self.assertEqual(chunks, [
+            b"1:4025:2150\n",
+            b"Position: (X: 7000000.00 m, Y: -5.50 m, Z: 12.00 m)\n",
+            b"6:45\n",
+            b"2:120\n",
+            b"7:2000\n",
+            b"Panel:60\n",
+        ])
+        self.assertEqual(times, [1.0, 2.0, 3.0, 3.0, 4.0, 5.0])
+
+    def test_through_ingest_path(self):
+        lines = []
+        src = ReplaySource.from_recording(self.path, speed=0, timeout=0)
+        ingest = MultiPortIngest(on_protocol=lambda link, linea: lines.append(linea))
+        ingest.add_link("replay", src)
+        while not src.eof:
+            ingest.poll_once(0)
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(lines[0], "1:4025:2150")
+        self.assertEqual(lines[-1], "Panel:60")
+
+
+    def test_radar_pairs_distance_with_its_angle(self):
+        rec = Recorder(self.tmp.name, session="radar", time_offset=0.0)
+        for t, (ang, dist) in enumerate([(10, 100), (20, 200), (30, 300)]):
+            rec.record("distance", dist, float(t))
+            rec.record("angle", ang, float(t))
+        rec.close()
+        # Como el handler del radar: cada distancia se pinta con el último ángulo recibido
+        angle, pairs = [None], []
+
+        def on_protocol(link, linea):
+            msg_id, value = linea.split(":")
+            if msg_id == "6":
+                angle[0] = int(value)
+            elif msg_id == "2":
+                pairs.append((angle[0], int(value)))
+
+        src = ReplaySource.from_recording(rec.path, speed=0, timeout=0)
+        ingest = MultiPortIngest(on_protocol=on_protocol)
+        ingest.add_link("replay", src)
+        while not src.eof:
+            ingest.poll_once(0)
+        self.assertEqual(pairs, [(10, 100), (20, 200), (30, 300)])
+
+    def test_streams_segment_by_segment(self):
+        rec = Recorder(self.tmp.name, session="largo", time_offset=0.0, segment_seconds=10)
+        for t in range(50):
+            rec.record("panel", t, float(t))
+            rec.flush()  # un flush por muestra: se rota cada 10 s
+        rec.close()
+        reader = RecordingReader(rec.path)
+        self.assertEqual(len(reader.segments()), 5)
+        lines = recording_to_lines(reader)
+        self.assertEqual(next(lines), (0.0, b"Panel:0\n"))  # generador: no lee la sesión entera
+        self.assertEqual(len(list(lines)), 49)
+
+        src = ReplaySource.from_recording(rec.path, speed=0, timeout=0)
+        self.assertEqual((src.start_time, src.end_time), (0.0, 49.0))
+        src.seek(42.0)
+        data = b""
+        while not src.eof:
+            data += src.read(100)
+        self.assertEqual(data, b"".join(b"Panel:%d\n" % t for t in range(42, 50)))
+
+if __name__ == '__main__':
+    unittest.main()
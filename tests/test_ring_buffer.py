@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_append_and_order(self):
+        rb = RingBuffer(4)
+        for v in range(10):
+            rb.append(v)
+        self.assertEqual(len(rb), 4)
+        self.assertEqual(rb.view().tolist(), [6, 7, 8, 9])
+        self.assertEqual(rb[-1], 9)
+        self.assertEqual(rb.last(), 9)
+        self.assertEqual(rb.total, 10)
+
+    def test_view_is_zero_copy(self):
+        rb = RingBuffer(5)
+        for v in range(7):
+            rb.append(v)
+        v = rb.view()
+        self.assertTrue(np.shares_memory(v, rb._data))
+        self.assertTrue(v.flags.c_contiguous)
+
+    def test_partial_and_fill(self):
+        rb = RingBuffer(3)
+        self.assertEqual(len(rb.view()), 0)
+        rb.append(1.5)
+        self.assertEqual(rb.view().tolist(), [1.5])
+        filled = RingBuffer(3, fill=0)
+        self.assertEqual(filled.view().tolist(), [0, 0, 0])
+        filled.append(7)
+        self.assertEqual(filled.view().tolist(), [0, 0, 7])
+
+    def test_extend(self):
+        rb = RingBuffer(4)
+        rb.extend([1, 2, 3])
+        rb.extend([4, 5])
+        self.assertEqual(rb.view().tolist(), [2, 3, 4, 5])
+        rb.extend(range(100))
+        self.assertEqual(rb.view().tolist(), [96, 97, 98, 99])
+        self.assertEqual(rb.last(2).tolist(), [98, 99])
+
+    def test_memory_is_flat(self):
+        rb = RingBuffer(8)
+        nbytes = rb._data.nbytes
+        for v in range(10000):
+            rb.append(v)
+        self.assertEqual(rb._data.nbytes, nbytes)
+        np.testing.assert_array_equal(rb.view(), np.arange(9992, 10000))
+
+    def test_clear_and_empty(self):
+        rb = RingBuffer(2)
+        with self.assertRaises(IndexError):
+            rb.last()
+        rb.append(3)
+        rb.clear()
+        self.assertEqual(len(rb), 0)
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
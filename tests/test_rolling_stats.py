@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import math
+import random
+import statistics
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.rolling_stats import RollingStats, RollingStatsEngine
+from src.ground_station.telemetry_store import TelemetryStore
+
+
+class TestRollingStats(unittest.TestCase):
+    def test_sample_window_matches_brute_force(self):
+        random.seed(1)
+        data = [random.uniform(-50, 50) for _ in range(500)]
+        rs = RollingStats(window=25)
+        for i, v in enumerate(data):
+            rs.update(v, float(i))
+            win = data[max(0, i - 24):i + 1]
+            self.assertAlmostEqual(rs.mean, statistics.fmean(win), places=9)
+            self.assertEqual(rs.min, min(win))
+            self.assertEqual(rs.max, max(win))
+            if len(win) > 1:
+                self.assertAlmostEqual(rs.var, statistics.variance(win), places=6)
+
+    def test_time_window(self):
+        rs = RollingStats(duration=2.0)
+        for t, v in [(0.0, 10), (1.0, 20), (2.0, 30), (3.5, 40)]:
+            rs.update(v, t)
+        # Quedan las muestras con t >= 1.5
+        self.assertEqual(len(rs), 2)
+        self.assertEqual(rs.mean, 35)
+        self.assertEqual(rs.min, 30)
+        self.assertEqual(rs.max, 40)
+
+    def test_empty_and_ewma(self):
+        rs = RollingStats(window=3, ewma_alpha=0.5)
+        self.assertTrue(math.isnan(rs.mean))
+        self.assertTrue(math.isnan(rs.max))
+        rs.update(0)
+        rs.update(10)
+        self.assertEqual(rs.ewma, 5)
+        self.assertTrue(math.isnan(RollingStats(window=3).std))
+        with self.assertRaises(ValueError):
+            RollingStats()
+
+
+class TestRollingStatsEngine(unittest.TestCase):
+    def test_derived_channels(self):
+        store = TelemetryStore()
+        engine = RollingStatsEngine(store)
+        names = engine.add("temp", window=2, stats=("mean", "max"))
+        self.assertEqual(names, ["temp.mean_2n", "temp.max_2n"])
+        for t, v in enumerate([1.0, 3.0, 5.0]):
+            store.append("temp", v, float(t))
+        self.assertEqual(store.view("temp.mean_2n")[1].tolist(), [1.0, 2.0, 4.0])
+        self.assertEqual(store.latest("temp.max_2n"), 5.0)
+        self.assertEqual(store.view("temp.max_2n")[0].tolist(), [0.0, 1.0, 2.0])
+        store.append("hum", 50.0, 3.0)
+        self.assertNotIn("hum.mean_2n", store)
+        with self.assertRaises(ValueError):
+            engine.add("temp", window=2, stats=("median",))
+
+
+if __name__ == '__main__':
+    unittest.main()
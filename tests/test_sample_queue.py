@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.sample_queue import SampleQueue, KEEP_ALL, KEEP_LATEST, DECIMATE
+
+
+class TestSampleQueue(unittest.TestCase):
+    def test_keep_all_preserves_every_sample_in_order(self):
+        q = SampleQueue(capacity=10, policy=KEEP_ALL)
+        for i in range(5):
+            q.put("temp", i, t=i)
+        self.assertEqual([v for _, v, _ in q.drain()], [0, 1, 2, 3, 4])
+        self.assertEqual(q.drain(), [])
+
+    def test_keep_all_drops_oldest_when_full(self):
+        q = SampleQueue(capacity=4, policy=KEEP_ALL)
+        for i in range(10):
+            q.put("temp", i)
+        self.assertEqual([v for _, v, _ in q.drain()], [6, 7, 8, 9])
+        self.assertEqual(q.dropped, 6)
+        self.assertEqual(q.high_water, 4)
+
+    def test_keep_latest_per_channel(self):
+        q = SampleQueue(policy=KEEP_LATEST)
+        q.put("temp", 1, t=1)
+        q.put("hum", 50, t=2)
+        q.put("temp", 3, t=3)
+        self.assertEqual(q.drain(), [("hum", 50, 2), ("temp", 3, 3)])
+        self.assertEqual(q.coalesced, 1)
+
+    def test_decimate_above_threshold(self):
+        q = SampleQueue(capacity=100, policy=DECIMATE, decimate_factor=4, decimate_above=0.1)
+        for i in range(50):
+            q.put("temp", i)
+        # 10 enteras y después 1 de cada 4
+        self.assertEqual(len(q), 10 + 10)
+        self.assertEqual(q.decimated, 30)
+
+    def test_bad_policy(self):
+        with self.assertRaises(ValueError):
+            SampleQueue(policy="nope")
+
+
+if __name__ == '__main__':
+    unittest.main()
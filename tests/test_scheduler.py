@@ -0,0 +1,269 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.scheduler import RenderScheduler
+
+
+class FakeWindow:
+    def __init__(self):
+        self.calls = []
+        self.cancelled = []
+
+    def after(self, ms, func):
+        self.calls.append((ms, func))
+        return len(self.calls)
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+
+
+class PendingWindow:
+    """after() de verdad a medias: guarda los pendientes y fire() ejecuta el más antiguo"""
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.pending[self.next_id] = func
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def fire(self):
+        after_id = min(self.pending)
+        self.pending.pop(after_id)()
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+class TestRenderScheduler(unittest.TestCase):
+    def setUp(self):
+        self.window = FakeWindow()
+        self.clock = FakeClock()
+        self.sched = RenderScheduler(self.window, tick_ms=50, max_idle_ms=400, clock=self.clock)
+        self.log = []
+
+    def render(self, name):
+        return lambda: self.log.append(name)
+
+    def test_first_tick_renders_everything(self):
+        self.sched.register("a", self.render("a"))
+        self.sched.register("b", self.render("b"))
+        self.assertEqual(self.sched.tick(), 2)
+        self.assertEqual(self.log, ["a", "b"])
+
+    def test_clean_panels_are_skipped(self):
+        self.sched.register("a", self.render("a"), interval=0.1)
+        self.sched.tick()
+        self.clock.t = 1.0
+        self.assertEqual(self.sched.tick(), 0)
+        self.sched.mark_dirty("a")
+        self.assertEqual(self.sched.tick(), 1)
+        self.assertEqual(self.log, ["a", "a"])
+
+    def test_interval_coalesces_marks(self):
+        self.sched.register("a", self.render("a"), interval=0.5)
+        self.sched.tick()
+        for t in (0.1, 0.2, 0.3):
+            self.clock.t = t
+            self.sched.mark_dirty("a")
+            self.sched.tick()
+        self.assertEqual(self.log, ["a"])
+        self.clock.t = 0.5
+        self.sched.tick()
+        self.assertEqual(self.log, ["a", "a"])
+
+    def test_is_dirty_callback(self):
+        state = {"v": 0, "shown": None}
+
+        def render():
+            state["shown"] = state["v"]
+            self.log.append("a")
+
+        self.sched.register("a", render, interval=0.0, is_dirty=lambda: state["v"] != state["shown"])
+        self.sched.tick()
+        self.sched.tick()
+        self.assertEqual(self.log, ["a"])
+        state["v"] = 1
+        self.sched.tick()
+        self.assertEqual(self.log, ["a", "a"])
+
+    def test_hooks_run_before_panels(self):
+        self.sched.register("a", self.render("a"), interval=0.0)
+        self.sched.tick()
+        self.sched.add_hook(lambda: (self.log.append("hook"), self.sched.mark_dirty("a")))
+        self.sched.tick()
+        self.assertEqual(self.log, ["a", "hook", "a"])
+
+    def test_render_error_does_not_stop_others(self):
+        def boom():
+            raise RuntimeError("x")
+
+        self.sched.register("a", boom)
+        self.sched.register("b", self.render("b"))
+        self.assertEqual(self.sched.tick(), 2)
+        self.assertEqual(self.log, ["b"])
+
+    def test_idle_backoff_and_wake(self):
+        self.sched.register("a", self.render("a"), interval=0.0)
+        self.sched.start()
+        self.assertEqual(self.window.calls[-1][0], 50)
+        self.sched._run()  # pinta -> tick normal
+        self.assertEqual(self.window.calls[-1][0], 50)
+        delays = []
+        for _ in range(5):
+            self.sched._run()
+            delays.append(self.window.calls[-1][0])
+        self.assertEqual(delays, [100, 200, 400, 400, 400])
+        self.sched.wake()
+        self.sched.mark_dirty("a")
+        self.sched._run()
+        self.assertEqual(self.window.calls[-1][0], 50)
+
+    def test_unregister_and_stop(self):
+        self.sched.register("a", self.render("a"))
+        self.sched.unregister("a")
+        self.sched.unregister("nope")
+        self.assertEqual(self.sched.tick(), 0)
+        self.sched.start()
+        self.sched.stop()
+        self.assertEqual(self.window.cancelled, [1])
+
+    def test_report(self):
+        self.sched.register("a", self.render("a"))
+        self.sched.tick()
+        report = self.sched.report()
+        self.assertEqual(len(report), 1)
+        self.assertTrue(report[0].startswith("a: 1 refrescos"))
+
+    def test_wake_reschedules_pending_after(self):
+        self.sched.register("a", self.render("a"), interval=0.0)
+        self.sched.start()
+        for _ in range(5):
+            self.sched._run()
+        self.assertEqual(self.window.calls[-1][0], 400)
+        idle_id = self.sched._after_id
+        self.sched.wake()
+        self.assertIn(idle_id, self.window.cancelled)
+        self.assertEqual(self.window.calls[-1][0], 50)
+        self.assertEqual(self.sched._after_id, len(self.window.calls))
+
+    def test_wake_during_tick_keeps_one_chain(self):
+        window = PendingWindow()
+        sched = RenderScheduler(window, tick_ms=50, max_idle_ms=400, clock=self.clock)
+        sched.register("a", lambda: sched.wake(), interval=0.0)  # p.ej. un botón atendido al pintar
+        sched.start()
+        for _ in range(5):
+            window.fire()
+            self.assertEqual(len(window.pending), 1)
+        sched.stop()
+        self.assertEqual(window.pending, {})
+
+    def test_stop_during_tick_does_not_reschedule(self):
+        window = PendingWindow()
+        sched = RenderScheduler(window, tick_ms=50, clock=self.clock)
+        sched.register("a", lambda: sched.stop())
+        sched.start()
+        window.fire()
+        self.assertEqual(window.pending, {})
+
+    def test_wake_before_start_does_nothing(self):
+        self.sched.wake()
+        self.assertEqual(self.window.calls, [])
+
+    def test_dirty_but_not_due_is_not_idle(self):
+        self.sched.register("a", self.render("a"), interval=1.0)
+        self.sched.start()
+        self.sched._run()  # primera pasada: pinta
+        self.sched.mark_dirty("a")
+        self.clock.t = 0.3
+        self.sched._run()  # sucio pero aún no toca: no se espacia el tick
+        self.assertEqual(self.sched.pending, 1)
+        self.assertEqual(self.window.calls[-1][0], 50)
+        self.clock.t = 1.0
+        self.sched._run()
+        self.assertEqual(self.log, ["a", "a"])
+        self.sched._run()  # ya limpio: ahora sí se espacia
+        self.assertEqual(self.window.calls[-1][0], 100)
+
+class TestGovernor(unittest.TestCase):
+    def setUp(self):
+        self.window = FakeWindow()
+        self.clock = FakeClock()
+        self.sched = RenderScheduler(self.window, tick_ms=50, clock=self.clock, budget=0.5, max_interval=2.0)
+        self.costs = {}
+
+    def add(self, name, cost, interval):
+        def render():
+            self.clock.t += self.costs[name]
+        self.costs[name] = cost
+        return self.sched.register(name, render, interval=interval, is_dirty=lambda: True)
+
+    def run_for(self, seconds):
+        end = self.clock.t + seconds
+        while self.clock.t < end:
+            self.sched.tick()
+            self.clock.t += 0.05
+
+    def test_cheap_panels_keep_their_interval(self):
+        a = self.add("a", 0.001, 0.1)
+        b = self.add("b", 0.002, 0.5)
+        self.run_for(2)
+        self.assertEqual(a.interval, 0.1)
+        self.assertEqual(b.interval, 0.5)
+        self.assertLess(self.sched.load, 0.5)
+
+    def test_expensive_panel_backs_off_within_budget(self):
+        cheap = self.add("label", 0.001, 0.1)
+        slow = self.add("orbit", 0.2, 0.5)  # 40% de CPU a su ritmo pedido
+        temp = self.add("temp", 0.04, 0.1)  # otro 40%
+        self.run_for(10)
+        self.assertEqual(cheap.interval, 0.1)
+        self.assertGreater(slow.interval, 0.5)
+        self.assertGreater(temp.interval, 0.1)
+        self.assertLessEqual(self.sched.load, 0.5 + 1e-9)
+
+    def test_recovers_when_cost_drops(self):
+        slow = self.add("orbit", 0.5, 0.5)
+        self.run_for(10)
+        self.assertGreater(slow.interval, 0.5)
+        self.costs["orbit"] = 0.01
+        self.run_for(30)
+        self.assertEqual(slow.interval, 0.5)
+
+    def test_max_interval_caps_backoff(self):
+        slow = self.add("orbit", 5.0, 0.5)
+        self.run_for(30)
+        self.assertEqual(slow.interval, 2.0)
+
+    def test_tick_slice_defers_remaining_panels(self):
+        self.add("a", 0.2, 0.0)
+        self.add("b", 0.2, 0.0)
+        self.assertEqual(self.sched.tick(), 1)
+        self.assertEqual(self.sched.tick(), 1)  # ahora le toca a b, que lleva más sin pintarse
+        self.assertEqual(self.sched.panels["b"].renders, 1)
+
+    def test_delay_leaves_room_for_input(self):
+        self.add("a", 0.3, 0.0)
+        self.sched._run()
+        # 300 ms pintando con budget 0.5 -> al menos 300 ms libres para Tk
+        self.assertGreaterEqual(self.window.calls[-1][0], 300)
+
+    def test_invalid_budget(self):
+        with self.assertRaises(ValueError):
+            RenderScheduler(self.window, budget=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.serial_ingest import SerialIngest, RateCounter
+
+
+class FakeSerial:
+    """Puerto falso: entrega los trozos de `chunks` en orden"""
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    @property
+    def in_waiting(self):
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def read(self, n=1):
+        if not self.chunks:
+            return b""
+        chunk = self.chunks[0]
+        data, rest = chunk[:n], chunk[n:]
+        if rest:
+            self.chunks[0] = rest
+        else:
+            self.chunks.pop(0)
+        return data
+
+    def fileno(self):
+        raise OSError("sin fileno")
+
+
+class TestSerialIngest(unittest.TestCase):
+    def test_lines_split_across_reads(self):
+        ingest = SerialIngest(FakeSerial([b"1:4500:23", b"00\r\n2:150\n7:2", b"100\n"]))
+        lines = []
+        for _ in range(3):
+            lines.extend(ingest.read_lines())
+        self.assertEqual(lines, [b"1:4500:2300", b"2:150", b"7:2100"])
+        self.assertEqual(ingest.total_lines, 3)
+        self.assertEqual(ingest.buffer, bytearray())
+
+    def test_idle_port_returns_nothing(self):
+        ingest = SerialIngest(FakeSerial([]))
+        self.assertEqual(ingest.read_lines(), [])
+
+    def test_overflow_without_newline_is_discarded(self):
+        ingest = SerialIngest(FakeSerial([]), max_line=8)
+        self.assertEqual(ingest.feed(b"x" * 20), [])
+        self.assertEqual(ingest.overflows, 1)
+        self.assertEqual(ingest.feed(b"ok\n"), [b"ok"])
+
+    @unittest.skipIf(os.name == "nt", "select sobre pipes solo en posix")
+    def test_waits_on_file_descriptor(self):
+        r, w = os.pipe()
+        try:
+            class PipeSerial:
+                @property
+                def in_waiting(self):
+                    return 0
+
+                def read(self, n=1):
+                    return os.read(r, 4096)
+
+                def fileno(self):
+                    return r
+
+            ingest = SerialIngest(PipeSerial(), idle_timeout=0.01)
+            self.assertEqual(ingest.read_lines(), [])
+            os.write(w, b"6:90\n")
+            self.assertEqual(ingest.read_lines(), [b"6:90"])
+        finally:
+            os.close(r)
+            os.close(w)
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+class TestRateCounter(unittest.TestCase):
+    def test_rate_per_window(self):
+        clock = FakeClock()
+        rate = RateCounter(clock=clock)
+        rate.add(lines=50, nbytes=500)
+        clock.t = 1.0
+        rate.add(lines=50, nbytes=500)
+        self.assertEqual(rate.lines_per_second, 100)
+        self.assertEqual(rate.bytes_per_second, 1000)
+
+    def test_rate_decays_when_link_goes_quiet(self):
+        clock = FakeClock()
+        rate = RateCounter(clock=clock)
+        rate.add(lines=100)
+        clock.t = 1.0
+        rate.add(lines=1)
+        self.assertEqual(rate.lines_per_second, 101)
+        # Nadie vuelve a llamar a add(): al leerla pasada la ventana ya no es la última tasa
+        clock.t = 4.0
+        self.assertEqual(rate.lines_per_second, 0)
+        rate.update()
+        self.assertEqual(rate.lines_per_second, 0)
+
+    def test_ingest_exposes_rate(self):
+        ingest = SerialIngest(FakeSerial([]))
+        ingest.rate = RateCounter(clock=FakeClock())
+        ingest.count_lines(3)
+        self.assertEqual(ingest.stats()["lines_per_second"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
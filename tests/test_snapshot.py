@@ -0,0 +1,37 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.snapshot import SnapshotSeries
+
+
+class TestSnapshotSeries(unittest.TestCase):
+    def test_published_snapshot_never_changes(self):
+        series = SnapshotSeries(("x", "y", "z"), capacity=4)
+        series.append(1, 2, 3)
+        snap = series.snapshot()
+        for i in range(20):  # fuerza varias realocaciones
+            series.append(i, i, i)
+        self.assertEqual(list(snap.x), [1])
+        self.assertEqual(snap.version, 1)
+        last = series.snapshot()
+        self.assertEqual(len(last.x), 21)
+        self.assertEqual(len(last.x), len(last.z))
+        with self.assertRaises(ValueError):
+            last.x[0] = 99
+
+    def test_max_len_window(self):
+        series = SnapshotSeries(("lat", "lon"), max_len=5)
+        snaps = []
+        for i in range(23):
+            series.append(i, -i)
+            snaps.append(series.snapshot())
+        self.assertEqual(list(series.snapshot().lat), [18, 19, 20, 21, 22])
+        self.assertEqual(list(series.snapshot().lon), [-18, -19, -20, -21, -22])
+        # Ninguna instantánea antigua se ha visto alterada por escrituras posteriores
+        for i, snap in enumerate(snaps):
+            self.assertEqual(list(snap.lat), list(range(max(0, i - 4), i + 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.stream_demux import StreamDemux, is_protocol_line
+from src.ground_station.telemetry_frame import encode_frame
+
+
+class TestStreamDemux(unittest.TestCase):
+    def setUp(self):
+        self.protocol, self.debug, self.frames = [], [], []
+        self.demux = StreamDemux(on_protocol=self.protocol.append,
+                                 on_debug=self.debug.append,
+                                 on_frame=self.frames.append)
+        # distance=10 -> byte 0x0A ('\n') dentro del frame
+        self.frame = encode_frame(50, 20, 20, 10, 90, 7, 1, 2, 3, 40)
+        self.assertIn(b"\n", self.frame)
+
+    def test_classify_lines(self):
+        self.assertTrue(is_protocol_line(b"1:4500:2300"))
+        self.assertTrue(is_protocol_line(b"99:3"))
+        self.assertTrue(is_protocol_line(b"Position: (X: 1 m, Y: 2 m, Z: 3 m)"))
+        self.assertTrue(is_protocol_line(b"Panel:60"))
+        self.assertFalse(is_protocol_line(b"GS listo"))
+        self.assertFalse(is_protocol_line(b"SAT-> OK: 1:4500:2300"))
+
+    def test_mixed_stream(self):
+        stream = (b"GS listo\r\nRX: H=AA Hum=5000 -> OK!\r\n" + self.frame +
+                  b"1:4500:2300\r\n" + self.frame + b"Panel:40\n")
+        self.demux.feed(stream)
+        self.assertEqual(len(self.frames), 2)
+        self.assertEqual(self.frames[0].distance, 10)
+        self.assertEqual(self.protocol, ["1:4500:2300", "Panel:40"])
+        self.assertEqual(self.debug, ["GS listo", "RX: H=AA Hum=5000 -> OK!"])
+
+    def test_incremental_byte_by_byte(self):
+        stream = b"ERROR: header inv\xc3\xa1lido\n" + self.frame + b"2:150\n"
+        for i in range(len(stream)):
+            self.demux.feed(stream[i:i + 1])
+        self.assertEqual(len(self.frames), 1)
+        self.assertEqual(self.protocol, ["2:150"])
+        self.assertEqual(self.debug, ["ERROR: header inválido"])
+        self.assertEqual(self.demux.buffer, bytearray())
+
+    def test_frame_after_unterminated_text(self):
+        bad = bytearray(self.frame)
+        bad[-1] ^= 0xFF
+        self.demux.feed(b" -> CORRUPTO!" + self.frame + bytes(bad) + b"\n7:2100\n")
+        self.assertEqual(len(self.frames), 1)
+        self.assertEqual(self.debug[0], "-> CORRUPTO!")
+        self.assertEqual(self.protocol, ["7:2100"])
+
+    def test_aa_inside_text_does_not_hold_lines(self):
+        # 'ª' en UTF-8 es \xc2\xaa: no debe retener la línea ni las siguientes
+        self.assertEqual(self.demux.feed(b"RX: \xc2\xaa ok\n2:100\n"), 2)
+        self.assertEqual(self.debug, ["RX: ª ok"])
+        self.assertEqual(self.protocol, ["2:100"])
+        self.assertEqual(self.demux.buffer, bytearray())
+
+    def test_aa_at_line_start_does_not_hold_lines(self):
+        self.demux.feed(b"\xaa ok\n2:100\n")
+        self.assertEqual(self.protocol, ["2:100"])
+        self.assertEqual(self.demux.buffer, bytearray())
+
+    def test_incremental_frame_after_unterminated_text(self):
+        # El '\n' interno del frame llega antes que el resto: hay que seguir esperando
+        stream = b" -> CORRUPTO!" + self.frame + b"7:2100\n"
+        for i in range(len(stream)):
+            self.demux.feed(stream[i:i + 1])
+        self.assertEqual(len(self.frames), 1)
+        self.assertEqual(self.debug, ["-> CORRUPTO!"])
+        self.assertEqual(self.protocol, ["7:2100"])
+
+    def test_callback_error_is_counted_and_bytes_not_repeated(self):
+        seen = []
+
+        def on_protocol(linea):
+            seen.append(linea)
+            if linea == "1:1:1":
+                raise ValueError("parseo")
+
+        demux = StreamDemux(on_protocol=on_protocol)
+        self.assertEqual(demux.feed(b"1:1:1\n2:5\n"), 2)
+        demux.feed(b"2:6\n")
+        self.assertEqual(seen, ["1:1:1", "2:5", "2:6"])
+        self.assertEqual(demux.callback_errors, 1)
+        self.assertEqual(len(demux.buffer), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.ground_station.telemetry_frame import (
+    FRAME_SIZE, FrameDecoder, decode_frame, encode_frame, frame_checksum
+)
+from src.ground_station.frame_batch import decode_frames, decode_stream
+
+
+class TestTelemetryFrame(unittest.TestCase):
+    def setUp(self):
+        self.raw = encode_frame(45.5, -3.25, 21.0, 150, 90, 1234,
+                                6771000, -123456, 42, 60)
+
+    def test_frame_size_matches_packed_struct(self):
+        self.assertEqual(FRAME_SIZE, 26)
+        self.assertEqual(len(self.raw), FRAME_SIZE)
+
+    def test_decode_roundtrip(self):
+        frame = decode_frame(self.raw)
+        self.assertAlmostEqual(frame.hum, 45.5)
+        self.assertAlmostEqual(frame.temp, -3.25)
+        self.assertAlmostEqual(frame.temp_avg, 21.0)
+        self.assertEqual((frame.x, frame.y, frame.z), (6771000, -123456, 42))
+        self.assertEqual(frame.panel_state, 60)
+        self.assertEqual(frame.time_s, 1234)
+
+    def test_bad_checksum_rejected(self):
+        bad = bytearray(self.raw)
+        bad[5] ^= 0xFF
+        self.assertIsNone(decode_frame(bad))
+        self.assertNotEqual(frame_checksum(bad), bad[-1])
+
+    def test_resync_after_garbage(self):
+        decoder = FrameDecoder()
+        corrupt = bytearray(self.raw)
+        corrupt[-1] ^= 0x01
+        stream = b"GS listo\r\n\xaa\x00" + bytes(corrupt) + self.raw + self.raw[:10]
+        frames = decoder.feed(stream)
+        self.assertEqual(len(frames), 1)
+        self.assertGreater(decoder.checksum_errors, 0)
+        # El frame partido se completa en la siguiente lectura
+        frames = decoder.feed(self.raw[10:])
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(frames[0].panel_state, 60)
+        self.assertEqual(decoder.frames_ok, 2)
+
+
+class TestFrameBatch(unittest.TestCase):
+    def setUp(self):
+        self.frames = [encode_frame(40 + i, 20 + i / 4, 21, 100 + i, i, i, -7000000 + i, i * 1000, 5, 100)
+                       for i in range(50)]
+
+    def test_aligned_batch_matches_scalar_decoder(self):
+        buf = bytearray(b"".join(self.frames))
+        buf[3 * FRAME_SIZE + 4] ^= 0x10  # corrompemos el frame 3
+        cols, valid = decode_frames(bytes(buf))
+        self.assertEqual(valid.sum(), 49)
+        self.assertFalse(valid[3])
+        ref = decode_frame(self.frames[7])
+        self.assertAlmostEqual(cols["temp"][7], ref.temp)
+        self.assertEqual(cols["x"][7], ref.x)
+        self.assertEqual(cols["y"][7], ref.y)
+
+    def test_stream_with_garbage(self):
+        buf = b"GS listo\n" + b"".join(self.frames[:10]) + b"\xaa\x01 -> OK!\n" + b"".join(self.frames[10:]) + self.frames[0][:5]
+        cols, offsets, consumed = decode_stream(buf)
+        self.assertEqual(len(offsets), 50)
+        self.assertEqual(list(cols["time_s"]), list(range(50)))
+        self.assertEqual(consumed, len(buf) - 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
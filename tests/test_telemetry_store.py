@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ground_station.telemetry_store import TelemetryStore
+
+
+class TestTelemetryStore(unittest.TestCase):
+    def test_append_and_latest(self):
+        store = TelemetryStore(capacity=8)
+        self.assertIsNone(store.latest("temp"))
+        store.append("temp", 21.5, 1.0)
+        store.append("temp", 22.0, 2.0)
+        store.append("hum", 40.0, 2.0)
+        self.assertEqual(store.latest("temp"), 22.0)
+        self.assertEqual(store.latest("hum"), 40.0)
+        self.assertEqual(sorted(store.channels()), ["hum", "temp"])
+        self.assertEqual(store.version, 3)
+
+    def test_range_by_time(self):
+        store = TelemetryStore(capacity=100)
+        for i in range(10):
+            store.append("temp", i * 10, float(i))
+        t, v = store.range("temp", 2.5, 5.0)
+        self.assertEqual(t.tolist(), [3.0, 4.0, 5.0])
+        self.assertEqual(v.tolist(), [30, 40, 50])
+        t, v = store.range("temp", t1=1.0)
+        self.assertEqual(v.tolist(), [0, 10])
+        t, v = store.range("temp", 20.0, 30.0)
+        self.assertEqual(len(t), 0)
+
+    def test_bounded_and_zero_copy(self):
+        store = TelemetryStore(capacity=4)
+        for i in range(10):
+            store.append("d", i, float(i))
+        t, v = store.view("d")
+        self.assertEqual(v.tolist(), [6, 7, 8, 9])
+        self.assertEqual(store["d"].total, 10)
+        self.assertTrue(np.shares_memory(v, store["d"].values._data))
+
+    def test_times_never_go_backwards(self):
+        store = TelemetryStore()
+        store.append("x", 1, 5.0)
+        store.append("x", 2, 4.0)
+        t, _ = store.view("x")
+        self.assertEqual(t.tolist(), [5.0, 5.0])
+
+    def test_latest_time(self):
+        store = TelemetryStore(capacity=4)
+        store.add_channel("temp")
+        self.assertEqual(store.latest_time("temp", -1.0), -1.0)
+        for i in range(10):
+            store.append("temp", float(i), 3.0 + i)
+        self.assertEqual(store.latest_time("temp"), 12.0)
+
+    def test_listeners_and_clock(self):
+        store = TelemetryStore(clock=lambda: 42.0)
+        seen = []
+        store.subscribe(lambda *s: seen.append(s))
+        store.append("panel", 60)
+        self.assertEqual(seen, [("panel", 60, 42.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()